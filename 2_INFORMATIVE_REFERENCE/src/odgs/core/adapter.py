@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
 class OdgsAdapter(ABC):
@@ -30,15 +30,31 @@ class GenericAdapter(OdgsAdapter):
     """
     A simple, dictionary-based adapter for testing and default behavior.
     Acts as a 'Mock' database.
+
+    Store keys are either compound criteria keys, as built by ``criteria_key``
+    (e.g. ``("NHG_MARKET_VALUE", (("house_type", "apartment"), ("zipcode", "1011AA")))``),
+    or the legacy ``"<context_id>:<id>"`` strings.
     """
-    def __init__(self, data_store: Dict[str, Any] = None):
+    def __init__(self, data_store: Dict[Any, Any] = None):
         self.store = data_store or {}
         self.logger = logging.getLogger("odgs.adapter")
 
+    @staticmethod
+    def criteria_key(context_id: str, criteria: Dict[str, Any]) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
+        """Order-independent, hashable key for a context_id + criteria combination."""
+        return (context_id, tuple(sorted(criteria.items())))
+
     def fetch_context(self, context_id: str, criteria: Dict[str, Any]) -> Dict[str, Any]:
-        self.logger.info(f"Fetching context: {context_id} with criteria: {criteria}")
+        self.logger.info("Fetching context: %s with criteria: %s", context_id, criteria)
         # Simple implementation: Look for exact match in store or return empty
         # In a real impl, this would query SQL/API
+        try:
+            result = self.store.get(self.criteria_key(context_id, criteria))
+        except TypeError:
+            # Unhashable criteria values cannot form a compound key
+            result = None
+        if result is not None:
+            return result
         key = f"{context_id}:{criteria.get('id', 'default')}"
         return self.store.get(key, {})
 
@@ -1,12 +1,126 @@
 from datetime import date, datetime
 import re
 import os
+import bisect
 import json
 import logging
-from typing import Optional, Dict, Any
+import threading
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 
 _audit_logger = logging.getLogger("sovereign_audit")
 
+# URN grammar: urn:odgs:<domain>:<id>[:<version>], version always v<digits> at the end
+_URN_PREFIX = "urn:odgs:"
+_URN_RE = re.compile(r"^urn:odgs:([a-z_]+):(.+?)(?::(v[0-9.]+))?$")
+_URN_HEAD_RE = re.compile(r"^urn:odgs:([a-z_]+):(.+)\Z")
+_URN_VERSION_RE = re.compile(r"v[0-9.]+")
+
+# (domain, id, version) — version is None for naked URNs
+_ParsedUrn = Tuple[str, str, Optional[str]]
+
+# Versioned sovereign files: <id>_v<YYYY>[.<MM>[.<DD>]].json
+_VERSION_RE = re.compile(r"_v(\d{4})(?:\.(\d{1,2}))?(?:\.(\d{1,2}))?\.json$")
+
+
+@lru_cache(maxsize=512)
+def _load_json_cached(path: str, mtime_ns: int) -> Any:
+    """Parses a JSON file once per (path, mtime). The result is shared — do not mutate."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _load_json(path: str) -> Any:
+    """Loads a JSON file through the mtime-keyed cache. Raises FileNotFoundError if absent."""
+    return _load_json_cached(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _scan_versioned_files(dirpath: str, mtime_ns: int) -> List[Tuple[date, str]]:
+    """Lists (version_date, filename) for a sovereign directory, newest first."""
+    candidates = []
+    with os.scandir(dirpath) as entries:
+        for entry in entries:
+            version_match = _VERSION_RE.search(entry.name)
+            if version_match:
+                year = int(version_match.group(1))
+                month = int(version_match.group(2) or 1)
+                day = int(version_match.group(3) or 1)
+                candidates.append((date(year, month, day), entry.name))
+    candidates.sort(key=lambda x: x[0], reverse=True)
+    return candidates
+
+
+@lru_cache(maxsize=256)
+def _version_timeline(dirpath: str, mtime_ns: int, prefix: str) -> Tuple[List[date], List[str]]:
+    """Parallel (dates, filenames) arrays, oldest first, for files starting with prefix."""
+    dates: List[date] = []
+    files: List[str] = []
+    # Reversing the newest-first listing keeps the original tie-break under bisect_right
+    for version_date, fname in reversed(_scan_versioned_files(dirpath, mtime_ns)):
+        if fname.startswith(prefix):
+            dates.append(version_date)
+            files.append(fname)
+    return dates, files
+
+
+# (effective_from, effective_until, context) — dates as written in the file
+_BindingWindow = Tuple[Optional[str], Optional[str], Dict[str, Any]]
+
+
+@lru_cache(maxsize=1024)
+def _iso_date(value: str) -> date:
+    """date.fromisoformat, once per distinct string. Raises ValueError if malformed."""
+    return date.fromisoformat(value)
+
+
+@lru_cache(maxsize=8)
+def _load_bindings_indexed_cached(path: str, mtime_ns: int) -> Dict[str, List[_BindingWindow]]:
+    """
+    Groups context bindings by context_id, keeping file order within each group.
+    Dates are parsed on lookup (see _iso_date), so a malformed window only
+    fails resolve_context for its own context.
+    """
+    index: Dict[str, List[_BindingWindow]] = {}
+    for ctx in _load_json_cached(path, mtime_ns).get("contexts", []):
+        index.setdefault(ctx["context_id"], []).append(
+            (ctx.get("effective_from"), ctx.get("effective_until"), ctx)
+        )
+    return index
+
+
+def _load_bindings_indexed(path: str) -> Dict[str, List[_BindingWindow]]:
+    """Returns the cached context-binding index. Raises FileNotFoundError if absent."""
+    return _load_bindings_indexed_cached(path, os.stat(path).st_mtime_ns)
+
+
+# Core schema files per domain, and the legacy id field each one is keyed by.
+_STANDARD_SCHEMAS = {
+    "metric": ("legislative/standard_metrics.json", "metric_id"),
+    "rule": ("judiciary/standard_data_rules.json", "rule_id"),
+    "dimension": ("legislative/standard_dq_dimensions.json", "id"),
+}
+
+
+@lru_cache(maxsize=32)
+def _load_indexed_schema_cached(path: str, mtime_ns: int, domain: str) -> Dict[str, Dict[str, Any]]:
+    """Builds a {urn: item} index over a core schema, including legacy-id URNs."""
+    id_field = _STANDARD_SCHEMAS[domain][1]
+    index: Dict[str, Dict[str, Any]] = {}
+    for item in _load_json_cached(path, mtime_ns):
+        # First item to claim a key wins, matching the old in-order scan
+        if item.get('urn'):
+            index.setdefault(item['urn'], item)
+        if item.get(id_field) is not None:
+            index.setdefault(_URN_PREFIX + domain + ":" + str(item[id_field]), item)
+    return index
+
+
+def _load_indexed_schema(path: str, domain: str) -> Dict[str, Dict[str, Any]]:
+    """Returns the cached URN index for a core schema. Raises FileNotFoundError if absent."""
+    return _load_indexed_schema_cached(path, os.stat(path).st_mtime_ns, domain)
+
+
 class LegalAmbiguityError(Exception):
     """Raised when a URN is resolved without a specific version or valid date."""
     pass
@@ -21,8 +135,36 @@ class SovereignResolver:
     Ensures that every URN resolution is legally deterministic.
     """
     
-    def __init__(self, data_root: str = "../1_NORMATIVE_SPECIFICATION/schemas"):
+    def __init__(self, data_root: str = "../1_NORMATIVE_SPECIFICATION/schemas", warm: bool = False):
+        """
+        Args:
+            data_root: Root of the schema tree (contains sovereign/, legislative/, ...).
+            warm: If True, pre-populate the directory and schema caches on a
+                background thread so the first resolve does not pay for the scan.
+        """
         self.data_root = data_root
+        self._sovereign_root = os.path.join(data_root, "sovereign")
+        self._warm_thread: Optional[threading.Thread] = None
+        if warm:
+            self._warm_thread = threading.Thread(target=self._warm, name="odgs-resolver-warm", daemon=True)
+            self._warm_thread.start()
+
+    def _warm(self) -> None:
+        """Scans every sovereign domain directory and indexes the core schemas."""
+        try:
+            with os.scandir(self._sovereign_root) as entries:
+                domains = [entry.name for entry in entries if entry.is_dir()]
+        except OSError:
+            domains = []
+        for domain in domains:
+            self._scan_sovereign_dir(domain)
+
+        for domain, (rel_path, _) in _STANDARD_SCHEMAS.items():
+            try:
+                _load_indexed_schema(os.path.join(self.data_root, rel_path), domain)
+            except (OSError, ValueError):
+                # Missing or malformed schemas surface on the real resolve instead
+                pass
 
     def resolve(self, urn: str, as_of_date: Optional[date] = None, force_latest: bool = False) -> Dict[str, Any]:
         """
@@ -34,7 +176,8 @@ class SovereignResolver:
             force_latest: If True, bypasses the date check and returns the latest version. DANGEROUS.
             
         Returns:
-            Dict: The resolved JSON object.
+            Dict: The resolved JSON object. Parsed files are cached process-wide,
+            so the returned object is shared and must be treated as read-only.
             
         Raises:
             LegalAmbiguityError: If URN is versionless and no date/force flag is provided.
@@ -43,7 +186,7 @@ class SovereignResolver:
         parsed = self._parse_urn(urn)
         
         # Case 1: Pinned Version (Safe)
-        if parsed['version']:
+        if parsed[2] is not None:
             return self._fetch_specific_version(parsed)
             
         # Case 2: Naked URN (Unsafe)
@@ -54,113 +197,111 @@ class SovereignResolver:
 
         if force_latest:
             _audit_logger.warning(
-                f"DANGEROUS: force_latest=True used for URN '{urn}'. "
-                "Legal determinism bypassed — this event is recorded."
+                "DANGEROUS: force_latest=True used for URN '%s'. "
+                "Legal determinism bypassed — this event is recorded.",
+                urn,
             )
 
         # Case 3: Time-Travel Resolution
         return self._resolve_by_date(parsed, as_of_date)
 
-    def _parse_urn(self, urn: str) -> Dict[str, str]:
-        """Parses URN into components.
+    def _parse_urn(self, urn: str) -> _ParsedUrn:
+        """Parses URN into (domain, id, version) components.
         
         Supports formats like:
           urn:odgs:metric:101
           urn:odgs:def:nl_gov:awb:art_1_3:v2024
           urn:odgs:rule:2001
         """
-        # First, try the extended sovereign format: urn:odgs:<domain>:<...segments...>:<version>
-        # Version is always v<digits> at the end.
-        match = re.match(
-            r"urn:odgs:(?P<domain>[a-z_]+):(?P<id>.+?)(?::(?P<version>v[0-9.]+))?$", 
-            urn
-        )
+        # Fast path: pinned URNs end in a v<digits> segment, so split it off without backtracking
+        head, _, tail = urn.rpartition(":")
+        if _URN_VERSION_RE.fullmatch(tail):
+            match = _URN_HEAD_RE.match(head)
+            if match:
+                return match.group(1), match.group(2), tail
+
+        match = _URN_RE.match(urn)
         if not match:
             raise ValueError(f"Invalid URN format: {urn}")
-        return match.groupdict()
+        return match.groups()
 
-    def _fetch_specific_version(self, parsed: Dict[str, str]) -> Dict[str, Any]:
+    def _fetch_specific_version(self, parsed: _ParsedUrn) -> Dict[str, Any]:
         """Fetches the exact file for a versioned URN."""
+        domain, urn_id, version = parsed
         # Implementation assumes a standard file path structure
         # lib/data/sovereign/<domain>/<id>_<version>.json
         # This is a placeholder for the actual storage logic.
         file_path = os.path.join(
-            self.data_root, 
-            "sovereign", # Assuming storage in sovereign dir
-            parsed['domain'], 
-            f"{parsed['id']}_{parsed['version']}.json"
-        ).replace(":", "_")
+            self._sovereign_root,
+            domain, 
+            f"{urn_id}_{version}.json".replace(":", "_")
+        )
         
-        if not os.path.exists(file_path):
+        try:
+            return _load_json(file_path)
+        except (FileNotFoundError, NotADirectoryError):
             # Check if it's a schema/meta definition (e.g. Metric 101)
             # which are currently single files.
             # Fallback to standard schemas for non-sovereign types.
             return self._fetch_standard_schema(parsed)
 
-        with open(file_path, 'r') as f:
-            return json.load(f)
-
-    def _resolve_by_date(self, parsed: Dict[str, str], target_date: Optional[date]) -> Dict[str, Any]:
+    def _resolve_by_date(self, parsed: _ParsedUrn, target_date: Optional[date]) -> Dict[str, Any]:
         """
         Finds the version effective on the given date.
         Scans the sovereign/<domain>/ directory for versioned files,
         sorts by version date, and selects the latest version ≤ target_date.
         """
-        sovereign_dir = os.path.join(
-            self.data_root, "sovereign", parsed['domain']
-        )
+        domain, urn_id, _ = parsed
+        sovereign_dir = os.path.join(self._sovereign_root, domain)
         
-        if not os.path.isdir(sovereign_dir):
+        prefix = urn_id.replace(":", "_")
+        timeline = self._scan_sovereign_dir(domain, prefix)
+        if timeline is None:
             # No versioned sovereign directory exists — fall back to standard schema
             _audit_logger.info(
-                f"No sovereign versioned directory for '{parsed['domain']}'. "
-                f"Falling back to standard schema."
+                "No sovereign versioned directory for '%s'. Falling back to standard schema.",
+                domain,
             )
             return self._fetch_standard_schema(parsed)
         
-        # Pattern: <id>_v<YYYY>.<MM>.json or <id>_v<YYYY>.json
-        prefix = parsed['id'].replace(":", "_")
-        candidates = []
+        dates, files = timeline
         
-        for fname in os.listdir(sovereign_dir):
-            if not fname.startswith(prefix) or not fname.endswith(".json"):
-                continue
-            # Extract version from filename
-            version_match = re.search(r"_v(\d{4})(?:\.(\d{1,2}))?(?:\.(\d{1,2}))?\.json$", fname)
-            if version_match:
-                year = int(version_match.group(1))
-                month = int(version_match.group(2) or 1)
-                day = int(version_match.group(3) or 1)
-                version_date = date(year, month, day)
-                candidates.append((version_date, fname))
-        
-        if not candidates:
+        if not dates:
             _audit_logger.info(
-                f"No versioned files found for '{parsed['id']}' in sovereign dir. "
-                f"Falling back to standard schema."
+                "No versioned files found for '%s' in sovereign dir. Falling back to standard schema.",
+                urn_id,
             )
             return self._fetch_standard_schema(parsed)
         
-        # Sort by date descending, filter to those ≤ target_date
-        candidates.sort(key=lambda x: x[0], reverse=True)
-        
+        # Dates are sorted ascending; the last one ≤ target_date is the effective version
         effective_date = target_date if target_date else date.today()
-        valid = [(d, f) for d, f in candidates if d <= effective_date]
+        idx = bisect.bisect_right(dates, effective_date) - 1
         
-        if not valid:
+        if idx < 0:
             raise ResourceNotFoundError(
-                f"No version of '{parsed['id']}' is effective on or before {effective_date}."
+                f"No version of '{urn_id}' is effective on or before {effective_date}."
             )
         
-        chosen_date, chosen_file = valid[0]
+        chosen_date, chosen_file = dates[idx], files[idx]
         _audit_logger.info(
-            f"Time-travel resolved '{parsed['id']}' to version dated {chosen_date} "
-            f"(requested: {effective_date})."
+            "Time-travel resolved '%s' to version dated %s (requested: %s).",
+            urn_id, chosen_date, effective_date,
         )
         
         filepath = os.path.join(sovereign_dir, chosen_file)
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        return _load_json(filepath)
+
+    def _scan_sovereign_dir(self, domain: str, prefix: str = "") -> Optional[Tuple[List[date], List[str]]]:
+        """
+        Returns the cached (dates, filenames) timeline of sovereign/<domain>/ files
+        starting with prefix, oldest first, or None if the directory does not exist.
+        """
+        sovereign_dir = os.path.join(self._sovereign_root, domain)
+        try:
+            mtime_ns = os.stat(sovereign_dir).st_mtime_ns
+            return _version_timeline(sovereign_dir, mtime_ns, prefix)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
 
     def resolve_context(self, context_id: str, as_of_date: Optional[date] = None) -> Optional[Dict[str, Any]]:
         """
@@ -168,71 +309,39 @@ class SovereignResolver:
         Returns the context that is effective for the given date.
         """
         bindings_path = os.path.join(self.data_root, "executive", "context_bindings.json")
-        if not os.path.exists(bindings_path):
+        try:
+            bindings = _load_bindings_indexed(bindings_path)
+        except FileNotFoundError:
             return None
         
-        with open(bindings_path, 'r') as f:
-            bindings = json.load(f)
-        
         check_date = as_of_date if as_of_date else date.today()
         
-        for ctx in bindings.get("contexts", []):
-            if ctx["context_id"] != context_id:
-                continue
-            
+        for eff_from, eff_until, ctx in bindings.get(context_id, ()):
             # Check temporal validity
-            eff_from = ctx.get("effective_from")
-            eff_until = ctx.get("effective_until")
-            
-            if eff_from:
-                from_date = date.fromisoformat(eff_from)
-                if check_date < from_date:
-                    continue
-            
-            if eff_until:
-                until_date = date.fromisoformat(eff_until)
-                if check_date > until_date:
-                    continue
-            
+            if eff_from and check_date < _iso_date(eff_from):
+                continue
+            if eff_until and check_date > _iso_date(eff_until):
+                continue
             return ctx
         
         return None
 
-    def _fetch_standard_schema(self, parsed: Dict[str, str]) -> Dict[str, Any]:
+    def _fetch_standard_schema(self, parsed: _ParsedUrn) -> Dict[str, Any]:
         """Fallback to fetching from the core schemas (Metrics, Rules, Dimensions)."""
-        domain_files = {
-            "metric": "legislative/standard_metrics.json",
-            "rule": "judiciary/standard_data_rules.json",
-            "dimension": "legislative/standard_dq_dimensions.json"
-        }
-        
-        if parsed['domain'] not in domain_files:
-             raise ResourceNotFoundError(f"Unknown domain: {parsed['domain']}")
+        domain, urn_id, _ = parsed
+        if domain not in _STANDARD_SCHEMAS:
+             raise ResourceNotFoundError(f"Unknown domain: {domain}")
              
-        path = os.path.join(self.data_root, domain_files[parsed['domain']])
+        path = os.path.join(self.data_root, _STANDARD_SCHEMAS[domain][0])
+        target_urn = _URN_PREFIX + domain + ":" + urn_id
         
         try:
-            with open(path, 'r') as f:
-                data = json.load(f)
-                
-            target_urn = f"urn:odgs:{parsed['domain']}:{parsed['id']}"
-            
-            for item in data:
-                # Check explicit URN field first
-                if item.get('urn') == target_urn:
-                    return item
-                # Fallback for metrics (keyed by metric_id)
-                if parsed['domain'] == 'metric' and str(item.get('metric_id')) == parsed['id']:
-                    return item
-                # Fallback for rules (keyed by rule_id)
-                if parsed['domain'] == 'rule' and str(item.get('rule_id')) == parsed['id']:
-                    return item
-                # Fallback for dimensions (keyed by id)
-                if parsed['domain'] == 'dimension' and str(item.get('id')) == parsed['id']:
-                    return item
-
+            item = _load_indexed_schema(path, domain).get(target_urn)
         except FileNotFoundError:
-            pass
+            item = None
+
+        if item is not None:
+            return item
             
-        raise ResourceNotFoundError(f"Could not find resource for URN: urn:odgs:{parsed['domain']}:{parsed['id']}")
+        raise ResourceNotFoundError(f"Could not find resource for URN: {target_urn}")
 
@@ -6,6 +6,7 @@ import logging
 import datetime
 import hashlib
 import uuid
+from collections import defaultdict
 from typing import Dict, List, Any
 try:
     from simpleeval import simple_eval, NameNotDefined
@@ -31,7 +32,8 @@ audit_logger = logging.getLogger("sovereign_audit")
 audit_logger.setLevel(logging.INFO)
 # Avoid adding duplicates
 if not audit_logger.handlers:
-    handler = logging.FileHandler(os.path.join(project_root, "sovereign_audit.log"))
+    # delay: the file is created on the first audit record, not on import
+    handler = logging.FileHandler(os.path.join(project_root, "sovereign_audit.log"), delay=True)
     handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
     audit_logger.addHandler(handler)
 
@@ -88,6 +90,7 @@ class OdgsInterceptor:
                 self.project_root = os.path.dirname(self.project_root)
 
         self.graph = self._load_from_plane("legislative", "ontology_graph.json")
+        self.edges_by_relationship = self._index_edges(self.graph)
         self.rules = self._load_rules()
         self.metrics = self._load_from_plane("legislative", "standard_metrics.json")
         self.bindings = self._load_from_plane("executive", "context_bindings.json")
@@ -99,11 +102,19 @@ class OdgsInterceptor:
         path = os.path.join(self.project_root, plane, filename)
         if not os.path.exists(path):
             # In a real scenario, this might crash, but for resilience we log error
-            print(f"CRITICAL: Sovereign Artifact missing: {path}")
+            print(f"CRITICAL: Sovereign Artifact missing: {path}", file=sys.stderr)
             return {}
         with open(path, 'r') as f:
             return json.load(f)
 
+    @staticmethod
+    def _index_edges(graph: Dict[str, Any]) -> Dict[str, List[Dict]]:
+        """Bucket the ontology edges by relationship, so a lookup walks only its own type."""
+        buckets = defaultdict(list)
+        for edge in graph.get("graph_edges", []) if graph else []:
+            buckets[edge.get("relationship", "")].append(edge)
+        return dict(buckets)
+
     def _load_rules(self) -> Dict[str, Dict]:
         """Load rules from Judiciary Plane and index them by URN."""
         rules_data = self._load_from_plane("judiciary", "standard_data_rules.json")
@@ -188,7 +199,8 @@ class OdgsInterceptor:
             input_hash = "HASH_ERROR_NON_SERIALIZABLE"
 
         # 2. SOVEREIGN HANDSHAKE — Validate Legislative Integrity
-        definition_hash_result = generate_project_hash(self.project_root)
+        # Never trust .odgs/hash.cache.json here: it is as writable as the schemas
+        definition_hash_result = generate_project_hash(self.project_root, use_cache=False)
         definition_hash = definition_hash_result["master_hash"]
 
         if required_integrity_hash:
@@ -217,11 +229,9 @@ class OdgsInterceptor:
         
         # B. Graph-based fallback: find BLOCKS_PROCESS edges targeting this process
         if not active_rules and self.graph:
-            edges = self.graph.get("graph_edges", [])
             blocking_urns = [
-                edge["source_urn"] for edge in edges
-                if edge.get("target_urn") == process_urn 
-                and edge.get("relationship") == "BLOCKS_PROCESS"
+                edge["source_urn"] for edge in self.edges_by_relationship.get("BLOCKS_PROCESS", [])
+                if edge.get("target_urn") == process_urn
             ]
             for rule_urn in blocking_urns:
                 if rule_urn in self.rules:
@@ -1,21 +1,38 @@
 import os
 import json
+import asyncio
+import time
 import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from functools import lru_cache
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet
 from datetime import datetime, timezone
-from pydantic import BaseModel, ValidationError
-from google import genai
-from google.genai import types
+from pydantic import BaseModel, TypeAdapter
 from odgs.core.models import SovereignDefinition
 
 from odgs.system.config import settings
+from odgs.system.json_io import write_json
+
+try:
+    import orjson  # optional accelerator: pip install odgs[fast]
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers below cover both
+_loads = orjson.loads if orjson is not None else json.loads
 
 # Wrapper for Structured Output
 class SovereignBundle(BaseModel):
     items: List[SovereignDefinition]
 
 
+# Serializes a whole bundle in one pydantic-core pass
+_BUNDLE_ADAPTER = TypeAdapter(List[SovereignDefinition])
+
+
 # ---------------------------------------------------------------------------
 # Context Loaders — feed ALL 5 planes to the AI
 # ---------------------------------------------------------------------------
@@ -26,7 +43,7 @@ def _load_standard_metrics_context() -> str:
     if not path.exists():
         return "No Standard Metrics found."
     try:
-        data = json.loads(path.read_text())
+        data = _loads(path.read_bytes())
         summary = [f"- {m['metric_id']}: {m['name']} ({m.get('domain','General')})" for m in data]
         return "\n".join(summary[:50])
     except (json.JSONDecodeError, KeyError, OSError) as e:
@@ -40,7 +57,7 @@ def _load_rules_context() -> str:
     if not path.exists():
         return ""
     try:
-        data = json.loads(path.read_text())
+        data = _loads(path.read_bytes())
         summary = [
             f"- {r['rule_id']}: {r['name']} [severity={r.get('severity','medium')}]"
             for r in data[:30]
@@ -56,7 +73,7 @@ def _load_dq_dimensions_context() -> str:
     if not path.exists():
         return ""
     try:
-        data = json.loads(path.read_text())
+        data = _loads(path.read_bytes())
         # Group by category for conciseness
         cats: Dict[str, int] = {}
         for d in data:
@@ -74,7 +91,7 @@ def _load_business_processes_context() -> str:
     if not path.exists():
         return ""
     try:
-        data = json.loads(path.read_text())
+        data = _loads(path.read_bytes())
         # Handle both list format and dict-with-lifecycles format
         if isinstance(data, list):
             lifecycles = data
@@ -95,44 +112,80 @@ def _load_business_processes_context() -> str:
         return ""
 
 
-def _build_metric_index() -> Dict[str, Dict[str, Any]]:
-    """Build a lookup index of all metrics for fuzzy matching."""
-    path = settings.PROJECT_ROOT / "1_NORMATIVE_SPECIFICATION" / "schemas" / "legislative" / "standard_metrics.json"
-    if not path.exists():
-        return {}
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> FrozenSet[str]:
+    """Lower-case word tokens, punctuation stripped."""
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
+
+# Posting-list entries are (file_rank, metric_id) so score ties resolve to file order.
+_MetricPostings = Dict[str, Tuple[Tuple[int, str], ...]]
+
+
+@lru_cache(maxsize=1)
+def _build_metric_index_cached(path: str, mtime_ns: int) -> Tuple[Dict[str, Dict[str, Any]], _MetricPostings]:
+    """Parse standard_metrics.json into a keyword index, once per file version."""
     try:
-        data = json.loads(path.read_text())
-        return {
+        with open(path, "rb") as f:
+            data = _loads(f.read())
+        metric_index = {
             m["metric_id"]: {
                 "name": m.get("name", ""),
                 "domain": m.get("domain", "General"),
-                "keywords": set(m.get("name", "").lower().split())
-                | set(m.get("domain", "").lower().split()),
+                "keywords": _tokenize(m.get("name", "")) | _tokenize(m.get("domain", "")),
             }
             for m in data
         }
     except (json.JSONDecodeError, KeyError, OSError):
-        return {}
+        return {}, {}
+
+    postings: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+    for rank, (mid, info) in enumerate(metric_index.items()):
+        for word in info["keywords"]:
+            postings[word].append((rank, mid))
+    return metric_index, {word: tuple(entries) for word, entries in postings.items()}
+
+
+def _build_metric_index() -> Tuple[Dict[str, Dict[str, Any]], _MetricPostings]:
+    """
+    Build a lookup index of all metrics for fuzzy matching (cached on file mtime).
+    Returns (metric_index, inverted) where inverted maps keyword -> postings.
+    """
+    path = settings.PROJECT_ROOT / "1_NORMATIVE_SPECIFICATION" / "schemas" / "legislative" / "standard_metrics.json"
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return {}, {}
+    return _build_metric_index_cached(str(path), mtime_ns)
 
 
-def _fuzzy_match_metric(text: str, metric_index: Dict[str, Dict]) -> Optional[str]:
-    """Find the best-matching metric URN for a given text using token overlap."""
-    if not metric_index:
+def _fuzzy_match_metric(words: FrozenSet[str], inverted: _MetricPostings) -> Optional[str]:
+    """Find the best-matching metric URN for a tokenized text using token overlap."""
+    if not inverted:
+        return None
+    scores: Counter = Counter()
+    for word in words:
+        scores.update(inverted.get(word, ()))
+    if not scores:
         return None
-    words = set(text.lower().split())
-    best_id, best_score = None, 0
-    for mid, info in metric_index.items():
-        score = len(words & info["keywords"])
-        if score > best_score:
-            best_score = score
-            best_id = mid
-    return f"urn:odgs:metric:{best_id}" if best_id and best_score > 0 else None
+    (_, best_id), _ = max(scores.items(), key=lambda kv: (kv[1], -kv[0][0]))
+    return f"urn:odgs:metric:{best_id}"
 
 
 # ---------------------------------------------------------------------------
 # Post-Generation Enrichment
 # ---------------------------------------------------------------------------
 
+# Below this many items, thread start-up costs more than hashing inline.
+_PARALLEL_HASH_THRESHOLD = 64
+
+
+def _sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
 def _enrich_bundle(items: List[SovereignDefinition]) -> List[SovereignDefinition]:
     """
     Post-generation enrichment pass:
@@ -140,24 +193,35 @@ def _enrich_bundle(items: List[SovereignDefinition]) -> List[SovereignDefinition
     2. Fuzzy-match to closest metric URN if relations are empty
     3. Set harvested_at timestamp
     """
-    metric_index = _build_metric_index()
+    _, inverted = _build_metric_index()
     enriched = []
 
-    for item in items:
-        # 1. Content hash
-        text = item.content.verbatim_text or ""
-        if text and not item.metadata.content_hash:
-            item.metadata.content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    # 1. Content hash — hashlib releases the GIL, so large bundles hash in parallel
+    to_hash = [
+        item for item in items
+        if item.content.verbatim_text and not item.metadata.content_hash
+    ]
+    payloads = [item.content.verbatim_text.encode("utf-8") for item in to_hash]
+    if len(payloads) >= _PARALLEL_HASH_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            digests = list(pool.map(_sha256_hex, payloads))
+    else:
+        digests = [_sha256_hex(p) for p in payloads]
+    for item, digest in zip(to_hash, digests):
+        item.metadata.content_hash = digest
+
+    # 2. Timestamp — one instant for the whole bundle
+    now = datetime.now(timezone.utc)
 
-        # 2. Timestamp
-        item.metadata.harvested_at = datetime.now(timezone.utc)
+    for item in items:
+        item.metadata.harvested_at = now
 
         # 3. Fuzzy metric linking (fill missing relations)
         if not item.relations:
-            match = _fuzzy_match_metric(
-                f"{item.content.verbatim_text} {item.interpretation.summary if item.interpretation else ''}",
-                metric_index,
+            words = _tokenize(
+                f"{item.content.verbatim_text} {item.interpretation.summary if item.interpretation else ''}"
             )
+            match = _fuzzy_match_metric(words, inverted)
             if match:
                 from odgs.core.models import SovereignRelation, RelationType
                 item.relations.append(
@@ -169,17 +233,21 @@ def _enrich_bundle(items: List[SovereignDefinition]) -> List[SovereignDefinition
     return enriched
 
 
+# Per-file prefix fed to the chat model as context
+_FILE_CONTEXT_CHARS = 3000
+
+
 def _load_file_contents(files: List[str]) -> str:
     """Load multiple files and concatenate their contents for context."""
     context_parts = []
     for fpath in files:
-        if os.path.exists(fpath):
-            try:
-                with open(fpath, "r") as f:
-                    content = f.read()
-                context_parts.append(f"--- FILE: {os.path.basename(fpath)} ---\n{content[:3000]}")
-            except Exception:
-                pass
+        try:
+            # Text-mode read(n) counts characters, so only the prefix we keep is read
+            with open(fpath, "r", encoding="utf-8", errors="replace") as f:
+                content = f.read(_FILE_CONTEXT_CHARS)
+        except OSError:
+            continue
+        context_parts.append(f"--- FILE: {os.path.basename(fpath)} ---\n{content}")
     return "\n\n".join(context_parts) if context_parts else "No context files available."
 
 
@@ -187,31 +255,24 @@ def _load_file_contents(files: List[str]) -> str:
 # Core Generation Function
 # ---------------------------------------------------------------------------
 
-def generate_bundle(industry: str, api_key: str = None) -> List[SovereignDefinition]:
-    """
-    Generates a list of Sovereign Definitions for a specific industry.
-    Uses Google Gemini with strict Pydantic schema enforcement.
-    Includes post-generation enrichment (content_hash, metric linking).
-    """
-    print(f"🏭 ODGS FACTORY: Synthesizing Governance Bundle for '{industry}'...")
-
-    # Resolve API Key (Argument > Env/Config)
-    final_key = api_key or settings.GEMINI_API_KEY
-    if not final_key:
-        print("❌ Error: No API Key provided.")
-        return []
+def _load_planes_context() -> Tuple[str, str, str, str]:
+    """(metrics, rules, dq, process) context — independent file reads, so run them concurrently."""
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [
+            pool.submit(loader)
+            for loader in (
+                _load_standard_metrics_context,
+                _load_rules_context,
+                _load_dq_dimensions_context,
+                _load_business_processes_context,
+            )
+        ]
+        return tuple(f.result() for f in futures)
 
-    try:
-        client = genai.Client(api_key=final_key)
-    except Exception as e:
-        print(f"❌ Error initializing Gemini Client: {e}")
-        return []
 
-    # Load context from ALL 5 planes
-    metrics_context = _load_standard_metrics_context()
-    rules_context = _load_rules_context()
-    dq_context = _load_dq_dimensions_context()
-    process_context = _load_business_processes_context()
+def _generation_request(industry: str, planes_context: Tuple[str, str, str, str], types) -> Dict[str, Any]:
+    """Keyword arguments for models.generate_content (sync or aio) for one industry."""
+    metrics_context, rules_context, dq_context, process_context = planes_context
 
     # System Prompt: The Chief Data Officer Persona (v2 — all-planes)
     system_prompt = f"""You are the Chief Data Officer for the '{industry}' sector.
@@ -258,36 +319,37 @@ CONSTRAINTS:
 - Content format must be "TEXT".
 """
 
-    print(f"🤖 Prompting {settings.GEMINI_MODEL_NAME} with all-planes context...")
-
-    try:
-        response = client.models.generate_content(
-            model=settings.GEMINI_MODEL_NAME,
-            contents=f"Generate the Sovereign Data Governance bundle for {industry}. Produce at least 15 rich, detailed definitions.",
-            config=types.GenerateContentConfig(
-                system_instruction=system_prompt,
-                response_mime_type="application/json",
-                response_schema=SovereignBundle
-            )
+    return dict(
+        model=settings.GEMINI_MODEL_NAME,
+        contents=f"Generate the Sovereign Data Governance bundle for {industry}. Produce at least 15 rich, detailed definitions.",
+        config=types.GenerateContentConfig(
+            system_instruction=system_prompt,
+            response_mime_type="application/json",
+            response_schema=SovereignBundle
         )
-    except Exception as e:
-         print(f"❌ Generation Error: {e}")
-         return []
+    )
 
-    if unused := response.parsed:
+
+def _bundle_from_response(response, parse_text: bool = False) -> List[SovereignDefinition]:
+    """
+    Enriched definitions from a structured-output response, or [] if nothing parsed.
+    parse_text=True validates response.text when response.parsed is empty; only
+    batch results need it, since the SDK parses just its own generate_content calls.
+    """
+    unused = response.parsed
+    if unused is None and parse_text and response.text:
+        try:
+            unused = SovereignBundle.model_validate_json(response.text)
+        except ValueError as e:
+            print(f"⚠️ Output failed schema validation: {e}")
+            return []
+    if unused:
         bundle = unused
         print(f"✨ Raw Output: {len(bundle.items)} items generated.")
 
         # Post-Processing: Enrichment
-        enriched_items = _enrich_bundle(bundle.items)
-
-        # Validation
-        valid_items = []
-        for item in enriched_items:
-            try:
-                valid_items.append(item)
-            except ValidationError as e:
-                print(f"⚠️ Validation Failed for item: {e}")
+        # Items are already validated SovereignDefinition instances from response.parsed
+        valid_items = _enrich_bundle(bundle.items)
 
         print(f"✅ Validated & Enriched: {len(valid_items)} Sovereign Definitions ready.")
         return valid_items
@@ -296,6 +358,157 @@ CONSTRAINTS:
     return []
 
 
+def _gemini_client(api_key: Optional[str]):
+    """(client, types) for the resolved key, or None after printing why not."""
+    # Resolve API Key (Argument > Env/Config)
+    final_key = api_key or settings.GEMINI_API_KEY
+    if not final_key:
+        print("❌ Error: No API Key provided.")
+        return None
+
+    try:
+        # Imported here so offline helpers (enrichment, write_bundle) don't pull in the SDK
+        from google import genai
+        from google.genai import types
+        return genai.Client(api_key=final_key), types
+    except Exception as e:
+        print(f"❌ Error initializing Gemini Client: {e}")
+        return None
+
+
+def generate_bundle(industry: str, api_key: str = None) -> List[SovereignDefinition]:
+    """
+    Generates a list of Sovereign Definitions for a specific industry.
+    Uses Google Gemini with strict Pydantic schema enforcement.
+    Includes post-generation enrichment (content_hash, metric linking).
+    """
+    print(f"🏭 ODGS FACTORY: Synthesizing Governance Bundle for '{industry}'...")
+
+    resolved = _gemini_client(api_key)
+    if resolved is None:
+        return []
+    client, types = resolved
+
+    # Load context from ALL 5 planes
+    request = _generation_request(industry, _load_planes_context(), types)
+
+    print(f"🤖 Prompting {settings.GEMINI_MODEL_NAME} with all-planes context...")
+
+    try:
+        response = client.models.generate_content(**request)
+    except Exception as e:
+         print(f"❌ Generation Error: {e}")
+         return []
+
+    return _bundle_from_response(response)
+
+
+async def _generate_bundle_async(industry: str, client, request: Dict[str, Any]) -> List[SovereignDefinition]:
+    """generate_bundle's network step on the SDK's asyncio client."""
+    try:
+        response = await client.aio.models.generate_content(**request)
+    except Exception as e:
+        print(f"❌ Generation Error ({industry}): {e}")
+        return []
+    return _bundle_from_response(response)
+
+
+async def agenerate_bundles(industries: List[str], api_key: str = None) -> Dict[str, List[SovereignDefinition]]:
+    """
+    generate_bundle for several industries with the Gemini calls in flight together,
+    so the run takes about as long as the slowest call rather than the sum.
+    Returns industry -> definitions ([] for a failed industry). Await this from
+    code that already runs an event loop (API server, notebooks).
+    """
+    print(f"🏭 ODGS FACTORY: Synthesizing {len(industries)} Governance Bundles concurrently...")
+
+    resolved = _gemini_client(api_key)
+    if resolved is None:
+        return {industry: [] for industry in industries}
+    client, types = resolved
+
+    # The planes context is industry-independent: load it once for every prompt
+    planes_context = _load_planes_context()
+    requests = [_generation_request(industry, planes_context, types) for industry in industries]
+
+    print(f"🤖 Prompting {settings.GEMINI_MODEL_NAME} with all-planes context...")
+
+    bundles = await asyncio.gather(*(
+        _generate_bundle_async(industry, client, request)
+        for industry, request in zip(industries, requests)
+    ))
+    return dict(zip(industries, bundles))
+
+
+def generate_bundles(industries: List[str], api_key: str = None) -> Dict[str, List[SovereignDefinition]]:
+    """Synchronous agenerate_bundles, for callers without a running event loop (the CLI)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(agenerate_bundles(industries, api_key))
+    raise RuntimeError("generate_bundles() cannot run inside an event loop; use `await agenerate_bundles(...)` instead.")
+
+
+# Batch jobs are queued server-side and may take minutes to hours
+_BATCH_POLL_SECONDS = 5
+_BATCH_MAX_POLL_SECONDS = 60
+_BATCH_DONE_STATES = frozenset({
+    "JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED",
+    "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED",
+})
+
+
+def generate_bundles_batch(industries: List[str], api_key: str = None) -> Dict[str, List[SovereignDefinition]]:
+    """
+    generate_bundles through the Gemini Batch API: every industry's prompt goes in
+    one batch job (a single submission, billed at the batch rate), which is polled
+    with backoff until it finishes. Returns industry -> definitions ([] for a failed
+    industry). For one interactive industry, generate_bundle is faster.
+    """
+    print(f"🏭 ODGS FACTORY: Submitting {len(industries)} Governance Bundles as one batch job...")
+
+    resolved = _gemini_client(api_key)
+    if resolved is None:
+        return {industry: [] for industry in industries}
+    client, types = resolved
+
+    planes_context = _load_planes_context()
+    requests = [_generation_request(industry, planes_context, types) for industry in industries]
+
+    try:
+        job = client.batches.create(
+            model=settings.GEMINI_MODEL_NAME,
+            src=[types.InlinedRequest(contents=r["contents"], config=r["config"]) for r in requests],
+            config=types.CreateBatchJobConfig(display_name=f"odgs-factory-{len(industries)}-bundles"),
+        )
+        print(f"📨 Batch job {job.name} submitted; waiting for completion...")
+
+        delay = _BATCH_POLL_SECONDS
+        while job.state is None or job.state.name not in _BATCH_DONE_STATES:
+            time.sleep(delay)
+            delay = min(delay * 2, _BATCH_MAX_POLL_SECONDS)
+            job = client.batches.get(name=job.name)
+    except Exception as e:
+        print(f"❌ Batch Error: {e}")
+        return {industry: [] for industry in industries}
+
+    if job.state.name not in ("JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED"):
+        print(f"❌ Batch job {job.name} ended in {job.state.name}: {job.error}")
+        return {industry: [] for industry in industries}
+
+    # Inlined responses come back in request order
+    responses = (job.dest.inlined_responses if job.dest else None) or []
+    results = {}
+    for i, industry in enumerate(industries):
+        inlined = responses[i] if i < len(responses) else None
+        if inlined is None or inlined.error or inlined.response is None:
+            print(f"❌ Generation Error ({industry}): {inlined.error if inlined else 'no response'}")
+            results[industry] = []
+            continue
+        results[industry] = _bundle_from_response(inlined.response, parse_text=True)
+    return results
+
+
 # ---------------------------------------------------------------------------
 # API-facing functions (used by odgs.system.api)
 # ---------------------------------------------------------------------------
@@ -314,7 +527,7 @@ def generate_with_gemini(industry: str, api_key: str) -> Optional[Dict[str, Any]
         return None
 
     # Convert SovereignDefinition Pydantic models to dicts
-    definitions = [item.model_dump(mode="json") for item in items]
+    definitions = _BUNDLE_ADAPTER.dump_python(items, mode="json")
 
     return {
         "definitions": definitions,
@@ -340,31 +553,29 @@ def write_bundle(data: Dict[str, Any], output_dir: str) -> None:
 
     # Write definitions
     defs_path = os.path.join(output_dir, "definitions.json")
-    with open(defs_path, "w") as f:
-        json.dump(definitions, f, indent=2, ensure_ascii=False)
+    write_json(defs_path, definitions, ensure_ascii=False)
     print(f"  💾 Saved {len(definitions)} definitions → {defs_path}")
 
     # Write metadata
     meta_path = os.path.join(output_dir, "bundle_metadata.json")
-    with open(meta_path, "w") as f:
-        json.dump(metadata, f, indent=2)
+    write_json(meta_path, metadata)
     print(f"  💾 Saved metadata → {meta_path}")
 
     # Generate ontology graph from the definitions
-    edges = []
-    for defn in definitions:
-        for rel in defn.get("relations", []):
-            edges.append({
-                "source": defn.get("urn", ""),
-                "target": rel.get("target_urn", ""),
-                "relation": rel.get("type", "isDefinedBy"),
-                "provenance": "AI_SYNTHETIC"
-            })
+    edges = [
+        {
+            "source": defn.get("urn", ""),
+            "target": rel.get("target_urn", ""),
+            "relation": rel.get("type", "isDefinedBy"),
+            "provenance": "AI_SYNTHETIC"
+        }
+        for defn in definitions
+        for rel in defn.get("relations", ())
+    ]
 
     if edges:
         graph_path = os.path.join(output_dir, "ontology_graph.json")
-        with open(graph_path, "w") as f:
-            json.dump({"edges": edges}, f, indent=2)
+        write_json(graph_path, {"edges": edges})
         print(f"  💾 Saved ontology graph ({len(edges)} edges) → {graph_path}")
 
     print(f"  📁 Bundle written to: {output_dir}")
@@ -379,6 +590,8 @@ def run_agent_chat(prompt: str, files: List[str], api_key: str) -> str:
         return "❌ Error: No API key provided. Set GEMINI_API_KEY in your environment."
 
     try:
+        from google import genai
+        from google.genai import types
         client = genai.Client(api_key=api_key)
     except Exception as e:
         return f"❌ Failed to initialize Gemini: {e}"
@@ -1,8 +1,43 @@
 from ..core import BaseHarvester, HarvesterException
 import urllib.request
 import ssl
+import copy
 import json
-from typing import Dict, Any, List
+import logging
+import os
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, ClassVar, Optional, Tuple
+
+try:
+    import requests  # optional: pip install odgs[harvest]
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+logger = logging.getLogger(__name__)
+
+# Prefix of every URN minted for FIBO concepts and relation targets
+_FIBO_URN_PREFIX = "urn:odgs:def:fibo:"
+
+
+def _build_session() -> Optional["requests.Session"]:
+    """Keep-alive HTTPS session shared by all FIBO harvests, or None without requests."""
+    if requests is None:
+        return None
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return session
+
+
+@lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """Process-wide TLS context for the urllib fallback (loading the CA bundle is slow)."""
+    return ssl.create_default_context()
+
 
 class FIBOHarvester(BaseHarvester):
     """
@@ -78,19 +113,118 @@ class FIBOHarvester(BaseHarvester):
     # Fallback module when the concept is not in the routing table
     DEFAULT_MODULE = "FND/Accounting/CurrencyAmount"
 
+    # Case-folded view of the routing table, built once at class creation
+    _LOWER_INDEX: ClassVar[Dict[str, Dict[str, Any]]] = {
+        name.lower(): info for name, info in FIBO_MODULES.items()
+    }
+
+    # Column-wise copy of the routing table (parallel tuples, one row per concept)
+    _CONCEPT_NAMES: ClassVar[Tuple[str, ...]] = tuple(FIBO_MODULES)
+    _MODULE_PATHS: ClassVar[Tuple[str, ...]] = tuple(info["module"] for info in FIBO_MODULES.values())
+    _DESCRIPTIONS: ClassVar[Tuple[str, ...]] = tuple(info["description"] for info in FIBO_MODULES.values())
+    _SOURCE_URLS: ClassVar[Tuple[str, ...]] = tuple(info["source_url"] for info in FIBO_MODULES.values())
+    _IDX_BY_NAME: ClassVar[Dict[str, int]] = {name: i for i, name in enumerate(_CONCEPT_NAMES)}
+
+    # Class-level so every harvest reuses pooled TLS connections to spec.edmcouncil.org
+    _SESSION: ClassVar[Optional["requests.Session"]] = _build_session()
+
+    # On-disk module cache shared across runs; set CACHE_DIR = None to disable
+    CACHE_DIR: ClassVar[Optional[str]] = os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "odgs", "fibo"
+    )
+    # "master/latest" moves, so disk entries expire after a day
+    CACHE_TTL_SECONDS: ClassVar[int] = 24 * 60 * 60
+
+    # Per-URL locks so concurrent harvests of one module download it once
+    _MODULE_LOCKS: ClassVar[Dict[str, threading.Lock]] = {}
+    _MODULE_LOCKS_GUARD: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def _download(cls, url: str) -> bytes:
+        """GET a JSON-LD document, via the shared session when available."""
+        if cls._SESSION is not None:
+            response = cls._SESSION.get(url, timeout=30)
+            response.raise_for_status()
+            return response.content
+        with urllib.request.urlopen(url, context=_ssl_context(), timeout=30) as response:
+            return response.read()
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _fetch_module(cls, url: str) -> bytes:
+        """
+        Raw JSON-LD bytes for a module URL, memoized in RAM and on disk.
+        Several concepts share a module, so N harvests cost one download per module.
+        """
+        cache_path = None
+        if cls.CACHE_DIR:
+            cache_path = os.path.join(cls.CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".jsonld")
+            try:
+                if time.time() - os.stat(cache_path).st_mtime < cls.CACHE_TTL_SECONDS:
+                    with open(cache_path, "rb") as f:
+                        return f.read()
+            except OSError:
+                pass
+
+        payload = cls._download(url)
+
+        if cache_path:
+            try:
+                os.makedirs(cls.CACHE_DIR, exist_ok=True)
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                # The disk layer is best-effort; the in-memory cache still applies
+                pass
+        return payload
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _load_module(cls, url: str) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        Parsed @graph of a module plus an index of its nodes by local name
+        (the @id segment after the last '/' or ':'). Shared — do not mutate.
+        """
+        data = json.loads(cls._fetch_module(url))
+        # The JSON-LD is usually a list of objects or a @graph
+        graph = data.get("@graph", data) if isinstance(data, dict) else data
+
+        index: Dict[str, Dict[str, Any]] = {}
+        for node in graph:
+            node_id = node.get("@id", "")
+            for sep in ("/", ":"):
+                _, found, local_name = node_id.rpartition(sep)
+                if found:
+                    # First node in graph order wins, as with the old linear search
+                    index.setdefault(local_name, node)
+        return graph, index
+
+    @classmethod
+    def _get_module(cls, url: str) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """_load_module, with concurrent cache misses on one URL coalesced."""
+        with cls._MODULE_LOCKS_GUARD:
+            lock = cls._MODULE_LOCKS.setdefault(url, threading.Lock())
+        with lock:
+            return cls._load_module(url)
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # Finished definitions by reference_id; handed out as deep copies
+        self._harvest_cache: Dict[str, Dict[str, Any]] = {}
+
     def _resolve_module_url(self, reference_id: str) -> str:
         """Resolve the JSONLD URL for a given concept using the routing table."""
-        if reference_id in self.FIBO_MODULES:
-            module_path = self.FIBO_MODULES[reference_id]["module"]
+        # Exact match first, then case insensitive
+        info = self.FIBO_MODULES.get(reference_id)
+        if info is None:
+            info = self._LOWER_INDEX.get(reference_id.lower())
+        if info is not None:
+            module_path = info["module"]
         else:
-            # Try to find a partial match (case insensitive)
-            for concept_name, info in self.FIBO_MODULES.items():
-                if concept_name.lower() == reference_id.lower():
-                    module_path = info["module"]
-                    break
-            else:
-                print(f"  ⚠ Concept '{reference_id}' not in routing table. Trying default module: {self.DEFAULT_MODULE}")
-                module_path = self.DEFAULT_MODULE
+            logger.warning("Concept '%s' not in routing table. Trying default module: %s", reference_id, self.DEFAULT_MODULE)
+            module_path = self.DEFAULT_MODULE
         
         return self.BASE_URL_TEMPLATE.format(module=module_path)
 
@@ -100,11 +234,13 @@ class FIBOHarvester(BaseHarvester):
         return [
             {
                 "concept": name,
-                "module": info["module"],
-                "description": info["description"],
-                "source_url": info["source_url"]
+                "module": module,
+                "description": description,
+                "source_url": source_url
             }
-            for name, info in cls.FIBO_MODULES.items()
+            for name, module, description, source_url in zip(
+                cls._CONCEPT_NAMES, cls._MODULE_PATHS, cls._DESCRIPTIONS, cls._SOURCE_URLS
+            )
         ]
 
     def harvest(self, reference_id: str) -> Dict[str, Any]:
@@ -121,28 +257,52 @@ class FIBOHarvester(BaseHarvester):
         Returns:
             Dict: SovereignDefinition
         """
+        cached = self._harvest_cache.get(reference_id)
+        if cached is None:
+            cached = self._harvest_cache[reference_id] = self._build_definition(reference_id)
+        # Callers (e.g. save()) mutate the result, and structured_data points into
+        # the shared module graph, so never hand out the cached dict itself
+        return copy.deepcopy(cached)
+
+    def harvest_many(self, reference_ids: List[str], max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        Harvests several Concepts concurrently over the shared session.
+
+        Args:
+            reference_ids: Concept Names to harvest
+            max_workers: Upper bound on parallel fetches
+
+        Returns:
+            Dict: reference_id -> SovereignDefinition, in input order.
+            The first HarvesterException raised is propagated.
+        """
+        unique_ids = list(dict.fromkeys(reference_ids))
+        if not unique_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+            futures = {rid: executor.submit(self.harvest, rid) for rid in unique_ids}
+            return {rid: future.result() for rid, future in futures.items()}
+
+    def _build_definition(self, reference_id: str) -> Dict[str, Any]:
+        """Fetch, locate and map one concept; the uncached body of harvest()."""
         url = self._resolve_module_url(reference_id)
-        print(f"  🌐 Fetching FIBO JSON-LD from {url}...")
+        logger.debug("Fetching FIBO JSON-LD from %s", url)
         
         try:
-            ssl_ctx = ssl.create_default_context()
-            with urllib.request.urlopen(url, context=ssl_ctx, timeout=30) as response:
-                data = json.load(response)
+            graph, index = self._get_module(url)
         except Exception as e:
             raise HarvesterException(f"Failed to fetch FIBO JSON-LD from {url}: {e}")
 
-        # The JSON-LD is usually a list of objects or a @graph
-        graph = data.get("@graph", data) if isinstance(data, dict) else data
-        
         target_node = None
-        target_id_suffix = f"/{reference_id}"
-        
-        # Search for the concept in the graph
-        for node in graph:
-            node_id = node.get("@id", "")
-            if node_id.endswith(target_id_suffix) or node_id.endswith(f":{reference_id}"):
-                target_node = node
-                break
+        if "/" not in reference_id and ":" not in reference_id:
+            target_node = index.get(reference_id)
+        else:
+            # Compound ids can't be keyed by local name; search the graph
+            suffixes = ("/" + reference_id, ":" + reference_id)
+            for node in graph:
+                if node.get("@id", "").endswith(suffixes):
+                    target_node = node
+                    break
         
         if target_node is None:
             raise HarvesterException(
@@ -159,7 +319,7 @@ class FIBOHarvester(BaseHarvester):
         )
         
         if not definition_text:
-            print(f"  ⚠ No definition text found for {reference_id}. Using ID as verbatim text.")
+            logger.warning("No definition text found for %s. Using ID as verbatim text.", reference_id)
             definition_text = f"Concept: {reference_id} ({target_node.get('@id')})"
         
         if isinstance(definition_text, list):
@@ -178,17 +338,18 @@ class FIBOHarvester(BaseHarvester):
                 for sc in sub_class:
                     if isinstance(sc, dict) and "@id" in sc:
                         target_uri = sc["@id"]
-                        term = target_uri.split("/")[-1].split(":")[-1]
+                        term = target_uri.rpartition("/")[2].rpartition(":")[2]
                         relations.append({
                             "type": "subClassOf",
-                            "target_urn": f"urn:odgs:def:fibo:{term.lower()}"
+                            "target_urn": _FIBO_URN_PREFIX + term.lower()
                         })
 
         # Construct SovereignDefinition
-        urn = f"urn:odgs:def:fibo:{reference_id.lower()}:v2024"
+        urn = _FIBO_URN_PREFIX + reference_id.lower() + ":v2024"
         
         # Resolve module info for metadata
-        module_info = self.FIBO_MODULES.get(reference_id, {})
+        idx = self._IDX_BY_NAME.get(reference_id)
+        module_path = self._MODULE_PATHS[idx] if idx is not None else self.DEFAULT_MODULE
         
         definition = {
             "urn": urn,
@@ -197,7 +358,7 @@ class FIBOHarvester(BaseHarvester):
                 "authority_name": "Financial Industry Business Ontology",
                 "document_ref": "FIBO Master",
                 "source_uri": target_node.get("@id"),
-                "module": module_info.get("module", self.DEFAULT_MODULE),
+                "module": module_path,
                 "hierarchy": {
                     "level": "concept",
                     "local_id": reference_id
@@ -208,7 +369,7 @@ class FIBOHarvester(BaseHarvester):
                 "verbatim_text": definition_text,
                 "language": "en-US",
                 "format": "JSON_LD",
-                "structured_data": target_node 
+                "structured_data": target_node
             },
             "interpretation": {
                 "summary": f"FIBO definition of {reference_id}",
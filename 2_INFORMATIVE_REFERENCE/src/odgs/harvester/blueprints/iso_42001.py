@@ -19,10 +19,9 @@ Status: SPEC / MOCK — ISO 42001 does not have a public machine-readable endpoi
 from __future__ import annotations
 import json
 import ssl
-import hashlib
 import urllib.request
 from typing import Dict, Any
-from ..core import BaseHarvester, HarvesterException
+from ..core import BaseHarvester, HarvesterException, compute_content_hash
 
 
 # ── Harvester Registry — the "Self-Describing" config ─────────────────────────
@@ -171,7 +170,7 @@ class ISO42001Harvester(BaseHarvester):
 
         clause = ISO_42001_CLAUSES[clause_key]
         verbatim = f"Clause {clause_key}: {clause['title']}\n\n{clause['verbatim']}"
-        content_hash = hashlib.sha256(verbatim.encode("utf-8")).hexdigest()
+        content_hash = compute_content_hash(verbatim)
 
         # Normalise clause ID for URN (6.1 -> 42001_6_1)
         clause_urn_id = f"42001_{clause_key.replace('.', '_')}"
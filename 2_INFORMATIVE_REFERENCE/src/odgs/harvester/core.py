@@ -1,9 +1,19 @@
-import json
 import hashlib
 import os
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, Optional, Union
+from datetime import datetime, timezone
+
+from odgs.system.json_io import write_json
+
+def compute_content_hash(text: Union[str, bytes]) -> str:
+    """
+    SHA-256 hex digest of a verbatim_text (UTF-8), the content_hash contract
+    in SovereignMetadata. Pre-encoded bytes are hashed without a copy.
+    """
+    if isinstance(text, str):
+        text = text.encode('utf-8')
+    return hashlib.sha256(text).hexdigest()
 
 class HarvesterException(Exception):
     """Base exception for harvesting errors."""
@@ -49,9 +59,8 @@ class BaseHarvester(ABC):
         if not text:
             raise HarvesterException("Invalid Definition: Missing 'verbatim_text'.")
             
-        content_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
-        definition["metadata"]["content_hash"] = content_hash
-        definition["metadata"]["harvested_at"] = datetime.utcnow().isoformat() + "Z"
+        definition["metadata"]["content_hash"] = compute_content_hash(text)
+        definition["metadata"]["harvested_at"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
         # 3. Construct Filename
         # urn:odgs:def:nl_gov:awb:art_1_3 -> nl_gov/awb/art_1_3.json ? 
@@ -71,7 +80,7 @@ class BaseHarvester(ABC):
         
         save_path = os.path.join(save_dir, filename)
         
-        with open(save_path, 'w') as f:
-            json.dump(definition, f, indent=2)
+        # structured_data can carry a whole ontology node; write_json uses orjson when it matches
+        write_json(save_path, definition)
             
         return save_path
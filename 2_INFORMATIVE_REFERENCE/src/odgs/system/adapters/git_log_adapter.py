@@ -1,22 +1,42 @@
 import os
 import json
-import datetime
+import time
 import uuid
-from typing import Dict, Any
+import atexit
+import threading
+import weakref
+from typing import Dict, Any, List, Optional
 import logging
 
-try:
-    import git
-    HAS_GIT_PYTHON = True
-except ImportError:
-    HAS_GIT_PYTHON = False
+import importlib.util
+
+# GitPython is imported on first commit (see GitAuditLogger._ensure_repo); its import is slow
+HAS_GIT_PYTHON = importlib.util.find_spec("git") is not None
+
+# Loggers to flush at exit; weak, so a discarded logger can still be collected
+_live_loggers: "weakref.WeakSet[GitAuditLogger]" = weakref.WeakSet()
+
+def _flush_live_loggers() -> None:
+    for git_logger in list(_live_loggers):
+        git_logger.flush()
+
+atexit.register(_flush_live_loggers)
 
 class GitAuditLogger:
     """
     Sovereign Write-Adapter.
-    Writes audit logs to a local file and immediately commits them to a local Git repository.
+    Appends audit logs to a buffered (64 KiB) daily file handle and commits them to a local
+    Git repository in batches (every BATCH_SIZE entries or MAX_WAIT_SECONDS after the first
+    pending one). The handle is flushed and fsynced only at those batch boundaries and at
+    exit, so until then the latest entries may exist only in memory.
     Enforces the "Git-as-Backend" architecture.
     """
+
+    BATCH_SIZE = 50
+    MAX_WAIT_SECONDS = 1.0
+    # Identity for audit commits when the repo has no user.name / user.email (containers, CI)
+    DEFAULT_AUTHOR_NAME = "ODGS Audit"
+    DEFAULT_AUTHOR_EMAIL = "odgs-audit@localhost"
     
     def __init__(self, repo_path: str):
         self.repo_path = repo_path
@@ -27,58 +47,200 @@ class GitAuditLogger:
         try:
             os.makedirs(self.log_dir, exist_ok=True)
         except OSError as e:
-            print(f"Server Warning: Could not create audit log directory {self.log_dir}: {e}")
+            self.logger.warning("Could not create audit log directory %s: %s", self.log_dir, e)
 
-        # Initialize or Connect to Git Repo
-        if HAS_GIT_PYTHON:
-            try:
+        # Git Repo is connected lazily by _ensure_repo() on the first flush
+        self._repo = None
+        self._repo_initialized = False
+        self._identity_env: Optional[Dict[str, str]] = None
+
+        # Commit batching: files touched and messages of entries not yet committed
+        self._lock = threading.RLock()
+        self._pending: List[str] = []
+        self._pending_files: List[str] = []
+        self._timer: Optional[threading.Timer] = None
+
+        # Buffered handle on today's log file; flushed and fsynced at batch boundaries
+        self._log_fh = None
+        self._log_date: Optional[str] = None
+        # UTC day number -> "YYYY-MM-DD", so the date is formatted once per day
+        self._cached_day_epoch = -1
+        self._cached_day_str = ""
+        _live_loggers.add(self)
+
+    @property
+    def repo(self):
+        """The audit git.Repo, or None when git is unavailable."""
+        return self._ensure_repo()
+
+    def _ensure_repo(self):
+        """Initialize or Connect to Git Repo, once."""
+        if self._repo_initialized:
+            return self._repo
+        with self._lock:
+            if self._repo_initialized:
+                return self._repo
+            if HAS_GIT_PYTHON:
                 try:
-                    self.repo = git.Repo(self.repo_path)
-                except git.exc.InvalidGitRepositoryError:
-                    print(f"Notice: {repo_path} is not a valid git repo. logs will be written but not committed until `git init` is run.")
-                    self.repo = None
-            except Exception as e:
-                 print(f"Git Initialization Warning: {e}")
-                 self.repo = None
-        else:
-            print("Warning: `GitPython` not installed. Git features disabled. Logs will only be written to disk.")
-            self.repo = None
+                    import git
+                    try:
+                        self._repo = git.Repo(self.repo_path)
+                    except git.exc.InvalidGitRepositoryError:
+                        self.logger.info("%s is not a valid git repo. Logs will be written but not committed until `git init` is run.", self.repo_path)
+                        self._repo = None
+                except Exception as e:
+                    self.logger.warning("Git initialization failed: %s", e)
+                    self._repo = None
+            else:
+                self.logger.warning("`GitPython` not installed. Git features disabled. Logs will only be written to disk.")
+                self._repo = None
+            self._repo_initialized = True
+        return self._repo
 
-    def write_entry(self, entry: Dict[str, Any]) -> str:
+    def write_entry(self, entry: Dict[str, Any]) -> Optional[str]:
         """
-        Writes a single log entry to the daily log file and commits it.
-        Returns the Git Commit Hash (or None if git failed).
+        Writes a single log entry to the (buffered) daily log file and queues it for commit.
+        Returns the Git Commit Hash if this entry completed a batch, otherwise None
+        (the entry is flushed to disk and committed by the next flush).
         """
         
-        # 1. Determine File Path (Daily Rotation)
-        today = datetime.datetime.utcnow().strftime("%Y-%m-%d")
-        filename = f"audit_{today}.jsonl"
-        filepath = os.path.join(self.log_dir, filename)
-        
-        # 2. Append to File
-        try:
-            with open(filepath, "a") as f:
-                f.write(json.dumps(entry) + "\n")
-        except Exception as e:
-            print(f"CRITICAL: Failed to write to audit log file: {e}")
-            return None
-
-        # 3. Git Commit
-        commit_hash = None
-        if self.repo:
+        event_id = entry.get("event_id", "unknown")
+        outcome = entry.get("outcome", "unknown")
+        with self._lock:
+            # 1. Determine File Path (Daily Rotation)
+            now = time.time()
+            day_epoch = int(now // 86400)
+            if day_epoch != self._cached_day_epoch:
+                self._cached_day_str = time.strftime("%Y-%m-%d", time.gmtime(now))
+                self._cached_day_epoch = day_epoch
+            today = self._cached_day_str
+            filepath = os.path.join(self.log_dir, f"audit_{today}.jsonl")
+
+            # 2. Append to File
+            try:
+                if today != self._log_date:
+                    self._close_log()
+                    self._log_fh = open(filepath, "a", buffering=1 << 16)
+                    self._log_date = today
+                self._log_fh.write(json.dumps(entry) + "\n")
+            except Exception as e:
+                self.logger.critical("Failed to write to audit log file: %s", e)
+                return None
+
+            # 3. Queue for Git Commit
+            self._pending.append(f"Audit: {outcome} [Event: {event_id}]")
+            if filepath not in self._pending_files:
+                self._pending_files.append(filepath)
+
+            if len(self._pending) >= self.BATCH_SIZE:
+                return self.flush()
+            if self._timer is None:
+                self._timer = threading.Timer(self.MAX_WAIT_SECONDS, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return None
+
+    def flush(self) -> Optional[str]:
+        """
+        Flushes pending entries to disk and commits them in one commit.
+        Returns the Git Commit Hash (or None if nothing was pending or git failed).
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return None
+
+            try:
+                if self._log_fh is not None:
+                    self._log_fh.flush()
+                    os.fsync(self._log_fh.fileno())
+            except OSError as e:
+                self.logger.critical("Failed to flush audit log file: %s", e)
+
+            messages, self._pending = self._pending, []
+            files, self._pending_files = self._pending_files, []
+            repo = self._ensure_repo()
+            if not repo:
+                return None
+
+            # A lone entry keeps the per-event message; batches list every event in the body
+            if len(messages) == 1:
+                msg = messages[0]
+            else:
+                msg = f"Audit batch: {len(messages)} entries\n\n" + "\n".join(messages)
+
             try:
-                # Add the specific file
-                self.repo.index.add([filepath])
-                
-                # Commit with metadata
-                event_id = entry.get("event_id", "unknown")
-                outcome = entry.get("outcome", "unknown")
-                msg = f"Audit: {outcome} [Event: {event_id}]"
-                
-                commit = self.repo.index.commit(msg)
-                commit_hash = commit.hexsha
-                
+                return self._commit_files(files, msg)
             except Exception as e:
-                print(f"Git Commit Failed: {e}")
-                
-        return commit_hash
+                self.logger.error("Git commit failed: %s", e)
+                return None
+
+    def _close_log(self) -> None:
+        """Closes the current day's handle (flushing its buffer), if any."""
+        if self._log_fh is not None:
+            try:
+                self._log_fh.close()
+            except OSError as e:
+                self.logger.critical("Failed to close audit log file: %s", e)
+            self._log_fh = None
+            self._log_date = None
+
+    def _commit_identity_env(self) -> Dict[str, str]:
+        """
+        GIT_AUTHOR_* / GIT_COMMITTER_* for commit-tree: the repo's configured
+        user.name / user.email, else DEFAULT_AUTHOR_NAME / DEFAULT_AUTHOR_EMAIL,
+        so audit commits never fail with "Author identity unknown".
+        """
+        if self._identity_env is None:
+            reader = self._repo.config_reader()
+            name = reader.get_value("user", "name", "") or self.DEFAULT_AUTHOR_NAME
+            email = reader.get_value("user", "email", "") or self.DEFAULT_AUTHOR_EMAIL
+            self._identity_env = {
+                "GIT_AUTHOR_NAME": str(name), "GIT_AUTHOR_EMAIL": str(email),
+                "GIT_COMMITTER_NAME": str(name), "GIT_COMMITTER_EMAIL": str(email),
+            }
+        return self._identity_env
+
+    def _commit_files(self, files: List[str], msg: str) -> str:
+        """
+        Commits `files` on top of HEAD with git plumbing (hash-object, write-tree,
+        commit-tree, update-ref). The tree is built in a scratch index seeded from
+        HEAD, so the working index is never re-serialized by GitPython and anything
+        else staged there stays out of the audit commit.
+        """
+        repo = self._repo
+        git_cmd = repo.git
+        work_tree = repo.working_tree_dir
+        try:
+            parent = repo.head.commit.hexsha
+        except ValueError:
+            parent = None  # unborn branch: first audit commit
+
+        scratch_env = {"GIT_INDEX_FILE": os.path.join(repo.git_dir, "odgs-audit-index"),
+                       **self._commit_identity_env()}
+        try:
+            git_cmd.read_tree(parent or "--empty", env=scratch_env)
+            entries = []
+            for filepath in files:
+                blob_sha = git_cmd.hash_object("-w", filepath)
+                rel_path = os.path.relpath(filepath, work_tree).replace(os.sep, "/")
+                entries.append(f"100644,{blob_sha},{rel_path}")
+                git_cmd.update_index("--add", "--cacheinfo", entries[-1], env=scratch_env)
+            tree_sha = git_cmd.write_tree(env=scratch_env)
+        finally:
+            try:
+                os.remove(scratch_env["GIT_INDEX_FILE"])
+            except OSError:
+                pass
+
+        parent_args = ["-p", parent] if parent else []
+        commit_sha = git_cmd.commit_tree(tree_sha, *parent_args, "-m", msg, env=scratch_env)
+        # Compare-and-swap against the parent we built on
+        git_cmd.update_ref("HEAD", commit_sha, *([parent] if parent else []))
+
+        # Keep the working index in step so `git status` stays clean for the logs
+        for entry in entries:
+            git_cmd.update_index("--add", "--cacheinfo", entry)
+        return commit_sha
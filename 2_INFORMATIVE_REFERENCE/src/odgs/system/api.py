@@ -6,6 +6,7 @@ import subprocess
 import os
 import sys
 import hashlib
+import importlib.util
 from dotenv import load_dotenv
 from typing import Dict, Any, List, Optional
 import json
@@ -50,7 +51,8 @@ from odgs.system.scripts.hashing import get_deterministic_json_hash, generate_pr
 # Factory imports are optional — the API server should start even without google-genai
 try:
     from odgs.factory.generator import generate_with_gemini, write_bundle, run_agent_chat
-    _FACTORY_AVAILABLE = True
+    # The generator imports google-genai lazily, so probe for the SDK explicitly
+    _FACTORY_AVAILABLE = importlib.util.find_spec("google.genai") is not None
 except ImportError:
     _FACTORY_AVAILABLE = False
 
@@ -1,12 +1,19 @@
 import typer
 import json
 import os
+import re
 import sys
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
 from rich.console import Console
 from rich.prompt import Prompt
 from rich.panel import Panel
 
+try:
+    import orjson  # optional accelerator: pip install odgs[fast]
+except ImportError:
+    orjson = None
+
 # Add project root to path to allow imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
@@ -17,21 +24,20 @@ if project_root not in sys.path:
 # Note: These paths assume we are running from project root or installed as package
 try:
     from odgs.system.scripts.validate_schema import validate_all
-    from odgs.system.scripts.hashing import generate_project_hash
-    # Adapters
-    from odgs.system.adapters.dbt.generate_seeds import generate_seeds
-    from odgs.system.adapters.dbt.generate_tests import generate_tests
-    from odgs.system.adapters.dbt.generate_semantic_models import generate_dbt_semantic_models
-    from odgs.system.adapters.powerbi.generate_tmsl import generate_powerbi_tmsl
-    from odgs.system.adapters.tableau.generate_tds import generate_tableau_tds
-    # Executive
-    from odgs.executive.interceptor import OdgsInterceptor, ProcessBlockedException, SecurityException
+    from odgs.system.scripts.hashing import generate_project_hash, canonicalize_file, CANON_SUFFIX, SCHEMA_FILES
+    from odgs.system.json_io import json_bytes, write_json
+    from odgs.system.operations import find_registry, hash_project, parse_context, enforce as run_enforce
+    # Adapters and the Executive interceptor are imported inside `build` / `enforce`,
+    # so commands that don't need them start without loading them
 except ImportError as e:
     # Graceful fallback for dev environment vs installed package
-    print(f"Import Error (Dev Mode?): {e}")
+    # stderr, so `enforce --quiet` keeps stdout to its single JSON line
+    print(f"Import Error (Dev Mode?): {e}", file=sys.stderr)
     # Try local relative imports for scripts if in dev
     from scripts.validate_schema import validate_all
-    from scripts.hashing import generate_project_hash
+    from scripts.hashing import generate_project_hash, canonicalize_file, CANON_SUFFIX, SCHEMA_FILES
+    from json_io import json_bytes, write_json
+    from operations import find_registry, hash_project, parse_context, enforce as run_enforce
 
 app = typer.Typer(
     help="ODGS Protocol CLI - The Sovereign Data Governance Engine",
@@ -39,6 +45,54 @@ app = typer.Typer(
 )
 console = Console()
 
+# Fifth URN component: urn:odgs:def:ai_synthetic:churn_rate:v1 -> churn_rate
+_URN_SLUG = re.compile(r'(?:[^:]*:){4}([^:]*)')
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+def _write_files(files) -> None:
+    """
+    Writes (path, bytes) pairs that are already serialized, each with one
+    os.write (looping only on a short write) and none of open()'s buffering setup.
+    """
+    for path, data in files:
+        fd = os.open(path, _WRITE_FLAGS, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+_SAMPLE_METRIC = {
+    "metric_id": "KPI_001",
+    "name": "Sample_Metric",
+    "domain": "Example",
+    "calculation_logic": {
+        "abstract": "A + B",
+        "sql_standard": "SUM(a) + SUM(b)"
+    },
+    "owner": "Data_Team",
+    "quality_threshold": "99.0%",
+    "status": "Active"
+}
+
+# Every file `init` writes except odgs.json, relative to the project root.
+# Serialized once at import, so init only copies bytes to disk
+_SCAFFOLD_FILES = (
+    # --- Legislative Plane (Definitions) ---
+    ("legislative/standard_metrics.json", json_bytes([_SAMPLE_METRIC])),
+    ("legislative/standard_dq_dimensions.json", b"[]"),
+    ("legislative/ontology_graph.json", b"[]"),
+    # --- Judiciary Plane (Rules) ---
+    ("judiciary/standard_data_rules.json", b"[]"),
+    ("judiciary/root_cause_factors.json", b"[]"),
+    # --- Executive Plane (Enforcement) ---
+    ("executive/business_process_maps.json", b"[]"),
+    ("executive/physical_data_map.json", b"[]"),
+    ("executive/runtime_config.json", b"[]"),
+)
+
 @app.command()
 def version():
     """
@@ -55,48 +109,17 @@ def init(
     """
     console.print(Panel(f"🚀 Initializing ODGS Sovereign Project: [bold cyan]{name}[/bold cyan]"))
 
-    base_path = os.path.join(os.getcwd(), name)
+    base_path = Path.cwd() / name
     
-    if os.path.exists(base_path):
+    if base_path.exists():
         console.print(f"[bold red]Error:[/bold red] Directory '{name}' already exists.")
         raise typer.Exit(code=1)
 
     # Create Sovereign Planes
     planes = ["legislative", "judiciary", "executive", "system", "adapters"]
     for plane in planes:
-        os.makedirs(os.path.join(base_path, plane), exist_ok=True)
-    
-    # --- Legislative Plane (Definitions) ---
-    sample_metric = {
-        "metric_id": "KPI_001",
-        "name": "Sample_Metric",
-        "domain": "Example",
-        "calculation_logic": {
-            "abstract": "A + B",
-            "sql_standard": "SUM(a) + SUM(b)"
-        },
-        "owner": "Data_Team",
-        "quality_threshold": "99.0%",
-        "status": "Active"
-    }
-    
-    # Write legislative artifacts
-    with open(os.path.join(base_path, "legislative", "standard_metrics.json"), "w") as f:
-        json.dump([sample_metric], f, indent=2)
-    
-    for filename in ["standard_dq_dimensions.json", "ontology_graph.json"]:
-        with open(os.path.join(base_path, "legislative", filename), "w") as f:
-            json.dump([], f, indent=2)
-
-    # --- Judiciary Plane (Rules) ---
-    for filename in ["standard_data_rules.json", "root_cause_factors.json"]:
-         with open(os.path.join(base_path, "judiciary", filename), "w") as f:
-            json.dump([], f, indent=2)
-
-    # --- Executive Plane (Enforcement) ---
-    for filename in ["business_process_maps.json", "physical_data_map.json", "runtime_config.json"]:
-         with open(os.path.join(base_path, "executive", filename), "w") as f:
-            json.dump([], f, indent=2)
+        (base_path / plane).mkdir(parents=True, exist_ok=True)
+    _write_files((base_path / rel_path, data) for rel_path, data in _SCAFFOLD_FILES)
 
     # Create odgs.json config in root
     config = {
@@ -104,8 +127,7 @@ def init(
         "version": "2.0.0",
         "architecture": "sovereign_v1"
     }
-    with open(os.path.join(base_path, "odgs.json"), "w") as f:
-        json.dump(config, f, indent=2)
+    write_json(base_path / "odgs.json", config)
 
     console.print(f"✅ Created Sovereign Territory: [bold green]{name}/[/bold green]")
     console.print(f"   🏛️  /legislative (Metrics, Ontology)")
@@ -169,28 +191,53 @@ def add(
 
     metrics.append(new_metric)
 
-    with open(metrics_file, "w") as f:
-        json.dump(metrics, f, indent=2)
+    write_json(Path(metrics_file), metrics)
+    # A file stored canonical (`odgs hash --canonicalize`) stays on the streamed hash path
+    if os.path.exists(metrics_file + CANON_SUFFIX):
+        canonicalize_file(metrics_file)
 
     console.print(f"✅ Added [bold cyan]{name}[/bold cyan] to {metrics_file}")
 
 def get_registry_path():
-    # Helper to find registry.json. Checks CWD then package root.
-    cwd_reg = os.path.join(os.getcwd(), "registry.json")
-    if os.path.exists(cwd_reg):
-        return cwd_reg
-    return None
+    # Helper to find registry.json in the CWD
+    return find_registry(os.getcwd())
 
 @app.command()
 def hash(
-    verify: bool = typer.Option(False, "--verify", help="Check if current hash matches the registry")
+    verify: bool = typer.Option(False, "--verify", help="Check if current hash matches the registry"),
+    canonicalize: bool = typer.Option(False, "--canonicalize", help="Rewrite the schema files in canonical form so later runs hash their bytes directly"),
+    strict_canonical: bool = typer.Option(False, "--strict-canonical", help="Ignore .canon sidecars and re-serialize every file"),
+    cache: bool = typer.Option(False, "--cache", help="Reuse unchanged files' hashes from .odgs/hash.cache.json (unauthenticated; local dev loops only)"),
+    algo: str = typer.Option("sha256", "--algo", help="Digest algorithm: sha256 (default) or blake3 (pip install blake3). --verify uses the registry's hash_algorithm instead")
 ):
     """
     Generate SHA-256 Governance Hash for the current project Logic.
     """
     console.print(Panel("🔐 Generating Deterministic Semantic Hash..."))
+
+    if canonicalize:
+        for rel_path in SCHEMA_FILES:
+            full_path = os.path.join(os.getcwd(), rel_path)
+            if os.path.exists(full_path):
+                canonicalize_file(full_path)
+                console.print(f"  [dim]Canonicalized {rel_path}[/dim]")
     
-    result = generate_project_hash(os.getcwd())
+    try:
+        _, matched = _run_hash(os.getcwd(), verify, strict_canonical=strict_canonical, use_cache=cache, algo=algo)
+    except ValueError as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+    if verify and not matched:
+        raise typer.Exit(code=1)
+
+def _run_hash(cwd: str, verify: bool, strict_canonical: bool = False, use_cache: bool = False, algo: str = "sha256"):
+    """
+    Hashes the project at cwd and prints the report; with verify, also checks
+    the master hash against registry.json, using the registry's hash_algorithm
+    (default sha256) in place of algo.
+    Returns (result, matched), matched being None when verify is False.
+    """
+    result, registry, matched = hash_project(cwd, verify, strict_canonical=strict_canonical, use_cache=use_cache, algo=algo)
     master_hash = result["master_hash"]
     
     console.print(f"Master Hash: [bold yellow]{master_hash}[/bold yellow]")
@@ -199,24 +246,22 @@ def hash(
         status = "[green]OK[/green]" if "MISSING" not in h and "ERROR" not in h else "[red]FAIL[/red]"
         console.print(f"  {file}: {status} ({h[:8]}...)")
 
-    if verify:
-        reg_path = get_registry_path()
-        if not reg_path:
-             console.print("\n[bold red]Registry Verification Failed:[/bold red] registry.json not found.")
-             raise typer.Exit(code=1)
-             
-        with open(reg_path, 'r') as f:
-            registry = json.load(f)
-            
-        latest = registry.get("latest_verified_hash", "")
-        if master_hash == latest:
-            console.print("\n✅ [bold green]Systems Nominal. Hash matches Registry ledger.[/bold green]")
-        else:
-            console.print("\n🛑 [bold red]COMPLIANCE ALERT: Hash Mismatch![/bold red]")
-            console.print(f"  Expected: {latest}")
-            console.print(f"  Actual:   {master_hash}")
-            console.print("  [dim]Data Drift Detected. Execution halted.[/dim]")
-            raise typer.Exit(code=1)
+    if not verify:
+        return result, None
+
+    if registry is None:
+        console.print("\n[bold red]Registry Verification Failed:[/bold red] registry.json not found.")
+        return result, False
+        
+    latest = registry.get("latest_verified_hash", "")
+    if matched:
+        console.print("\n✅ [bold green]Systems Nominal. Hash matches Registry ledger.[/bold green]")
+        return result, True
+    console.print("\n🛑 [bold red]COMPLIANCE ALERT: Hash Mismatch![/bold red]")
+    console.print(f"  Expected: {latest}")
+    console.print(f"  Actual:   {master_hash}")
+    console.print("  [dim]Data Drift Detected. Execution halted.[/dim]")
+    return result, False
 
 @app.command()
 def validate():
@@ -236,13 +281,13 @@ def validate():
     # Step 2: Hash Integrity Check (The "Hard Stop")
     console.print("\n   [dim]Verifying Registry Integrity...[/dim]")
     try:
-        hash(verify=True)
-    except typer.Exit:
-         raise
+        _, matched = _run_hash(os.getcwd(), verify=True)
     except Exception as e:
-         console.print(f"❌ Registry Check Failed: {e}")
-         # We allow validation to pass even if registry is missing, but warn
-         # raise typer.Exit(code=1)
+        # e.g. the registry's hash_algorithm is unavailable, or registry.json is unreadable
+        console.print(f"❌ Registry Check Failed: {e}")
+        raise typer.Exit(code=1)
+    if not matched:
+        raise typer.Exit(code=1)
 
     console.print("✅ All systems go. Data stack is EU AI ACT Compliant.")
 
@@ -251,6 +296,12 @@ def build():
     """
     Generate downstream adapters (dbt, PowerBI, Tableau).
     """
+    from odgs.system.adapters.dbt.generate_seeds import generate_seeds
+    from odgs.system.adapters.dbt.generate_tests import generate_tests
+    from odgs.system.adapters.dbt.generate_semantic_models import generate_dbt_semantic_models
+    from odgs.system.adapters.powerbi.generate_tmsl import generate_powerbi_tmsl
+    from odgs.system.adapters.tableau.generate_tds import generate_tableau_tds
+
     console.print("🏗️  Building Governance Artifacts...")
     
     console.print("\n--- dbt Adapter ---")
@@ -279,48 +330,68 @@ def api(
     console.print(Panel(f"🚀 Launching ODGS API on [cyan]http://{host}:{port}[/cyan]"))
     uvicorn.run("system.api:app", host=host, port=port, reload=reload)
 
+def _emit_status(payload) -> None:
+    """Writes one JSON status line to stdout (machine-readable enforce output)."""
+    if orjson is not None:
+        line = orjson.dumps(payload)
+    else:
+        line = json.dumps(payload, separators=(',', ':')).encode("utf-8")
+    sys.stdout.buffer.write(line + b"\n")
+    sys.stdout.flush()
+
 @app.command()
 def enforce(
     process: str = typer.Option(..., "--process", "-p", help="URN or ID of the Business Process Stage"),
     data: str = typer.Option(..., "--data", "-d", help="JSON string of data context"),
-    integrity_hash: str = typer.Option(None, "--hash", "-h", help="Required Governance Hash for Sovereign Handshake")
+    integrity_hash: str = typer.Option(None, "--hash", "-h", help="Required Governance Hash for Sovereign Handshake"),
+    quiet: bool = typer.Option(False, "--quiet", "--json-out", "-q", help="Print a single-line JSON status instead of panels")
 ):
     """
     Enforce Governance Rules acting as a Semantic Firewall (Hard Stop).
     """
-    console.print(Panel(f"🛡️  [bold red]ODGS INTERCEPTOR[/bold red] | Checking Process: [cyan]{process}[/cyan]"))
+    from odgs.executive.interceptor import ProcessBlockedException, SecurityException
+
+    if not quiet:
+        console.print(Panel(f"🛡️  [bold red]ODGS INTERCEPTOR[/bold red] | Checking Process: [cyan]{process}[/cyan]"))
 
     try:
-        # Parse data context
-        try:
-            context = json.loads(data)
-        except json.JSONDecodeError:
+        context = parse_context(data)
+    except json.JSONDecodeError:
+        if quiet:
+            _emit_status({"status": "error", "reason": "Invalid JSON data provided."})
+        else:
             console.print("[bold red]Error:[/bold red] Invalid JSON data provided.")
-            raise typer.Exit(code=1)
-
-        # Initialize Interceptor
-        # It auto-detects root if we are in a valid structure
-        interceptor = OdgsInterceptor()
-        
-        # Normalize Process URN if user only provided ID
-        if not process.startswith("urn:"):
-            process = f"urn:odgs:process:{process}"
+        raise typer.Exit(code=1)
 
+    try:
         # Execute Interception with Cryptographic Handshake
-        interceptor.intercept(process, context, required_integrity_hash=integrity_hash)
-        
-        # If we get here, no exception was raised
-        console.print(Panel("✅ [bold green]ACCESS GRANTED[/bold green]\nSemantic Checks Passed.", border_style="green"))
+        # (the interceptor auto-detects its root; bare process IDs become URNs)
+        run_enforce(process, context, integrity_hash)
 
     except SecurityException as e:
-        console.print(Panel(f"⛔ [bold red]SECURITY ALERT[/bold red]\n{str(e)}", border_style="red"))
+        if quiet:
+            _emit_status({"status": "security_alert", "reason": str(e)})
+        else:
+            console.print(Panel(f"⛔ [bold red]SECURITY ALERT[/bold red]\n{str(e)}", border_style="red"))
         raise typer.Exit(code=1)
     except ProcessBlockedException as e:
-        console.print(Panel(f"⛔ [bold red]HARD STOP TRIGGERED[/bold red]\n{str(e)}", border_style="red"))
+        if quiet:
+            _emit_status({"status": "blocked", "reason": str(e)})
+        else:
+            console.print(Panel(f"⛔ [bold red]HARD STOP TRIGGERED[/bold red]\n{str(e)}", border_style="red"))
         raise typer.Exit(code=1)
     except Exception as e:
-         console.print(f"[bold red]Unexpected Error:[/bold red] {e}")
-         raise typer.Exit(code=1)
+        if quiet:
+            _emit_status({"status": "error", "reason": str(e)})
+        else:
+            console.print(f"[bold red]Unexpected Error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+    # If we get here, no exception was raised
+    if quiet:
+        _emit_status({"status": "granted"})
+    else:
+        console.print(Panel("✅ [bold green]ACCESS GRANTED[/bold green]\nSemantic Checks Passed.", border_style="green"))
 
 @app.command()
 def harvest(
@@ -378,15 +449,36 @@ def harvest(
         console.print(f"[bold red]System Error:[/bold red] {e}")
         raise typer.Exit(code=1)
 
+def _save_drafts(industry: str, definitions) -> str:
+    """Write one draft file per definition under data/drafts/<industry>; returns the directory."""
+    base_dir = "data/drafts"
+    industry_slug = industry.lower().replace(" ", "_")
+    output_dir = os.path.join(base_dir, industry_slug)
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Serialize the whole bundle before touching the disk
+    files = []
+    for count, definition in enumerate(definitions):
+        # Create a filename from the URN
+        # urn:odgs:def:ai_synthetic:churn_rate:v1 -> churn_rate.json
+        m = _URN_SLUG.match(definition.urn)
+        clean_name = m.group(1) if m else f"item_{count}"
+
+        filename = f"{clean_name}.json"
+        files.append((os.path.join(output_dir, filename), json_bytes(definition.model_dump(mode="json"))))
+    _write_files(files)
+    return output_dir
+
 @app.command()
 def generate(
-    industry: str = typer.Argument(..., help="The target industry (e.g. 'Healthcare', 'Banking')"),
-    key: str = typer.Option(None, "--key", help="Google Gemini API Key (or set GEMINI_API_KEY env var)")
+    industries: List[str] = typer.Argument(..., help="One or more target industries (e.g. 'Healthcare' 'Banking')"),
+    key: str = typer.Option(None, "--key", help="Google Gemini API Key (or set GEMINI_API_KEY env var)"),
+    batch: bool = typer.Option(False, "--batch", help="Submit all industries as one Gemini Batch API job (cheaper, queued)")
 ):
     """
-    Generate a Draft Governance Bundle using AI (Gemini).
+    Generate Draft Governance Bundles using AI (Gemini); several industries run concurrently.
     """
-    from odgs.factory.generator import generate_bundle
+    from odgs.factory.generator import generate_bundle, generate_bundles, generate_bundles_batch
     from odgs.system.config import settings
     
     # Resolve API Key (CLI Flag > Settings/.env)
@@ -395,62 +487,52 @@ def generate(
         console.print("[bold red]Error:[/bold red] Google Gemini API Key required. Set GEMINI_API_KEY in .env or pass --key.")
         raise typer.Exit(code=1)
 
-    console.print(Panel(f"🏭 [bold purple]ODGS Factory[/bold purple] | Target: [cyan]{industry}[/cyan]"))
+    console.print(Panel(f"🏭 [bold purple]ODGS Factory[/bold purple] | Target: [cyan]{', '.join(industries)}[/cyan]"))
     
-    definitions = generate_bundle(industry, api_key)
+    if batch:
+        results = generate_bundles_batch(industries, api_key)
+    elif len(industries) == 1:
+        results = {industries[0]: generate_bundle(industries[0], api_key)}
+    else:
+        results = generate_bundles(industries, api_key)
     
-    if not definitions:
+    if not any(results.values()):
         console.print("[yellow]No definitions generated.[/yellow]")
         raise typer.Exit(code=1)
 
-    # Save Drafts
-    base_dir = "data/drafts"
-    industry_slug = industry.lower().replace(" ", "_")
-    output_dir = os.path.join(base_dir, industry_slug)
-    os.makedirs(output_dir, exist_ok=True)
-
-    count = 0
-    for definition in definitions:
-        # Create a filename from the URN
-        # urn:odgs:def:ai_synthetic:churn_rate:v1 -> churn_rate.json
-        parts = definition.urn.split(":")
-        if len(parts) > 4:
-            clean_name = parts[4] # slug
-        else:
-            clean_name = f"item_{count}"
-            
-        filename = f"{clean_name}.json"
-        path = os.path.join(output_dir, filename)
-        
-        with open(path, "w") as f:
-            f.write(definition.model_dump_json(indent=2))
-        count += 1
-        
     console.print(f"\n✅ [bold green]Factory Run Complete.[/bold green]")
-    console.print(f"   📂 Drafts: {count} generated.")
-    console.print(f"   📍 Location: {output_dir}")
+    for industry, definitions in results.items():
+        if not definitions:
+            console.print(f"   [yellow]{industry}: no definitions generated.[/yellow]")
+            continue
+        # Save Drafts
+        output_dir = _save_drafts(industry, definitions)
+        console.print(f"   📂 Drafts: {len(definitions)} generated.")
+        console.print(f"   📍 Location: {output_dir}")
 
 @app.command()
 def ui():
     """
     Launch the Sovereign Web Interface (Local Dashboard).
     """
-    import subprocess
-    
     console.print(Panel("🏛️  Launching [bold cyan]Sovereign UI[/bold cyan]...", border_style="cyan"))
     
     dashboard_path = os.path.join(os.path.dirname(__file__), "../ui/dashboard.py")
     dashboard_path = os.path.abspath(dashboard_path)
     
     try:
-        # Check for streamlit
-        subprocess.run(["streamlit", "--version"], check=True, capture_output=True)
-        
         console.print(f"   📍 Dashboard: {dashboard_path}")
         console.print("   🚀 Opening browser...")
         
-        # Run Streamlit
-        os.system(f"streamlit run {dashboard_path}")
+        # Run Streamlit: replace this process on POSIX (no shell, no second fork);
+        # a missing executable surfaces as FileNotFoundError either way
+        argv = ["streamlit", "run", dashboard_path]
+        if os.name == "posix":
+            sys.stdout.flush()
+            os.execvp(argv[0], argv)
+        else:
+            import subprocess
+            subprocess.run(argv)
         
     except FileNotFoundError:
         console.print("[bold red]Error:[/bold red] Streamlit not found. Install it with `pip install streamlit`.")
@@ -494,8 +576,7 @@ def register(
     os.makedirs(config_dir, exist_ok=True)
     reg_file = os.path.join(config_dir, "registration.lock")
     
-    with open(reg_file, 'w') as f:
-        json.dump(registration_data, f, indent=2)
+    write_json(Path(reg_file), registration_data)
         
     console.print(f"\n✅ [bold green]Handshake Verified.[/bold green]")
     console.print(f"   Identity: {email}")
@@ -0,0 +1,85 @@
+"""
+ODGS fast path — argparse front end for the per-request commands.
+Installed as `odgs-fast`. It skips Typer and Rich so an interceptor or CI step
+can shell out to `hash` / `enforce` cheaply; the interactive commands stay in
+`odgs` (system/cli.py).
+Usage: odgs-fast hash [--verify] [--algo sha256|blake3] [--root <path>]
+       odgs-fast enforce --process <urn|id> --data <json> [--hash <master_hash>] [--root <path>]
+"""
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional
+
+from odgs.system.operations import hash_project, parse_context, enforce
+from odgs.system.scripts.hashing import HASH_ALGORITHMS
+
+
+def _cmd_hash(args: argparse.Namespace) -> int:
+    try:
+        result, registry, matched = hash_project(args.root, args.verify, strict_canonical=args.strict_canonical,
+                                                 use_cache=args.cache, algo=args.algo)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(result["master_hash"])
+
+    if args.verify and registry is None:
+        print("Registry Verification Failed: registry.json not found.", file=sys.stderr)
+        return 1
+    if matched is False:
+        print(f"COMPLIANCE ALERT: Hash Mismatch! Expected: {registry.get('latest_verified_hash', '')}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _cmd_enforce(args: argparse.Namespace) -> int:
+    from odgs.executive.interceptor import ProcessBlockedException, SecurityException
+
+    try:
+        context = parse_context(args.data)
+    except json.JSONDecodeError:
+        print("Error: Invalid JSON data provided.", file=sys.stderr)
+        return 1
+
+    try:
+        enforce(args.process, context, args.integrity_hash, project_root=args.root)
+    except SecurityException as e:
+        print(f"SECURITY ALERT: {e}", file=sys.stderr)
+        return 1
+    except ProcessBlockedException as e:
+        print(f"HARD STOP TRIGGERED: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Unexpected Error: {e}", file=sys.stderr)
+        return 1
+    print("ACCESS GRANTED")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="odgs-fast", description="ODGS per-request commands without the interactive CLI.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    hash_parser = subparsers.add_parser("hash", help="Print the Governance Hash; exit 1 on a registry mismatch with --verify")
+    hash_parser.add_argument("--root", default=os.getcwd(), help="Project root (default: current directory)")
+    hash_parser.add_argument("--verify", action="store_true", help="Check the hash against registry.json")
+    hash_parser.add_argument("--algo", default="sha256", choices=HASH_ALGORITHMS, help="Digest algorithm (--verify uses the registry's)")
+    hash_parser.add_argument("--strict-canonical", action="store_true", help="Ignore .canon sidecars")
+    hash_parser.add_argument("--cache", action="store_true", help="Reuse hashes from .odgs/hash.cache.json (unauthenticated)")
+    hash_parser.set_defaults(func=_cmd_hash)
+
+    enforce_parser = subparsers.add_parser("enforce", help="Semantic Firewall check; exit 1 on a Hard Stop")
+    enforce_parser.add_argument("--process", "-p", required=True, help="URN or ID of the Business Process Stage")
+    enforce_parser.add_argument("--data", "-d", required=True, help="JSON string of data context")
+    enforce_parser.add_argument("--hash", dest="integrity_hash", default=None, help="Required Governance Hash for Sovereign Handshake")
+    enforce_parser.add_argument("--root", default=None, help="Project root holding the planes (default: the installed package)")
+    enforce_parser.set_defaults(func=_cmd_enforce)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
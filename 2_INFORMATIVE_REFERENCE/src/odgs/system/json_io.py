@@ -0,0 +1,61 @@
+"""
+Shared JSON file output for the CLI, the AI Factory, the harvesters and the
+migration scripts. json_bytes is exactly json.dumps(obj, indent=2,
+ensure_ascii=ensure_ascii) encoded as UTF-8 — the layout these files have
+always had — whether or not orjson is installed; orjson only speeds it up
+when its output provably matches.
+"""
+import json
+import os
+import re
+from typing import Any, Union
+
+from odgs.system.scripts.hashing import _NON_ASCII, _escape_non_ascii
+
+try:
+    import orjson  # optional accelerator: pip install odgs[fast]
+except ImportError:
+    orjson = None
+
+# orjson writes some floats differently from json.dumps (1e16 vs 1e+16, 0.00001 vs
+# 1e-05): any number token in exponent form or below 1e-4 falls back to json.dumps.
+# Strings may also match, which only costs the fallback.
+_ORJSON_FLOAT_DRIFT = re.compile(rb'(?:^|[:\[,\s])-?(?:\d+(?:\.\d+)?[eE]|0\.0000)')
+# Types json.dumps rejects or spells differently make orjson raise instead
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS
+) if orjson is not None else 0
+
+
+def _orjson_bytes(obj: Any, ensure_ascii: bool) -> Union[bytes, None]:
+    """orjson's rendering of obj when it equals json.dumps', else None."""
+    try:
+        out = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    except TypeError:
+        return None  # non-str keys, integers beyond 64 bits, passthrough types
+    # orjson writes NaN and Infinity as null; a real null only costs the fallback
+    if b'null' in out or _ORJSON_FLOAT_DRIFT.search(out):
+        return None
+    if ensure_ascii:
+        if not out.isascii():
+            out = _NON_ASCII.sub(_escape_non_ascii, out.decode('utf-8')).encode('ascii')
+        elif b'\x7f' in out:
+            out = out.replace(b'\x7f', b'\\u007f')
+    return out
+
+
+def json_bytes(obj: Any, ensure_ascii: bool = True) -> bytes:
+    """json.dumps(obj, indent=2, ensure_ascii=ensure_ascii) as UTF-8, via orjson when it matches."""
+    if orjson is not None:
+        out = _orjson_bytes(obj, ensure_ascii)
+        if out is not None:
+            return out
+    return json.dumps(obj, indent=2, ensure_ascii=ensure_ascii).encode('utf-8')
+
+
+def write_json(path: Union[str, "os.PathLike[str]"], obj: Any, ensure_ascii: bool = True) -> None:
+    """Writes obj to path as json_bytes(obj, ensure_ascii), like json.dump(obj, f, indent=2)."""
+    data = json_bytes(obj, ensure_ascii)
+    with open(path, "wb") as f:
+        f.write(data)
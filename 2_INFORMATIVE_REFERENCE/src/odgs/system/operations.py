@@ -0,0 +1,76 @@
+"""
+ODGS per-request operations, without Typer or Rich.
+The registry verification and enforcement steps behind `odgs hash --verify`,
+`odgs validate` and `odgs enforce` (system/cli.py) and their `odgs-fast`
+counterparts (system/fast_cli.py) live here, so the two front ends only
+differ in how they report.
+"""
+import json
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from odgs.system.scripts.hashing import generate_project_hash
+
+try:
+    import orjson  # optional accelerator: pip install odgs[fast]
+except ImportError:
+    orjson = None
+
+REGISTRY_FILE = "registry.json"
+PROCESS_URN_PREFIX = "urn:odgs:process:"
+
+
+def find_registry(project_root: str) -> Optional[str]:
+    """Path of the project's registry.json, or None if there is none."""
+    path = os.path.join(project_root, REGISTRY_FILE)
+    return path if os.path.exists(path) else None
+
+
+def hash_project(project_root: str, verify: bool, strict_canonical: bool = False,
+                 use_cache: bool = False, algo: str = "sha256"
+                 ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[bool]]:
+    """
+    Hashes the project; with verify, also checks the master hash against its
+    registry.json, using the registry's hash_algorithm (default sha256) in place of algo.
+    Returns (result, registry, matched): registry is None when verify is False or
+    there is no registry.json, matched is None when verify is False and False
+    without a registry. Raises ValueError for an unknown or unavailable algorithm.
+    """
+    registry = None
+    if verify:
+        reg_path = find_registry(project_root)
+        if reg_path:
+            with open(reg_path, 'r') as f:
+                registry = json.load(f)
+            algo = registry.get("hash_algorithm", "sha256")
+
+    result = generate_project_hash(project_root, strict_canonical=strict_canonical, use_cache=use_cache, algo=algo)
+    if not verify:
+        return result, None, None
+    if registry is None:
+        return result, None, False
+    return result, registry, result["master_hash"] == registry.get("latest_verified_hash", "")
+
+
+def parse_context(data: str) -> Any:
+    """The --data context; raises json.JSONDecodeError (orjson's subclasses it) on bad input."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def normalize_process_urn(process: str) -> str:
+    """A process URN, given either the URN or its bare ID."""
+    return process if process.startswith("urn:") else f"{PROCESS_URN_PREFIX}{process}"
+
+
+def enforce(process: str, context: Any, integrity_hash: Optional[str] = None,
+            project_root: Optional[str] = None) -> None:
+    """
+    Runs the interceptor for one process; raises ProcessBlockedException on a
+    Hard Stop and SecurityException on a handshake failure.
+    project_root defaults to the interceptor's own (the installed planes).
+    """
+    # Imported here: the interceptor pulls in simpleeval and the git audit logger
+    from odgs.executive.interceptor import OdgsInterceptor
+
+    OdgsInterceptor(project_root).intercept(normalize_process_urn(process), context,
+                                            required_integrity_hash=integrity_hash)
@@ -3,15 +3,31 @@ import random
 import string
 import json
 
+try:
+    import numpy as np  # optional: vectorizes fabricate_batch (ships with odgs[demo] via pandas)
+except ImportError:
+    np = None
+
+_UPPER = string.ascii_uppercase
+# ISO 6346 serials are 7 digits; one randrange over all valid IDs replaces 11 per-char draws
+_SERIAL_SPACE = 10 ** 7
+_ID_SPACE = 26 ** 4 * _SERIAL_SPACE
+
 def generate_container_id(valid=True):
     if valid:
         # Standard ISO 6346: 4 letters, 7 numbers
-        owner_code = "".join(random.choices(string.ascii_uppercase, k=4))
-        serial_number = "".join(random.choices(string.digits, k=7))
-        return f"{owner_code}{serial_number}"
+        owner, serial_number = divmod(random.randrange(_ID_SPACE), _SERIAL_SPACE)
+        owner, d = divmod(owner, 26)
+        owner, c = divmod(owner, 26)
+        a, b = divmod(owner, 26)
+        return f"{_UPPER[a]}{_UPPER[b]}{_UPPER[c]}{_UPPER[d]}{serial_number:07d}"
     else:
         # Invalid format
-        return "".join(random.choices(string.ascii_uppercase + string.digits, k=10))
+        return "".join(random.choices(_INVALID_ALPHABET, k=10))
+
+_ORIGIN_PORTS = ["NLRTM", "CNSHG", "USNYC", "SGSIN"]
+_DESTINATION_PORTS = ["DEHAM", "BEANR", "JPTYO", "AUMEL"]
+_INVALID_ALPHABET = string.ascii_uppercase + string.digits
 
 def fabricate_data_context(scenario="valid"):
     """
@@ -21,8 +37,8 @@ def fabricate_data_context(scenario="valid"):
     
     data = {
         "shipment_id": f"SHP_{random.randint(1000, 9999)}",
-        "origin_port": random.choice(["NLRTM", "CNSHG", "USNYC", "SGSIN"]),
-        "destination_port": random.choice(["DEHAM", "BEANR", "JPTYO", "AUMEL"]),
+        "origin_port": random.choice(_ORIGIN_PORTS),
+        "destination_port": random.choice(_DESTINATION_PORTS),
         "container_id": generate_container_id(valid=(scenario == "valid"))
     }
     
@@ -31,5 +47,57 @@ def fabricate_data_context(scenario="valid"):
         
     return data
 
+class FabricatedBatch:
+    """
+    n data contexts stored column-wise (NumPy arrays when available, else lists).
+    Columns: shipment_id, origin_port, destination_port and, unless the scenario
+    is 'missing_field', container_id.
+    """
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns["shipment_id"])
+
+    def to_records(self):
+        """Yields one dict per row, in the shape fabricate_data_context returns."""
+        names = list(self.columns)
+        for row in zip(*(self.columns[name] for name in names)):
+            yield {name: str(value) for name, value in zip(names, row)}
+
+def _container_ids_np(rng, n, valid):
+    if valid:
+        letters = np.array(list(_UPPER))[rng.integers(0, 26, (n, 4))]
+        # Digit by digit like the letters: np.char.zfill fails on an empty batch
+        serials = np.array(list(string.digits))[rng.integers(0, 10, (n, 7))]
+        return np.char.add(letters.view("<U4").ravel(), serials.view("<U7").ravel())
+    chars = np.array(list(_INVALID_ALPHABET))[rng.integers(0, len(_INVALID_ALPHABET), (n, 10))]
+    return chars.view("<U10").ravel()
+
+def fabricate_batch(n, scenario="valid"):
+    """
+    Generates n data contexts at once (same scenarios as fabricate_data_context),
+    for fuzz loops and test harnesses.
+    """
+    if np is not None:
+        rng = np.random.default_rng()
+        columns = {
+            "shipment_id": np.char.add("SHP_", rng.integers(1000, 10000, n).astype(str)),
+            "origin_port": np.array(_ORIGIN_PORTS)[rng.integers(0, len(_ORIGIN_PORTS), n)],
+            "destination_port": np.array(_DESTINATION_PORTS)[rng.integers(0, len(_DESTINATION_PORTS), n)],
+        }
+        if scenario != "missing_field":
+            columns["container_id"] = _container_ids_np(rng, n, valid=(scenario == "valid"))
+    else:
+        columns = {
+            "shipment_id": [f"SHP_{i}" for i in random.choices(range(1000, 10000), k=n)],
+            "origin_port": random.choices(_ORIGIN_PORTS, k=n),
+            "destination_port": random.choices(_DESTINATION_PORTS, k=n),
+        }
+        if scenario != "missing_field":
+            columns["container_id"] = [generate_container_id(valid=(scenario == "valid")) for _ in range(n)]
+    return FabricatedBatch(columns)
+
 if __name__ == "__main__":
     print(json.dumps(fabricate_data_context("valid"), indent=2))
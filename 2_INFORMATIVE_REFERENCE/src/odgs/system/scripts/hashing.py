@@ -1,62 +1,311 @@
+import codecs
 import hashlib
 import json
 import os
-from typing import Dict, Any
+import re
+import stat
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, Any, List, Optional
 
-def get_deterministic_json_hash(data: Any) -> str:
+try:
+    import orjson  # optional accelerator: pip install odgs[fast]
+except ImportError:
+    orjson = None
+
+try:
+    import blake3  # optional: pip install blake3 (for algo="blake3")
+except ImportError:
+    blake3 = None
+
+# SHA-256 is the registry default; BLAKE3 is an opt-in for throughput-bound CI runs
+HASH_ALGORITHMS = ("sha256", "blake3")
+
+def _new_hasher(algo: str = "sha256"):
+    if algo == "sha256":
+        return hashlib.sha256()
+    if algo == "blake3":
+        if blake3 is None:
+            raise ValueError("Hash algorithm 'blake3' requires the blake3 package: pip install blake3")
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    raise ValueError(f"Unknown hash algorithm '{algo}'. Available: {', '.join(HASH_ALGORITHMS)}")
+
+def _digest(data: bytes, algo: str = "sha256") -> str:
+    hasher = _new_hasher(algo)
+    hasher.update(data)
+    return hasher.hexdigest()
+
+# orjson spells some floats differently from json.dumps (1e-05 vs 0.00001, 1e+16 vs 1e16).
+# Matches any number token in exponent form or below 1e-4 in compact output, including a
+# top-level scalar; strings may also match, which only costs a fallback to json.dumps.
+_ORJSON_FLOAT_DRIFT = re.compile(rb'(?:^|[:,\[])-?(?:\d+(?:\.\d+)?[eE]|0\.0000)')
+# orjson.loads turns integers outside the 64-bit range into floats instead of
+# rejecting them. Any integer token of 19+ digits may be one, so such input is
+# parsed by json instead; digit runs inside strings only cost that fallback.
+_ORJSON_WIDE_INT = re.compile(rb'(?<![\d.])\d{19,}(?![\d.eE])')
+# orjson options for arbitrary Python data: types json.dumps would reject or
+# spell differently raise instead, and the caller falls back to json.dumps
+_ORJSON_STRICT = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS
+) if orjson is not None else 0
+# Characters json.dumps escapes (ensure_ascii) that orjson writes raw
+_NON_ASCII = re.compile('[^\x00-\x7e]')
+
+
+def _escape_non_ascii(match: "re.Match[str]") -> str:
+    code = ord(match.group())
+    if code < 0x10000:
+        return '\\u%04x' % code
+    code -= 0x10000
+    return '\\u%04x\\u%04x' % (0xd800 | (code >> 10), 0xdc00 | (code & 0x3ff))
+
+
+def _dumps_canonical(data: Any, from_json_text: bool = True) -> bytes:
+    """
+    Canonical bytes of a parsed schema file: exactly
+    json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8'),
+    produced by orjson when it is installed and the output provably matches.
+    Data not decoded from JSON text needs from_json_text=False: datetimes,
+    dataclasses and float subclasses are then left to json.dumps, as is any
+    output containing null (orjson writes NaN and Infinity as null).
+
+    This form (not RFC 8785 JCS) is what registered governance hashes commit
+    to, so other serializers may only speed it up, never change it.
+    """
+    if orjson is not None:
+        try:
+            out = orjson.dumps(data, option=orjson.OPT_SORT_KEYS if from_json_text else _ORJSON_STRICT)
+        except TypeError:
+            out = None  # e.g. integers beyond 64 bits, non-str keys
+        if out is not None and not from_json_text and b'null' in out:
+            out = None
+        if out is not None:
+            if not out.isascii():
+                out = _NON_ASCII.sub(_escape_non_ascii, out.decode('utf-8')).encode('ascii')
+            elif b'\x7f' in out:
+                out = out.replace(b'\x7f', b'\\u007f')
+            if not _ORJSON_FLOAT_DRIFT.search(out):
+                return out
+    return json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+def get_deterministic_json_hash(data: Any, algo: str = "sha256") -> str:
     """
-    Generates a SHA-256 hash of a JSON-serializable object.
+    Generates a SHA-256 (or, with algo="blake3", BLAKE3) hash of a JSON-serializable object.
     Ensures determinism by sorting keys.
     """
-    # abuse json.dumps to canonicalize the structure
-    # separators=(',', ':') removes whitespace to ensure compact representation
+    # canonical form of json.dumps(sort_keys=True, separators=(',', ':')), via orjson when it matches
     try:
-        canonical_str = json.dumps(data, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(canonical_str.encode('utf-8')).hexdigest()
+        return _digest(_dumps_canonical(data, from_json_text=False), algo)
     except TypeError as e:
         print(f"Hashing Error: {e}")
         return "ERROR_NON_SERIALIZABLE"
 
-def generate_project_hash(project_root: str) -> Dict[str, str]:
+# The 7 Immutable Pillars of ODGS, mapped to their Plane
+SCHEMA_FILES = {
+    "1_NORMATIVE_SPECIFICATION/schemas/legislative/standard_metrics.json": "standard_metrics.json",
+    "1_NORMATIVE_SPECIFICATION/schemas/legislative/standard_dq_dimensions.json": "standard_dq_dimensions.json",
+    "1_NORMATIVE_SPECIFICATION/schemas/legislative/ontology_graph.json": "ontology_graph.json",
+    "1_NORMATIVE_SPECIFICATION/schemas/judiciary/standard_data_rules.json": "standard_data_rules.json",
+    "1_NORMATIVE_SPECIFICATION/schemas/judiciary/root_cause_factors.json": "root_cause_factors.json",
+    "1_NORMATIVE_SPECIFICATION/schemas/executive/business_process_maps.json": "business_process_maps.json",
+    "1_NORMATIVE_SPECIFICATION/schemas/executive/physical_data_map.json": "physical_data_map.json"
+}
+
+# SCHEMA_FILES in master-hash order, with paths in the platform's separator form
+_SCHEMA_ENTRIES = [(os.path.normpath(rel_path), filename) for rel_path, filename in sorted(SCHEMA_FILES.items())]
+
+# Sidecar written by canonicalize_file(): the digest of the file's canonical bytes
+CANON_SUFFIX = ".canon"
+
+def _canonical_bytes(raw: bytes) -> bytes:
+    """Canonical form of a schema file's bytes, parsing with orjson when possible."""
+    if raw.startswith(codecs.BOM_UTF8):
+        # Schema files are read as plain UTF-8; json.loads(bytes) would silently accept this
+        raise json.JSONDecodeError("Unexpected UTF-8 BOM", raw.decode('utf-8', 'replace'), 0)
+    if orjson is not None and not _ORJSON_WIDE_INT.search(raw):
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity literals: let json decide
+        else:
+            return _dumps_canonical(data)
+    return json.dumps(json.loads(raw), sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+def _hash_schema_bytes(raw: bytes, algo: str = "sha256") -> str:
+    """Same digest as get_deterministic_json_hash(json.loads(raw), algo)."""
+    return _digest(_canonical_bytes(raw), algo)
+
+def _file_sha256(f: BinaryIO) -> str:
+    """SHA-256 of an open binary file, streamed without holding it in memory."""
+    if sys.version_info >= (3, 11):
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: f.read(1 << 16), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+def _hash_if_canonical(full_path: str, algo: str = "sha256") -> Optional[str]:
+    """
+    Digest of a file already stored in canonical form, streamed without parsing it.
+    The .canon sidecar names the expected SHA-256 digest; the file only counts as
+    canonical if its bytes hash to it, so any edit falls back to the parse path.
+    For other algorithms both digests are computed in the same pass.
+    """
+    try:
+        with open(full_path + CANON_SUFFIX, 'r') as f:
+            expected = f.read().strip()
+        with open(full_path, 'rb') as f:
+            if algo == "sha256":
+                digest = result = _file_sha256(f)
+            else:
+                check, hasher = hashlib.sha256(), _new_hasher(algo)
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    check.update(chunk)
+                    hasher.update(chunk)
+                digest, result = check.hexdigest(), hasher.hexdigest()
+    except OSError:
+        return None
+    return result if digest == expected else None
+
+def canonicalize_file(path: str) -> str:
+    """
+    Rewrites a JSON file in canonical form (sorted keys, compact, ASCII, no
+    trailing newline) and records its digest in a .canon sidecar, so
+    generate_project_hash can hash the file bytes directly. Returns the digest;
+    it equals the hash of the file before rewriting.
+    """
+    with open(path, 'rb') as f:
+        canonical = _canonical_bytes(f.read())
+    digest = hashlib.sha256(canonical).hexdigest()
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(canonical)
+        os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))  # mkstemp creates 0600
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    with open(path + CANON_SUFFIX, 'w') as f:
+        f.write(digest + "\n")
+    return digest
+
+# Per-project cache of component hashes, keyed by each file's stat signature.
+# The file is unauthenticated: whoever can edit the schemas can rewrite it too,
+# so it is opt-in (odgs hash --cache) and never consulted by the interceptor.
+HASH_CACHE_PATH = os.path.join(".odgs", "hash.cache.json")
+
+def _stat_key(full_path: str) -> Optional[List[int]]:
+    """
+    Change signature of a file. ctime and inode are included because mtime can
+    be set back by the file owner; ctime cannot, so edits are never masked.
+    """
+    try:
+        st = os.stat(full_path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size, st.st_ctime_ns, st.st_ino]
+
+def _load_cache(project_root: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(project_root, HASH_CACHE_PATH), 'rb') as f:
+            cache = json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def _save_cache(project_root: str, cache: Dict[str, Any]) -> None:
+    """Best-effort atomic write; a read-only project simply runs uncached."""
+    cache_path = os.path.join(project_root, HASH_CACHE_PATH)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+def _hash_one(full_path: str, strict_canonical: bool = False, algo: str = "sha256") -> str:
+    """Component hash of one schema file (or MISSING_FILE / INVALID_JSON)."""
+    if not strict_canonical:
+        file_hash = _hash_if_canonical(full_path, algo)
+        if file_hash is not None:
+            return file_hash
+    try:
+        with open(full_path, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return "MISSING_FILE"
+    try:
+        return _hash_schema_bytes(raw, algo)
+    except json.JSONDecodeError:
+        return "INVALID_JSON"
+
+def generate_project_hash(project_root: str, strict_canonical: bool = False, use_cache: bool = False,
+                          algo: str = "sha256") -> Dict[str, str]:
     """
     Reads all 7 component schemas from their Sovereign Planes and generates a composite hash.
     Returns a dict with individual file hashes and the global root hash.
+
+    Files canonicalized with canonicalize_file() are hashed from their bytes;
+    strict_canonical=True ignores .canon sidecars and re-serializes every file.
+    With use_cache=True, unchanged files reuse their hash from .odgs/hash.cache.json.
+    algo selects the digest ("sha256" or "blake3") for components and master alike.
     """
+    master = _new_hasher(algo)  # fail fast on an unknown or missing algorithm
     
-    # The 7 Immutable Pillars of ODGS, mapped to their Plane
-    schema_map = {
-        "1_NORMATIVE_SPECIFICATION/schemas/legislative/standard_metrics.json": "standard_metrics.json",
-        "1_NORMATIVE_SPECIFICATION/schemas/legislative/standard_dq_dimensions.json": "standard_dq_dimensions.json",
-        "1_NORMATIVE_SPECIFICATION/schemas/legislative/ontology_graph.json": "ontology_graph.json",
-        "1_NORMATIVE_SPECIFICATION/schemas/judiciary/standard_data_rules.json": "standard_data_rules.json",
-        "1_NORMATIVE_SPECIFICATION/schemas/judiciary/root_cause_factors.json": "root_cause_factors.json",
-        "1_NORMATIVE_SPECIFICATION/schemas/executive/business_process_maps.json": "business_process_maps.json",
-        "1_NORMATIVE_SPECIFICATION/schemas/executive/physical_data_map.json": "physical_data_map.json"
-    }
-    
-    hashes = {}
-    combo_string = ""
-    
-    # Process each file
-    for rel_path, filename in sorted(schema_map.items()):
-        full_path = os.path.join(project_root, rel_path)
-        
-        if os.path.exists(full_path):
-            with open(full_path, 'r') as f:
-                try:
-                    data = json.load(f)
-                    file_hash = get_deterministic_json_hash(data)
-                except json.JSONDecodeError:
-                    file_hash = "INVALID_JSON"
+    entries = _SCHEMA_ENTRIES
+    root = os.path.abspath(project_root)
+    full_paths = [os.path.join(root, rel_path) for rel_path, _ in entries]
+
+    cache = _load_cache(project_root) if use_cache else {}
+    stat_keys = [_stat_key(path) for path in full_paths] if use_cache else [None] * len(entries)
+    file_hashes: List[Optional[str]] = [None] * len(entries)
+    for i, path in enumerate(full_paths):
+        cached = cache.get(path)
+        if (stat_keys[i] is not None and isinstance(cached, dict) and cached.get("stat") == stat_keys[i]
+                and cached.get("algo", "sha256") == algo):
+            file_hashes[i] = cached.get("hash")
+
+    # Read and hash the remaining files concurrently (I/O and sha256 release the GIL);
+    # a single miss (one edited file on a warm cache) is hashed inline, without a pool
+    misses = [i for i, file_hash in enumerate(file_hashes) if file_hash is None]
+    if misses:
+        hash_miss = lambda i: _hash_one(full_paths[i], strict_canonical, algo)
+        if len(misses) == 1:
+            computed = [hash_miss(misses[0])]
         else:
-            file_hash = "MISSING_FILE"
-            
+            with ThreadPoolExecutor(max_workers=len(misses)) as executor:
+                computed = list(executor.map(hash_miss, misses))
+        for i, file_hash in zip(misses, computed):
+            file_hashes[i] = file_hash
+            if stat_keys[i] is not None:
+                cache[full_paths[i]] = {"stat": stat_keys[i], "hash": file_hash, "algo": algo}
+        if use_cache:
+            _save_cache(project_root, cache)
+
+    # Combine in sorted path order so the master hash stays deterministic.
+    # The digest covers the concatenated hex strings (the registry contract),
+    # fed incrementally rather than built up as one string. Feeding the raw
+    # 32-byte digests instead would be cheaper but changes every master hash.
+    hashes = {}
+    for (rel_path, filename), file_hash in zip(entries, file_hashes):
         hashes[filename] = file_hash
-        combo_string += file_hash
-        
+        master.update(file_hash.encode('ascii'))
+
     # Generate the Master Governance Hash
     # This is the single 256-bit proof of the entire governance state
-    master_hash = hashlib.sha256(combo_string.encode('utf-8')).hexdigest()
+    master_hash = master.hexdigest()
     
     return {
         "master_hash": master_hash,
@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 """
 ODGS Schema Validator — validates core JSON files against their meta-schemas.
-Usage: python3 -m src.odgs.system.scripts.validate_schemas [--root <path>]
+Usage: python3 -m src.odgs.system.scripts.validate_schemas [<root>] [--max-errors N]
 """
+import argparse
 import json
 import os
 import sys
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Optional, Tuple
 
 try:
     from jsonschema import validate, ValidationError, Draft7Validator
@@ -14,37 +17,189 @@ except ImportError:
     print("ERROR: jsonschema not installed. Run: pip install jsonschema")
     sys.exit(1)
 
+try:
+    import orjson  # optional accelerator: pip install odgs[fast]
+except ImportError:
+    orjson = None
+
+try:
+    import fastjsonschema  # optional accelerator: pip install odgs[fast]
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import ijson  # optional: streams large data files item by item (pip install ijson)
+except ImportError:
+    ijson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Data files at least this large are streamed with ijson (when installed) instead of
+# loaded whole; below it a single orjson/json parse is faster
+STREAM_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+
+@lru_cache(maxsize=32)
+def _load_validator_cached(schema_path: str, mtime_ns: int) -> Draft7Validator:
+    """Compiled validator for one version of a meta-schema; the schema is checked once here."""
+    with open(schema_path, 'rb') as f:
+        schema = _loads(f.read())
+    Draft7Validator.check_schema(schema)
+    return Draft7Validator(schema, format_checker=None)
+
+
+def _load_validator(schema_path: str) -> Draft7Validator:
+    """Validator for schema_path, rebuilt only when the file changes."""
+    return _load_validator_cached(schema_path, os.stat(schema_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_fast_validator_cached(schema_path: str, mtime_ns: int) -> Optional[Callable[[Any], Any]]:
+    """
+    fastjsonschema-generated check for a meta-schema, or None when fastjsonschema
+    is missing or cannot compile it. Formats and defaults are disabled to match
+    Draft7Validator(format_checker=None), which never mutates the data.
+    """
+    if fastjsonschema is None:
+        return None
+    schema = _load_validator_cached(schema_path, mtime_ns).schema
+    try:
+        return fastjsonschema.compile(schema, use_default=False, use_formats=False)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _load_array_validators_cached(
+    schema_path: str, mtime_ns: int
+) -> Tuple[Draft7Validator, Optional[Callable[[Any], Any]]]:
+    """
+    Draft7Validator and fastjsonschema check (None when unavailable) for a JSON
+    array of meta-schema items, so an in-memory file is validated in one call.
+    """
+    array_schema = {"type": "array", "items": _load_validator_cached(schema_path, mtime_ns).schema}
+    fast_check = None
+    if fastjsonschema is not None:
+        try:
+            fast_check = fastjsonschema.compile(array_schema, use_default=False, use_formats=False)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            pass
+    return Draft7Validator(array_schema, format_checker=None), fast_check
+
+
+def _first_token(f) -> bytes:
+    """First non-whitespace byte of a binary file, leaving the position at the start."""
+    while True:
+        chunk = f.read(4096)
+        if not chunk:
+            f.seek(0)
+            return b""
+        stripped = chunk.lstrip()
+        if stripped:
+            f.seek(0)
+            return stripped[:1]
+
 
 def validate_array_against_schema(
     data_path: str,
     schema_path: str,
-    item_label: str = "item"
+    item_label: str = "item",
+    max_errors: Optional[int] = None
 ) -> Tuple[int, int, List[str]]:
     """
     Validates each item in a JSON array file against a JSON Schema.
+    Stops after max_errors failing items, if given.
     Returns (passed, failed, errors).
     """
-    with open(schema_path, 'r') as f:
-        schema = json.load(f)
+    mtime_ns = os.stat(schema_path).st_mtime_ns
+    validator = _load_validator_cached(schema_path, mtime_ns)
+    fast_check = _load_fast_validator_cached(schema_path, mtime_ns)
     
-    with open(data_path, 'r') as f:
-        data = json.load(f)
+    with open(data_path, 'rb') as f:
+        if ijson is not None and os.fstat(f.fileno()).st_size >= STREAM_THRESHOLD_BYTES:
+            if _first_token(f) != b"[":
+                data = _loads(f.read())
+                return (0, 1, [f"{data_path}: Expected array, got {type(data).__name__}"])
+            return _validate_items(ijson.items(f, 'item', use_float=True), validator, fast_check, item_label, max_errors)
+        data = _loads(f.read())
     
     if not isinstance(data, list):
         return (0, 1, [f"{data_path}: Expected array, got {type(data).__name__}"])
     
-    validator = Draft7Validator(schema)
+    return _validate_array(data, *_load_array_validators_cached(schema_path, mtime_ns), item_label, max_errors)
+
+
+def _item_id(item: Any, i: int) -> str:
+    return item.get("urn") or item.get("metric_id") or item.get("rule_id") or f"#{i}"
+
+
+def _validate_array(
+    data: List[Any],
+    array_validator: Draft7Validator,
+    fast_check: Optional[Callable[[Any], Any]],
+    item_label: str,
+    max_errors: Optional[int]
+) -> Tuple[int, int, List[str]]:
+    """
+    _validate_items for a loaded array: the whole list goes through one check,
+    and errors are grouped back to their items by absolute_path[0].
+    """
+    if fast_check is not None:
+        try:
+            fast_check(data)
+        except fastjsonschema.JsonSchemaException:
+            pass
+        else:
+            return (len(data), 0, [])
+    
+    failed = 0
+    last_index = -1
+    errors = []
+    # iter_errors yields items in order, so a new index means the previous item is done
+    for err in array_validator.iter_errors(data):
+        i = err.absolute_path[0]
+        if i != last_index:
+            if max_errors is not None and failed and failed >= max_errors:
+                break
+            failed += 1
+            last_index = i
+        errors.append(f"  {item_label} {_item_id(data[i], i)}: {err.message}")
+    
+    if max_errors is not None and failed and failed >= max_errors:
+        # Like the per-item loop, items after the last reported failure are not counted
+        return (last_index + 1 - failed, failed, errors)
+    return (len(data) - failed, failed, errors)
+
+
+def _validate_items(
+    items: Iterable[Any],
+    validator: Draft7Validator,
+    fast_check: Optional[Callable[[Any], Any]],
+    item_label: str,
+    max_errors: Optional[int]
+) -> Tuple[int, int, List[str]]:
     passed = 0
     failed = 0
     errors = []
     
-    for i, item in enumerate(data):
+    for i, item in enumerate(items):
+        if fast_check is not None:
+            # Generated code settles valid items; failures are re-run through
+            # Draft7Validator for the full error list
+            try:
+                fast_check(item)
+            except fastjsonschema.JsonSchemaException:
+                pass
+            else:
+                passed += 1
+                continue
         errs = list(validator.iter_errors(item))
         if errs:
             failed += 1
             for err in errs:
-                item_id = item.get("urn") or item.get("metric_id") or item.get("rule_id") or f"#{i}"
-                errors.append(f"  {item_label} {item_id}: {err.message}")
+                errors.append(f"  {item_label} {_item_id(item, i)}: {err.message}")
+            if max_errors is not None and failed >= max_errors:
+                break
         else:
             passed += 1
     
@@ -52,7 +207,11 @@ def validate_array_against_schema(
 
 
 def main():
-    root = sys.argv[1] if len(sys.argv) > 1 else os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Validate core ODGS JSON files against their meta-schemas.")
+    parser.add_argument("root", nargs="?", default=os.path.dirname(os.path.abspath(__file__)))
+    parser.add_argument("--max-errors", type=int, default=None, help="Stop each file after N failing items")
+    args = parser.parse_args()
+    root = args.root
     # Navigate from scripts/ to project root
     if "scripts" in root:
         root = os.path.join(root, "..", "..", "..", "..")
@@ -82,15 +241,24 @@ def main():
     print("ODGS Schema Validation Report")
     print("=" * 60)
     
-    for data_path, schema_path, label in validations:
+    # The files are independent, so they are read and validated concurrently;
+    # results are still reported in declaration order
+    with ThreadPoolExecutor(max_workers=len(validations)) as executor:
+        futures = [
+            executor.submit(validate_array_against_schema, data_path, schema_path, label, args.max_errors)
+            if os.path.exists(data_path) and os.path.exists(schema_path) else None
+            for data_path, schema_path, label in validations
+        ]
+    
+    for (data_path, schema_path, label), future in zip(validations, futures):
         if not os.path.exists(data_path):
             print(f"\n⚠️  SKIP: {data_path} not found")
             continue
-        if not os.path.exists(schema_path):
+        if future is None:
             print(f"\n⚠️  SKIP: {schema_path} not found")
             continue
         
-        passed, failed, errors = validate_array_against_schema(data_path, schema_path, label)
+        passed, failed, errors = future.result()
         total_passed += passed
         total_failed += failed
         all_errors.extend(errors)
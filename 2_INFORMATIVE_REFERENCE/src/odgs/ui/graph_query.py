@@ -1,9 +1,40 @@
+import hashlib
 import json
+import os
+import sys
+import tempfile
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from odgs.system.config import settings
 
+try:
+    import orjson  # optional accelerator: pip install odgs[fast]
+except ImportError:
+    orjson = None
+
+# --- SNAPSHOT CACHE ---
+# Bump when the loaded attributes change shape, so old snapshots are ignored
+_GRAPH_CACHE_VERSION = 9
+_GRAPH_CACHE_DIR = ".odgs"
+# Plane files read by _load_data, relative to 1_NORMATIVE_SPECIFICATION/schemas
+_PLANE_FILES = [
+    "legislative/standard_metrics.json",
+    "legislative/standard_dq_dimensions.json",
+    "legislative/ontology_graph.json",
+    "judiciary/standard_data_rules.json",
+    "judiciary/root_cause_factors.json",
+    "executive/context_bindings.json",
+    "executive/physical_data_map.json",
+    "executive/business_process_maps.json",
+]
+
+# Fields of a standard edge record; others are kept verbatim (see GovernanceGraph.edges)
+_EDGE_FIELDS = ("link_id", "source_urn", "target_urn", "relationship", "weight", "description")
+
 # --- CONSTANTS ---
 URN_PREFIX_METRIC = "urn:odgs:metric:"
 URN_PREFIX_RULE = "urn:odgs:rule:"
@@ -12,210 +43,505 @@ URN_PREFIX_DIM = "urn:odgs:dimension:"
 URN_PREFIX_PROCESS = "urn:odgs:process:"
 URN_PREFIX_FACTOR = "urn:odgs:factor:"
 
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, with orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity literals, huge integers: let json decide
+    return json.loads(raw)
+
+def _read_json(path) -> Any:
+    """Parse a JSON file (Path or str) from its bytes, with orjson when installed."""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+def _quick_has_urn(raw: bytes) -> bool:
+    """
+    False when the bytes cannot hold a "urn" key, so the file needs no parse.
+    Scans the whole file rather than a prefix: keys may come in any order.
+    """
+    return b'"urn"' in raw
+
+def _try_read_definition(path: str) -> Tuple[Any, Optional[Exception]]:
+    """
+    (data, None) or (None, error) for a sovereign definition file; (None, None)
+    for files without a "urn" key (bundles, schemas). Runs on worker threads.
+    """
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        if not _quick_has_urn(raw):
+            return None, None
+        return _loads(raw), None
+    except Exception as e:
+        return None, e
+
+def _iter_json(root: str):
+    """
+    Paths of the *.json files under root, in the order Path.rglob yields them
+    (each directory's files, then its subdirectories), from one scandir per
+    directory. Symlinked directories are not followed.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+        elif entry.name.endswith(".json") and "01-definitions-schema.json" not in entry.name:
+            yield entry.path
+    for subdir in subdirs:
+        yield from _iter_json(subdir)
+
 class GovernanceGraph:
     """
     In-memory graph engine for resolving Sovereign Lineage.
     Loads all 5 planes: Legislative, Judiciary, Executive, Sovereign, Physical.
+    With use_cache=True, unchanged inputs are restored from a snapshot in
+    <PROJECT_ROOT>/.odgs/ (written when the root is writable).
     """
-    def __init__(self):
+    def __init__(self, use_cache: bool = False):
         self.metrics = {}       # id -> dict
         self.rules = {}         # id -> dict
+        self._metric_urn = {}   # metric id -> interned metric URN
         self.definitions = {}   # urn -> dict
-        self.edges = []         # list of dicts
+        # Edges as parallel columns, one entry per edge (append via _add_edge)
+        self._edge_link_id = []
+        self._edge_src = []
+        self._edge_tgt = []
+        self._edge_rel = []     # relationship ids, see _rel_names
+        self._edge_weight = []
+        self._edge_desc = []
+        self._edge_raw = {}     # index -> dict, for records not shaped like _EDGE_FIELDS (e.g. comments)
+        self._rel_ids = {}      # relationship name -> id
+        self._rel_names = []    # id -> relationship name
+        self._seen_auto_edges = set()  # (link_id, source, target, relationship) of AUTO_ edges
+        # Adjacency indexes over the edges, in edge order
+        self._out = defaultdict(list)  # (source_urn, relationship id) -> [target_urn]
+        self._in = defaultdict(list)   # (target_urn, relationship id) -> [source_urn]
         self.dq_dimensions = {} # id -> dict
         self.context_bindings = []  # list of context dicts
         self.physical_maps = []     # list of mapping dicts
         self.business_processes = [] # list of lifecycle dicts
         self.root_cause_factors = [] # list of factor dicts
-        self._load_data()
+        self._context_by_id = {}    # context_id -> first context binding with it
+        self._physical_by_urn = {}  # concept_urn -> first physical map for it
+        self._def_by_segment = {}   # URN segment after urn:odgs:def: -> first definition with it
+        self._dim_metric_count = Counter()  # dimension id -> metrics naming it critical
+        self._dim_rule_count = Counter()    # dimension id -> rules improving it
+        self._compliance_df = None  # built on first get_compliance_matrix()
+        self._dq_df = None          # built on first get_dq_dimensions_df()
+        self._snapshot = self._snapshot_path() if use_cache else None
+        if not self._load_snapshot():
+            self._load_data()
+            self._save_snapshot()
+
+    # ─── SNAPSHOT CACHE ───
+    def _sovereign_dirs(self) -> List[Path]:
+        return [
+            settings.PROJECT_ROOT / "1_NORMATIVE_SPECIFICATION" / "schemas" / "sovereign",
+            settings.DRAFTS_DIR
+        ]
+
+    def _fingerprint(self) -> str:
+        """Digest of the stat signature of every input file (one stat each, no parsing)."""
+        schemas = settings.PROJECT_ROOT / "1_NORMATIVE_SPECIFICATION" / "schemas"
+        files = [str(schemas / rel) for rel in _PLANE_FILES]
+        for p in self._sovereign_dirs():
+            files.extend(_iter_json(str(p)))
+        h = hashlib.sha256(f"{_GRAPH_CACHE_VERSION}:{sys.version_info[:2]}:{settings.PROJECT_ROOT}".encode())
+        for path in files:
+            try:
+                st = os.stat(path)
+                h.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\0{st.st_ctime_ns}\n".encode())
+            except OSError:
+                h.update(f"{path}\0-\n".encode())
+        return h.hexdigest()[:32]
+
+    def _snapshot_path(self) -> Path:
+        """Snapshot file for the current inputs."""
+        return settings.PROJECT_ROOT / _GRAPH_CACHE_DIR / f"graph-{self._fingerprint()}.json"
+
+    def _load_snapshot(self) -> bool:
+        """
+        Restore the loaded state from a snapshot of unchanged inputs; False on a miss.
+        The snapshot is plain JSON data (never code), so a planted file can at
+        worst show wrong data, like an edited plane file would.
+        """
+        if self._snapshot is None:
+            return False
+        pristine = dict(self.__dict__)  # _restore_state only assigns new containers
+        try:
+            state = _read_json(self._snapshot)
+            if state["version"] != _GRAPH_CACHE_VERSION:
+                return False
+            self._restore_state(state)
+        except (OSError, ValueError, KeyError, TypeError, IndexError, AttributeError):
+            self.__dict__.update(pristine)
+            return False
+        return True
+
+    def _snapshot_state(self) -> Dict[str, Any]:
+        """
+        The loaded planes as JSON-ready data. Lookup indexes are rebuilt on
+        restore; rules (keyed by id and by URN) are stored once each. Dicts
+        keyed by plane ids are stored as [key, value] pairs: ids may be ints.
+        """
+        rule_list, rule_pos, rule_keys = [], {}, []
+        for key, rule in self.rules.items():
+            pos = rule_pos.get(id(rule))
+            if pos is None:
+                pos = rule_pos[id(rule)] = len(rule_list)
+                rule_list.append(rule)
+            rule_keys.append([key, pos])
+        return {
+            "version": _GRAPH_CACHE_VERSION,
+            "metrics": list(self.metrics.items()),
+            "rules": rule_list,
+            "rule_keys": rule_keys,
+            "definitions": self.definitions,
+            "dq_dimensions": list(self.dq_dimensions.items()),
+            "edges": [self._edge_link_id, self._edge_src, self._edge_tgt,
+                      self._edge_rel, self._edge_weight, self._edge_desc],
+            "edge_raw": [[i, edge] for i, edge in self._edge_raw.items()],
+            "rel_names": self._rel_names,
+            "seen_auto_edges": [list(key) for key in self._seen_auto_edges],
+            "context_bindings": self.context_bindings,
+            "physical_maps": self.physical_maps,
+            "business_processes": self.business_processes,
+            "root_cause_factors": self.root_cause_factors,
+        }
+
+    def _restore_state(self, state: Dict[str, Any]):
+        """Inverse of _snapshot_state: set the planes, then rebuild the derived indexes."""
+        self.metrics = {mid: m for mid, m in state["metrics"]}
+        self._metric_urn = {mid: sys.intern(f"{URN_PREFIX_METRIC}{mid}") for mid in self.metrics}
+        rule_list = state["rules"]
+        self.rules = {key: rule_list[pos] for key, pos in state["rule_keys"]}
+        self.definitions = state["definitions"]
+        self.dq_dimensions = {did: d for did, d in state["dq_dimensions"]}
+        link_ids, srcs, tgts, rels, weights, descs = state["edges"]
+        intern = lambda v: sys.intern(v) if type(v) is str else v
+        srcs = [intern(v) for v in srcs]
+        tgts = [intern(v) for v in tgts]
+        self._rel_names = [intern(v) for v in state["rel_names"]]
+        self._rel_ids = {name: i for i, name in enumerate(self._rel_names)}
+        self._edge_link_id, self._edge_src, self._edge_tgt = link_ids, srcs, tgts
+        self._edge_rel, self._edge_weight, self._edge_desc = rels, weights, descs
+        self._edge_raw = {i: edge for i, edge in state["edge_raw"]}
+        self._out, self._in = defaultdict(list), defaultdict(list)
+        for src, tgt, rel_id in zip(srcs, tgts, rels):
+            self._out[(src, rel_id)].append(tgt)
+            self._in[(tgt, rel_id)].append(src)
+        self._seen_auto_edges = {tuple(key) for key in state["seen_auto_edges"]}
+        self.context_bindings = state["context_bindings"]
+        self.physical_maps = state["physical_maps"]
+        self.business_processes = state["business_processes"]
+        self.root_cause_factors = state["root_cause_factors"]
+        self._context_by_id, self._physical_by_urn, self._def_by_segment = {}, {}, {}
+        self._dim_metric_count, self._dim_rule_count = Counter(), Counter()
+        self._build_indexes()
+
+    def _save_snapshot(self):
+        """Best-effort atomic write, skipped on a read-only root; stale snapshots (including old pickles) are removed."""
+        path = self._snapshot
+        if path is None:
+            return
+        try:
+            # json rather than orjson: NaN and 64-bit-plus integers must survive the round trip
+            data = json.dumps(self._snapshot_state(), separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+            for old in path.parent.glob("graph-*"):
+                if old != path and old.suffix in (".json", ".pkl"):
+                    old.unlink()
+        except (OSError, TypeError, ValueError):
+            pass
 
     def _load_data(self):
         """Load all JSON artifacts into memory."""
-        root = settings.PROJECT_ROOT
+        schemas = settings.PROJECT_ROOT / "1_NORMATIVE_SPECIFICATION" / "schemas"
+        # One stat per plane file up front; absent files are skipped rather than raised on
+        present = {rel for rel in _PLANE_FILES if (schemas / rel).is_file()}
 
         # ─── 1. LEGISLATIVE PLANE ───
-        leg_path = root / "1_NORMATIVE_SPECIFICATION" / "schemas" / "legislative"
-        if leg_path.exists():
-            # Metrics
+        # Metrics
+        if "legislative/standard_metrics.json" in present:
             try:
-                m_data = json.loads((leg_path / "standard_metrics.json").read_text())
+                m_data = _read_json(schemas / "legislative/standard_metrics.json")
                 for m in m_data:
                     self.metrics[m["metric_id"]] = m
+                    self._metric_urn[m["metric_id"]] = sys.intern(f"{URN_PREFIX_METRIC}{m['metric_id']}")
             except (json.JSONDecodeError, KeyError, OSError): pass
 
-            # DQ Dimensions
+        # DQ Dimensions
+        if "legislative/standard_dq_dimensions.json" in present:
             try:
-                dq_data = json.loads((leg_path / "standard_dq_dimensions.json").read_text())
+                dq_data = _read_json(schemas / "legislative/standard_dq_dimensions.json")
                 for d in dq_data:
                     self.dq_dimensions[d["id"]] = d
             except (json.JSONDecodeError, KeyError, OSError): pass
 
-            # Graph
+        # Graph
+        if "legislative/ontology_graph.json" in present:
             try:
-                g_data = json.loads((leg_path / "ontology_graph.json").read_text())
-                self.edges = g_data.get("graph_edges", [])
+                g_data = _read_json(schemas / "legislative/ontology_graph.json")
+                for edge in g_data.get("graph_edges", []):
+                    self._add_edge(edge)
             except (json.JSONDecodeError, KeyError, OSError): pass
 
         # ─── 2. JUDICIARY PLANE ───
-        jud_path = root / "1_NORMATIVE_SPECIFICATION" / "schemas" / "judiciary"
-        if (jud_path / "standard_data_rules.json").exists():
+        if "judiciary/standard_data_rules.json" in present:
             try:
-                r_data = json.loads((jud_path / "standard_data_rules.json").read_text())
+                r_data = _read_json(schemas / "judiciary/standard_data_rules.json")
                 for r in r_data:
                     rule_id = r.get("rule_id")
                     if rule_id:
                         self.rules[str(rule_id)] = r
-                        self.rules[f"{URN_PREFIX_RULE}{rule_id}"] = r
+                        self.rules[sys.intern(f"{URN_PREFIX_RULE}{rule_id}")] = r
             except Exception as e:
                 print(f"Error loading Rules: {e}")
 
         # Root Cause Factors
-        if (jud_path / "root_cause_factors.json").exists():
+        if "judiciary/root_cause_factors.json" in present:
             try:
-                self.root_cause_factors = json.loads(
-                    (jud_path / "root_cause_factors.json").read_text()
-                )
+                self.root_cause_factors = _read_json(schemas / "judiciary/root_cause_factors.json")
             except (json.JSONDecodeError, OSError): pass
 
         # ─── 3. EXECUTIVE PLANE ───
-        exec_path = root / "1_NORMATIVE_SPECIFICATION" / "schemas" / "executive"
-        if exec_path.exists():
-            # Context Bindings
+        # Context Bindings
+        if "executive/context_bindings.json" in present:
             try:
-                cb_data = json.loads((exec_path / "context_bindings.json").read_text())
+                cb_data = _read_json(schemas / "executive/context_bindings.json")
                 self.context_bindings = cb_data.get("contexts", [])
             except (json.JSONDecodeError, KeyError, OSError): pass
 
-            # Physical Data Map
+        # Physical Data Map
+        if "executive/physical_data_map.json" in present:
             try:
-                pm_data = json.loads((exec_path / "physical_data_map.json").read_text())
+                pm_data = _read_json(schemas / "executive/physical_data_map.json")
                 self.physical_maps = pm_data.get("mappings", [])
             except (json.JSONDecodeError, KeyError, OSError): pass
 
-            # Business Process Maps
+        # Business Process Maps
+        if "executive/business_process_maps.json" in present:
             try:
-                self.business_processes = json.loads(
-                    (exec_path / "business_process_maps.json").read_text()
-                )
+                self.business_processes = _read_json(schemas / "executive/business_process_maps.json")
             except (json.JSONDecodeError, OSError): pass
 
         # ─── 4. SOVEREIGN PLANE ───
-        paths = [
-            root / "1_NORMATIVE_SPECIFICATION" / "schemas" / "sovereign",
-            settings.DRAFTS_DIR
-        ]
-        for p in paths:
-            if p.exists():
-                for f in p.rglob("*.json"):
-                    if "01-definitions-schema.json" in f.name: continue
-                    try:
-                        data = json.loads(f.read_text())
-                        if "urn" not in data:
-                            continue
-                        def_urn = data["urn"]
-                        self.definitions[def_urn] = data
-                        for rel in data.get("relations", []):
-                            rel_type = rel.get("type", "")
-                            target = rel.get("target_urn", "")
-                            if not target: continue
-                            rel_map = {
-                                "isDefinedBy":  "IS_DEFINED_BY",
-                                "IS_DEFINED_BY": "IS_DEFINED_BY",
-                                "VALIDATED_BY": "VALIDATED_BY",
-                                "validatedBy":  "VALIDATED_BY",
-                                "DEFINES":      "IS_DEFINED_BY",
-                            }
-                            canonical = rel_map.get(rel_type, rel_type.upper())
-                            self.edges.append({
-                                "link_id":      f"AUTO_{def_urn}",
-                                "source_urn":   target,
-                                "target_urn":   def_urn,
-                                "relationship": canonical,
-                                "weight":       1.0,
-                                "description":  f"Auto-ingested from {f.name}",
-                            })
-                    except Exception as e:
-                        print(f"Error loading definition {f}: {e}")
+        all_paths = [f for p in self._sovereign_dirs() if p.exists() for f in _iter_json(str(p))]
+        # Read and parse concurrently; ingest in path order on this thread
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(all_paths)))) as executor:
+            for f, (data, error) in zip(all_paths, executor.map(_try_read_definition, all_paths)):
+                if error is not None:
+                    print(f"Error loading definition {f}: {error}")
+                    continue
+                if data is None:
+                    continue
+                try:
+                    self._ingest_definition(f, data)
+                except Exception as e:
+                    print(f"Error loading definition {f}: {e}")
 
         self._auto_link_dimensions()
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """Lookup tables over the loaded planes; the first entry for a key wins, as in a scan."""
+        for ctx in self.context_bindings:
+            if ctx.get("context_id"):
+                self._context_by_id.setdefault(ctx["context_id"], ctx)
+        for pm in self.physical_maps:
+            if pm.get("concept_urn"):
+                self._physical_by_urn.setdefault(pm["concept_urn"], pm)
+        # Each metric / rule counts once per dimension, however often it lists it
+        for m in self.metrics.values():
+            self._dim_metric_count.update(set(m.get("criticalDqDimensionIds", [])))
+        for r_id, r in self.rules.items():
+            if not r_id.startswith("urn:"):  # rules are keyed twice: by id and by URN
+                self._dim_rule_count.update(set(r.get("improvesDqDimensionIds", [])))
+        # Names sit before a version segment (urn:odgs:def:<authority>:<name>:<version>): index every segment
+        for urn, d in self.definitions.items():
+            for segment in urn.split(":")[3:]:
+                self._def_by_segment.setdefault(segment, d)
+
+    def _ingest_definition(self, path: str, data: Any):
+        """Register a sovereign definition and the edges implied by its relations."""
+        if "urn" not in data:
+            return
+        def_urn = data["urn"]
+        self.definitions[def_urn] = data
+        for rel in data.get("relations", []):
+            rel_type = rel.get("type", "")
+            target = rel.get("target_urn", "")
+            if not target: continue
+            rel_map = {
+                "isDefinedBy":  "IS_DEFINED_BY",
+                "IS_DEFINED_BY": "IS_DEFINED_BY",
+                "VALIDATED_BY": "VALIDATED_BY",
+                "validatedBy":  "VALIDATED_BY",
+                "DEFINES":      "IS_DEFINED_BY",
+            }
+            canonical = rel_map.get(rel_type, rel_type.upper())
+            self._add_auto_edge({
+                "link_id":      f"AUTO_{def_urn}",
+                "source_urn":   target,
+                "target_urn":   def_urn,
+                "relationship": canonical,
+                "weight":       1.0,
+                "description":  f"Auto-ingested from {os.path.basename(path)}",
+            })
+
+    def _add_auto_edge(self, edge: Dict[str, Any]):
+        """_add_edge for derived edges; a definition or link seen twice (drafts + sovereign, reload) adds one edge."""
+        key = (edge["link_id"], edge["source_urn"], edge["target_urn"], edge["relationship"])
+        if key in self._seen_auto_edges:
+            return
+        self._seen_auto_edges.add(key)
+        self._add_edge(edge)
+
+    def _add_edge(self, edge: Dict[str, Any]):
+        """Append an edge and index it by (source, relationship) and (target, relationship)."""
+        rel = edge.get("relationship")
+        rel_id = self._rel_ids.get(rel)
+        if rel_id is None:
+            rel_id = self._rel_ids[rel] = len(self._rel_names)
+            self._rel_names.append(sys.intern(rel) if type(rel) is str else rel)
+        src = edge.get("source_urn")
+        tgt = edge.get("target_urn")
+        # URNs repeat across edges, indexes and the plane dicts: keep one copy of each
+        if type(src) is str:
+            src = sys.intern(src)
+        if type(tgt) is str:
+            tgt = sys.intern(tgt)
+        if len(edge) != len(_EDGE_FIELDS) or any(field not in edge for field in _EDGE_FIELDS):
+            self._edge_raw[len(self._edge_src)] = edge
+        self._edge_link_id.append(edge.get("link_id"))
+        self._edge_src.append(src)
+        self._edge_tgt.append(tgt)
+        self._edge_rel.append(rel_id)
+        self._edge_weight.append(edge.get("weight"))
+        self._edge_desc.append(edge.get("description"))
+        self._out[(src, rel_id)].append(tgt)
+        self._in[(tgt, rel_id)].append(src)
+
+    @property
+    def edges(self) -> List[Dict[str, Any]]:
+        """All edges as dicts, in load order (built on access, for display and external callers)."""
+        rel_names = self._rel_names
+        raw = self._edge_raw
+        return [
+            raw[i] if i in raw else {
+                "link_id": link_id, "source_urn": src, "target_urn": tgt,
+                "relationship": rel_names[rel_id], "weight": weight, "description": desc,
+            }
+            for i, (link_id, src, tgt, rel_id, weight, desc) in enumerate(zip(
+                self._edge_link_id, self._edge_src, self._edge_tgt,
+                self._edge_rel, self._edge_weight, self._edge_desc))
+        ]
+
+    def get_targets(self, source_urn: str, relationship: str) -> List[str]:
+        """Target URNs of the edges leaving source_urn with this relationship, in edge order."""
+        rel_id = self._rel_ids.get(relationship)
+        return self._out.get((source_urn, rel_id), []) if rel_id is not None else []
+
+    def get_sources(self, target_urn: str, relationship: str) -> List[str]:
+        """Source URNs of the edges entering target_urn with this relationship, in edge order."""
+        rel_id = self._rel_ids.get(relationship)
+        return self._in.get((target_urn, rel_id), []) if rel_id is not None else []
 
     def _auto_link_dimensions(self):
         """Automatically add edges from metrics and rules to dimensions if not present."""
         for mid, metric in self.metrics.items():
             if not mid.startswith(URN_PREFIX_METRIC): continue
             for dim_id in metric.get("criticalDqDimensionIds", []):
-                t_urn = f"{URN_PREFIX_DIM}{dim_id}"
-                l_id = f"AUTO_M_{mid.split(':')[-1]}_D_{dim_id}"
-                self.edges.append({"link_id": l_id, "source_urn": mid, "target_urn": t_urn, "relationship": "CRITICAL_FOR", "weight": 1.0, "description": "Auto-linked Critical DQ Dimension"})
+                t_urn = sys.intern(f"{URN_PREFIX_DIM}{dim_id}")
+                l_id = f"AUTO_M_{mid.rpartition(':')[2]}_D_{dim_id}"
+                self._add_auto_edge({"link_id": l_id, "source_urn": mid, "target_urn": t_urn, "relationship": "CRITICAL_FOR", "weight": 1.0, "description": "Auto-linked Critical DQ Dimension"})
                 
         for rid, rule in self.rules.items():
             if not rid.startswith(URN_PREFIX_RULE): continue
             for dim_id in rule.get("improvesDqDimensionIds", []):
-                t_urn = f"{URN_PREFIX_DIM}{dim_id}"
-                l_id = f"AUTO_R_{rid.split(':')[-1]}_D_{dim_id}"
-                self.edges.append({"link_id": l_id, "source_urn": rid, "target_urn": t_urn, "relationship": "IMPROVES_DIMENSION", "weight": 1.0, "description": "Auto-linked Improves DQ Dimension"})
+                t_urn = sys.intern(f"{URN_PREFIX_DIM}{dim_id}")
+                l_id = f"AUTO_R_{rid.rpartition(':')[2]}_D_{dim_id}"
+                self._add_auto_edge({"link_id": l_id, "source_urn": rid, "target_urn": t_urn, "relationship": "IMPROVES_DIMENSION", "weight": 1.0, "description": "Auto-linked Improves DQ Dimension"})
 
     # ─── COMPLIANCE MATRIX ───
     def get_compliance_matrix(self) -> pd.DataFrame:
-        """Build the Status Table for all metrics."""
-        rows = []
-        for mid, m in self.metrics.items():
-            metric_urn = f"{URN_PREFIX_METRIC}{mid}"
-
-            linked_def = None
-            authority = "None"
-            status = "Naked"
-
-            for edge in self.edges:
-                if edge.get("source_urn") == metric_urn and edge.get("relationship") == "IS_DEFINED_BY":
-                    target = edge.get("target_urn")
-                    if target in self.definitions:
-                        linked_def = self.definitions[target]
-                        break
-                if edge.get("target_urn") == metric_urn and edge.get("relationship") == "DEFINES_METRIC":
-                     source = edge.get("source_urn")
-                     if source in self.definitions:
-                         linked_def = self.definitions[source]
-                         break
+        """The Status Table for all metrics (built once; callers get a shallow copy)."""
+        if self._compliance_df is None:
+            self._compliance_df = self._build_compliance_matrix()
+        return self._compliance_df.copy(deep=False)
 
+    def _build_compliance_matrix(self) -> pd.DataFrame:
+        """Build the Status Table for all metrics."""
+        metric_ids = list(self.metrics)
+        metrics = list(self.metrics.values())
+        metric_urns = [self._metric_urn[mid] for mid in metric_ids]
+
+        # Definition of each metric: the first IS_DEFINED_BY or DEFINES_METRIC edge
+        # (in edge order) linking it to a loaded definition
+        defined_by = self._rel_ids.get("IS_DEFINED_BY")
+        defines_metric = self._rel_ids.get("DEFINES_METRIC")
+        linked_defs = {}
+        for src, tgt, rel_id in zip(self._edge_src, self._edge_tgt, self._edge_rel):
+            if rel_id == defined_by and tgt in self.definitions:
+                linked_defs.setdefault(src, self.definitions[tgt])
+            elif rel_id == defines_metric and src in self.definitions:
+                linked_defs.setdefault(tgt, self.definitions[src])
+
+        authorities, statuses = [], []
+        for metric_urn in metric_urns:
+            linked_def = linked_defs.get(metric_urn)
             if linked_def:
                 authority = linked_def.get("metadata", {}).get("authority_id", "Unknown")
-                if authority == "AI_SYNTHETIC":
-                    status = "Draft (AI)"
-                else:
-                    status = "Sovereign"
-
-            # Resolve linked DQ dimensions
-            dq_ids = m.get("criticalDqDimensionIds", [])
-            dq_names = [self.dq_dimensions.get(did, {}).get("name", f"DQ-{did}") for did in dq_ids]
-
+                authorities.append(authority)
+                statuses.append("Draft (AI)" if authority == "AI_SYNTHETIC" else "Sovereign")
+            else:
+                authorities.append("None")
+                statuses.append("Naked")
+
+        # Resolve linked DQ dimensions
+        dq_ids = [m.get("criticalDqDimensionIds", []) for m in metrics]
+        dq_names = [
+            ", ".join(self.dq_dimensions.get(did, {}).get("name", f"DQ-{did}") for did in ids) if ids else "—"
+            for ids in dq_ids
+        ]
+        calc = [m.get("calculation_logic") or {} for m in metrics]
+
+        return pd.DataFrame({
+            "ID": metric_ids,
+            "Metric Name": [m.get("name") for m in metrics],
+            "Domain": [m.get("domain", "General") for m in metrics],
+            "Authority": authorities,
+            "Status": statuses,
+            "DQ Dims": [len(ids) for ids in dq_ids],
             # Count linked rules
-            linked_rules = sum(
-                1 for e in self.edges
-                if e.get("source_urn") == metric_urn and e.get("relationship") == "VALIDATED_BY"
-            )
-
-            rows.append({
-                "ID": mid,
-                "Metric Name": m.get("name"),
-                "Domain": m.get("domain", "General"),
-                "Authority": authority,
-                "Status": status,
-                "DQ Dims": len(dq_ids),
-                "Rules": linked_rules,
-                "_urn": metric_urn,
-                "_dq_names": ", ".join(dq_names) if dq_names else "—",
-                "_icon": m.get("icon", ""),
-                "_calc_abstract": (m.get("calculation_logic") or {}).get("abstract", "—"),
-                "_calc_sql": (m.get("calculation_logic") or {}).get("sql_standard", "—"),
-                "_calc_dax": (m.get("calculation_logic") or {}).get("dax_pattern", "—"),
-                "_definition": m.get("definition", ""),
-                "_interpretation": m.get("interpretation", ""),
-                "_example": m.get("example", ""),
-                "_industries": ", ".join(m.get("targetIndustries", [])),
-            })
-
-        return pd.DataFrame(rows)
+            "Rules": [len(self.get_targets(urn, "VALIDATED_BY")) for urn in metric_urns],
+            "_urn": metric_urns,
+            "_dq_names": dq_names,
+            "_icon": [m.get("icon", "") for m in metrics],
+            "_calc_abstract": [c.get("abstract", "—") for c in calc],
+            "_calc_sql": [c.get("sql_standard", "—") for c in calc],
+            "_calc_dax": [c.get("dax_pattern", "—") for c in calc],
+            "_definition": [m.get("definition", "") for m in metrics],
+            "_interpretation": [m.get("interpretation", "") for m in metrics],
+            "_example": [m.get("example", "") for m in metrics],
+            "_industries": [", ".join(m.get("targetIndustries", [])) for m in metrics],
+        })
 
     # ─── METRIC LINEAGE ───
     def get_metric_lineage(self, metric_id: str) -> Optional[Dict[str, Any]]:
@@ -224,40 +550,35 @@ class GovernanceGraph:
             return None
 
         metric = self.metrics[metric_id]
-        metric_urn = f"{URN_PREFIX_METRIC}{metric_id}"
+        metric_urn = self._metric_urn[metric_id]
 
         # Resolve Rules (VALIDATED_BY)
         enforcing_rules = []
-        for edge in self.edges:
-            if edge.get("source_urn") == metric_urn and edge.get("relationship") == "VALIDATED_BY":
-                rule_urn = edge.get("target_urn", "")
-                rule_id = rule_urn.replace(URN_PREFIX_RULE, "")
-                if rule_id in self.rules:
-                    enforcing_rules.append(self.rules[rule_id])
+        for rule_urn in self.get_targets(metric_urn, "VALIDATED_BY"):
+            rule_id = (rule_urn or "").replace(URN_PREFIX_RULE, "")
+            if rule_id in self.rules:
+                enforcing_rules.append(self.rules[rule_id])
 
         # Resolve Law (IS_DEFINED_BY)
         sovereign_def = None
-        for edge in self.edges:
-            if edge.get("source_urn") == metric_urn and edge.get("relationship") == "IS_DEFINED_BY":
-                 target = edge.get("target_urn")
-                 if target in self.definitions:
-                     sovereign_def = self.definitions[target]
-                     break
+        for target in self.get_targets(metric_urn, "IS_DEFINED_BY"):
+            if target in self.definitions:
+                sovereign_def = self.definitions[target]
+                break
 
         # Fuzzy Match for AI Drafts
         if not sovereign_def:
             target_name = metric.get("name", "").lower().replace(" ", "_")
-            for urn, d in self.definitions.items():
-                if target_name in urn:
-                    sovereign_def = d
-                    break
+            # A definition with the metric's name as a URN segment, else the first URN containing it
+            sovereign_def = self._def_by_segment.get(target_name)
+            if sovereign_def is None:
+                for urn, d in self.definitions.items():
+                    if target_name in urn:
+                        sovereign_def = d
+                        break
 
         # Resolve Physical Binding
-        physical_binding = None
-        for pm in self.physical_maps:
-            if pm.get("concept_urn") == metric_urn:
-                physical_binding = pm
-                break
+        physical_binding = self._physical_by_urn.get(metric_urn)
 
         # Resolve DQ Dimensions
         dq_ids = metric.get("criticalDqDimensionIds", [])
@@ -273,19 +594,17 @@ class GovernanceGraph:
 
     # ─── DQ DIMENSIONS ───
     def get_dq_dimensions_df(self) -> pd.DataFrame:
-        """Return all DQ dimensions as a DataFrame."""
+        """Return all DQ dimensions as a DataFrame (built once; callers get a shallow copy)."""
+        if self._dq_df is None:
+            self._dq_df = self._build_dq_dimensions_df()
+        return self._dq_df.copy(deep=False)
+
+    def _build_dq_dimensions_df(self) -> pd.DataFrame:
+        """Build the DQ dimensions table."""
         rows = []
         for did, d in self.dq_dimensions.items():
-            # Count linked metrics
-            linked_metrics = sum(
-                1 for m in self.metrics.values()
-                if did in m.get("criticalDqDimensionIds", [])
-            )
-            # Count linked rules
-            linked_rules = sum(
-                1 for r_id, r in self.rules.items()
-                if not r_id.startswith("urn:") and did in r.get("improvesDqDimensionIds", [])
-            )
+            linked_metrics = self._dim_metric_count[did]
+            linked_rules = self._dim_rule_count[did]
             rows.append({
                 "ID": did,
                 "Name": d.get("name", ""),
@@ -305,10 +624,7 @@ class GovernanceGraph:
     # ─── CONTEXT BINDINGS ───
     def get_context_for_process(self, process_urn: str) -> Optional[Dict[str, Any]]:
         """Find context binding for a process URN."""
-        for ctx in self.context_bindings:
-            if ctx.get("context_id") == process_urn:
-                return ctx
-        return None
+        return self._context_by_id.get(process_urn)
 
     def get_all_contexts(self) -> List[Dict[str, Any]]:
         """Return all context bindings."""
@@ -317,10 +633,7 @@ class GovernanceGraph:
     # ─── PHYSICAL MAP ───
     def get_physical_binding(self, metric_urn: str) -> Optional[Dict[str, Any]]:
         """Find physical data map for a metric."""
-        for pm in self.physical_maps:
-            if pm.get("concept_urn") == metric_urn:
-                return pm
-        return None
+        return self._physical_by_urn.get(metric_urn)
 
     # ─── BUSINESS PROCESSES ───
     def get_business_processes(self) -> List[Dict[str, Any]]:
@@ -331,19 +644,25 @@ class GovernanceGraph:
     def get_draft_bundles(self) -> Dict[str, List[Dict[str, Any]]]:
         """Group AI-generated definitions by bundle/industry."""
         bundles = {}
-        drafts_dir = settings.DRAFTS_DIR
-        if not drafts_dir.exists():
+        try:
+            with os.scandir(settings.DRAFTS_DIR) as it:
+                industry_dirs = [e for e in it if e.is_dir()]
+        except OSError:
             return bundles
-        for industry_dir in drafts_dir.iterdir():
-            if industry_dir.is_dir():
-                defs = []
-                for f in industry_dir.glob("*.json"):
-                    try:
-                        defs.append(json.loads(f.read_text()))
-                    except (json.JSONDecodeError, OSError):
-                        pass
-                if defs:
-                    bundles[industry_dir.name] = defs
+        for industry_dir in industry_dirs:
+            defs = []
+            try:
+                with os.scandir(industry_dir.path) as it:
+                    paths = [e.path for e in it if e.name.endswith(".json")]
+            except OSError:
+                continue
+            for f in paths:
+                try:
+                    defs.append(_read_json(f))
+                except (json.JSONDecodeError, OSError):
+                    pass
+            if defs:
+                bundles[industry_dir.name] = defs
         return bundles
 
     # ─── PHASE STATS ───
@@ -381,5 +700,14 @@ class GovernanceGraph:
         }
 
 
-# Singleton
-graph_engine = GovernanceGraph()
+# Singleton, built on first use so importing this module parses nothing
+@lru_cache(maxsize=None)
+def get_graph() -> GovernanceGraph:
+    """The shared GovernanceGraph; ODGS_GRAPH_CACHE=1 enables its snapshot cache."""
+    return GovernanceGraph(use_cache=os.getenv("ODGS_GRAPH_CACHE") == "1")
+
+def __getattr__(name: str):
+    # Keeps `from odgs.ui.graph_query import graph_engine` working
+    if name == "graph_engine":
+        return get_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
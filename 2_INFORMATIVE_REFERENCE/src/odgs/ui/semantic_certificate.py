@@ -403,12 +403,9 @@ def render_certificate_tab(graph_engine) -> None:
     sovereign_def = graph_engine.definitions[selected_urn]
 
     enforcing_rules = []
-    for edge in graph_engine.edges:
-        if (edge.get("source_urn") == selected_urn
-                and edge.get("relationship") == "VALIDATED_BY"):
-            rule_urn = edge.get("target_urn", "")
-            if rule_urn in graph_engine.rules:
-                enforcing_rules.append(graph_engine.rules[rule_urn])
+    for rule_urn in graph_engine.get_targets(selected_urn, "VALIDATED_BY"):
+        if rule_urn in graph_engine.rules:
+            enforcing_rules.append(graph_engine.rules[rule_urn])
 
     cert = build_semantic_certificate(sovereign_def, enforcing_rules)
 
@@ -458,11 +455,9 @@ def render_chain_tab(graph_engine) -> None:
     sovereign_def = graph_engine.definitions[selected_urn]
 
     enforcing_rules = [
-        graph_engine.rules[edge.get("target_urn", "")]
-        for edge in graph_engine.edges
-        if (edge.get("source_urn") == selected_urn
-            and edge.get("relationship") == "VALIDATED_BY"
-            and edge.get("target_urn") in graph_engine.rules)
+        graph_engine.rules[rule_urn]
+        for rule_urn in graph_engine.get_targets(selected_urn, "VALIDATED_BY")
+        if rule_urn in graph_engine.rules
     ]
     cert = build_semantic_certificate(sovereign_def, enforcing_rules)
     render_chain_of_trust(cert)
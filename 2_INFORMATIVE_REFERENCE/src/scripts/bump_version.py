@@ -14,15 +14,30 @@ FILES = {
     "init": os.path.join(REPO_ROOT, "src", "odgs", "__init__.py")
 }
 
+# The [project] table runs from its header to the next table header (or EOF);
+# only its own version key is rewritten, never a version in another table
+_PROJECT_TABLE = re.compile(r'^\[project\][ \t]*$.*?(?=^[ \t]*\[|\Z)', re.M | re.S)
+_PROJECT_VERSION = re.compile(r'^(version[ \t]*=[ \t]*)"[^"\n]*"', re.M)
+_INIT_VERSION = re.compile(r'^__version__\s*=.*$', re.M)
+
+def _set_project_version(content, new_version):
+    """pyproject.toml text with [project].version replaced; everything else is kept byte for byte."""
+    table = _PROJECT_TABLE.search(content)
+    if table is None:
+        raise ValueError("pyproject.toml has no [project] table")
+    section, count = _PROJECT_VERSION.subn(rf'\g<1>"{new_version}"', table.group(0), count=1)
+    if count == 0:
+        raise ValueError("pyproject.toml [project] table has no version")
+    return content[:table.start()] + section + content[table.end():]
+
 def bump_version(new_version):
     print(f"🚀 Bumping ODGS Protocol to version: {new_version}")
 
-    # 1. Update pyproject.toml
-    # Pattern: version = "x.y.z"
+    # 1. Update pyproject.toml ([project].version only)
     with open(FILES["pyproject"], "r") as f:
         content = f.read()
     
-    new_content = re.sub(r'version = "[0-9]+\.[0-9]+\.[0-9]+"', f'version = "{new_version}"', content)
+    new_content = _set_project_version(content, new_version)
     
     with open(FILES["pyproject"], "w") as f:
         f.write(new_content)
@@ -44,22 +59,15 @@ def bump_version(new_version):
     # We might need to add a __version__ variable if it doesn't exist
     init_path = FILES["init"]
     with open(init_path, "r") as f:
-        init_lines = f.readlines()
+        init_source = f.read()
     
-    # Check if __version__ exists
-    version_line_index = -1
-    for i, line in enumerate(init_lines):
-        if line.startswith("__version__"):
-            version_line_index = i
-            break
-            
-    if version_line_index != -1:
-        init_lines[version_line_index] = f'__version__ = "{new_version}"\n'
-    else:
-        init_lines.append(f'\n__version__ = "{new_version}"\n')
+    version_line = f'__version__ = "{new_version}"'
+    init_source, count = _INIT_VERSION.subn(lambda _: version_line, init_source, count=1)
+    if count == 0:
+        init_source += f"\n{version_line}\n"
         
     with open(init_path, "w") as f:
-        f.writelines(init_lines)
+        f.write(init_source)
     print(f"  ✅ Updated src/odgs/__init__.py")
     
     print("\n✨ Version Lock Complete.")
@@ -1,22 +1,73 @@
 import json
 import re
 import os
+import sys
+from pathlib import Path
+
+try:
+    import orjson  # optional accelerator: pip install odgs[fast]
+except ImportError:
+    orjson = None
+
+# Add the src directory to Python path (scripts are inside src/scripts now, so src is ..)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from odgs.system.json_io import write_json
 
 # Paths relative to project root
 DIMENSIONS_PATH = "../1_NORMATIVE_SPECIFICATION/schemas/legislative/standard_dq_dimensions.json"
 RULES_PATH = "../1_NORMATIVE_SPECIFICATION/schemas/judiciary/standard_data_rules.json"
 FACTORS_PATH = "../1_NORMATIVE_SPECIFICATION/schemas/judiciary/root_cause_factors.json"
 
+# orjson reads integers beyond 64 bits as floats; json keeps them exact
+_LONG_DIGITS = re.compile(rb'\d{19}')
+
+def load_json(path):
+    raw = Path(path).read_bytes()
+    if orjson is not None and not _LONG_DIGITS.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity literals, huge integers: let json decide
+    return json.loads(raw)
+
+def dump_json(path, data):
+    # Same bytes as json.dump(data, f, indent=2), keys in file order
+    write_json(path, data)
+
+_NON_ALNUM = re.compile(r'[^a-zA-Z0-9\s]')
+_SPACES = re.compile(r'\s+')
+# str.translate table deleting the ASCII characters _NON_ALNUM matches
+_ASCII_DROP = {c: None for c in range(128) if not (chr(c).isalnum() or chr(c).isspace())}
+
 def to_kebab_case(name):
     # Remove special chars and swap spaces for dashes
-    name = re.sub(r'[^a-zA-Z0-9\s]', '', name)
-    return re.sub(r'\s+', '-', name).lower()
+    name = name.translate(_ASCII_DROP) if name.isascii() else _NON_ALNUM.sub('', name)
+    return _SPACES.sub('-', name).lower()
+
+def _migrate_rule(rule, id_to_urn):
+    """A v3.2 copy of a v3.0 rule: urn for rule_id, dimension URNs for dimension IDs."""
+    migrated = {k: v for k, v in rule.items() if k not in ('rule_id', 'improvesDqDimensionIds')}
+
+    # 1. Transform ID to URN
+    if 'rule_id' in rule:
+        migrated['urn'] = f"urn:odgs:rule:{rule['rule_id']}"
+
+    # 2. Transform Dimension Links
+    if 'improvesDqDimensionIds' in rule:
+        new_urns = []
+        for pid in rule['improvesDqDimensionIds']:
+            if pid in id_to_urn:
+                new_urns.append(id_to_urn[pid])
+            else:
+                print(f"Warning: Rule {rule.get('name')} refers to unknown Dimension ID {pid}")
+        migrated['related_dimension_urns'] = new_urns
+    return migrated
 
 def migrate():
     print(f"Loading Dimensions from {DIMENSIONS_PATH}...")
     try:
-        with open(DIMENSIONS_PATH, 'r') as f:
-            dimensions = json.load(f)
+        dimensions = load_json(DIMENSIONS_PATH)
     except FileNotFoundError:
         print(f"Error: Could not find {DIMENSIONS_PATH}")
         return
@@ -40,29 +91,8 @@ def migrate():
 
     print("Migrating Rules...")
     try:
-        with open(RULES_PATH, 'r') as f:
-            rules = json.load(f)
-        
-        for rule in rules:
-            # 1. Transform ID to URN
-            if 'rule_id' in rule:
-                rule['urn'] = f"urn:odgs:rule:{rule['rule_id']}"
-                del rule['rule_id']
-            
-            # 2. Transform Dimension Links
-            if 'improvesDqDimensionIds' in rule:
-                new_urns = []
-                for pid in rule['improvesDqDimensionIds']:
-                    if pid in id_to_urn:
-                        new_urns.append(id_to_urn[pid])
-                    else:
-                        print(f"Warning: Rule {rule.get('name')} refers to unknown Dimension ID {pid}")
-                
-                rule['related_dimension_urns'] = new_urns
-                del rule['improvesDqDimensionIds']
-
-        with open(RULES_PATH, 'w') as f:
-            json.dump(rules, f, indent=2)
+        rules = [_migrate_rule(rule, id_to_urn) for rule in load_json(RULES_PATH)]
+        dump_json(RULES_PATH, rules)
         print(f"Updated {RULES_PATH}")
             
     except FileNotFoundError:
@@ -70,8 +100,7 @@ def migrate():
 
     print("Migrating Factors...")
     try:
-        with open(FACTORS_PATH, 'r') as f:
-            factors = json.load(f)
+        factors = load_json(FACTORS_PATH)
             
         for factor in factors:
             if 'dqDimensionsImpactedDamaIds' in factor:
@@ -85,8 +114,7 @@ def migrate():
                 factor['related_dimension_urns'] = new_urns
                 del factor['dqDimensionsImpactedDamaIds']
                 
-        with open(FACTORS_PATH, 'w') as f:
-            json.dump(factors, f, indent=2)
+        dump_json(FACTORS_PATH, factors)
         print(f"Updated {FACTORS_PATH}")
 
     except FileNotFoundError:
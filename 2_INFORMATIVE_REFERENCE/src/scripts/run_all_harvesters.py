@@ -8,13 +8,16 @@ Usage:
 """
 import sys
 import os
-import json
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add the src directory to Python path (scripts are inside src/scripts now, so src is ..)
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+from odgs.system.json_io import json_bytes
+
 OUTPUT_BASE = os.path.join(os.path.dirname(__file__), "..", "..", "..", "1_NORMATIVE_SPECIFICATION", "schemas", "sovereign")
 
 def save_definition(definition: dict, authority_subdir: str) -> str:
@@ -37,14 +40,19 @@ def save_definition(definition: dict, authority_subdir: str) -> str:
         filename = urn.replace(":", "_") + ".json"
 
     path = os.path.join(save_dir, filename)
-    with open(path, "w") as f:
-        json.dump(definition, f, indent=2, ensure_ascii=False)
+    # Same bytes as json.dump(indent=2, ensure_ascii=False), encoded once
+    payload = json_bytes(definition, ensure_ascii=False)
+    # Write-then-rename so a concurrent or interrupted run never leaves a torn file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
     return path
 
 
-def harvest_gdpr():
+def harvest_gdpr(log=print):
     """Harvest all GDPR articles (static)."""
-    print("\n═══ GDPR Harvester ═══")
+    log("\n═══ GDPR Harvester ═══")
     from odgs.harvester.blueprints.gdpr import GDPRHarvester
     h = GDPRHarvester(output_dir=OUTPUT_BASE)
     articles = ["5", "6", "17", "25", "30", "35", "83"]
@@ -53,16 +61,16 @@ def harvest_gdpr():
         try:
             defn = h.harvest(art)
             path = save_definition(defn, "eu_gdpr")
-            print(f"  ✅ Art. {art}: {defn['metadata'].get('document_ref', '')} → {os.path.basename(path)}")
+            log(f"  ✅ Art. {art}: {defn['metadata'].get('document_ref', '')} → {os.path.basename(path)}")
             count += 1
         except Exception as e:
-            print(f"  ❌ Art. {art}: {e}")
+            log(f"  ❌ Art. {art}: {e}")
     return count
 
 
-def harvest_iso_42001():
+def harvest_iso_42001(log=print):
     """Harvest all ISO 42001 clauses (static)."""
-    print("\n═══ ISO 42001 Harvester ═══")
+    log("\n═══ ISO 42001 Harvester ═══")
     from odgs.harvester.blueprints.iso_42001 import ISO42001Harvester
     h = ISO42001Harvester(output_dir=OUTPUT_BASE)
     clauses = ["4.1", "4.2", "6.1", "8.4", "9.1", "10.2"]
@@ -71,16 +79,16 @@ def harvest_iso_42001():
         try:
             defn = h.harvest(clause)
             path = save_definition(defn, "iso")
-            print(f"  ✅ Clause {clause}: {defn.get('interpretation', {}).get('summary', '')} → {os.path.basename(path)}")
+            log(f"  ✅ Clause {clause}: {defn.get('interpretation', {}).get('summary', '')} → {os.path.basename(path)}")
             count += 1
         except Exception as e:
-            print(f"  ❌ Clause {clause}: {e}")
+            log(f"  ❌ Clause {clause}: {e}")
     return count
 
 
-def harvest_basel():
+def harvest_basel(log=print):
     """Harvest all Basel III/IV concepts (static)."""
-    print("\n═══ Basel III/IV Harvester ═══")
+    log("\n═══ Basel III/IV Harvester ═══")
     from odgs.harvester.blueprints.basel import BaselHarvester
     h = BaselHarvester(output_dir=OUTPUT_BASE)
     concepts = ["CET1", "LCR", "NSFR", "LeverageRatio", "FRTB", "IRRBB", "OpRisk"]
@@ -89,16 +97,16 @@ def harvest_basel():
         try:
             defn = h.harvest(concept)
             path = save_definition(defn, "bis_bcbs")
-            print(f"  ✅ {concept}: {defn.get('interpretation', {}).get('summary', '')} → {os.path.basename(path)}")
+            log(f"  ✅ {concept}: {defn.get('interpretation', {}).get('summary', '')} → {os.path.basename(path)}")
             count += 1
         except Exception as e:
-            print(f"  ❌ {concept}: {e}")
+            log(f"  ❌ {concept}: {e}")
     return count
 
 
-def harvest_nl_awb():
+def harvest_nl_awb(log=print):
     """Harvest Dutch AwB articles (live XML from wetten.overheid.nl)."""
-    print("\n═══ NL AwB Harvester (LIVE) ═══")
+    log("\n═══ NL AwB Harvester (LIVE) ═══")
     from odgs.harvester.blueprints.nl_awb import AwBHarvester
     h = AwBHarvester(output_dir=OUTPUT_BASE)
     articles = ["1:3", "3:4", "4:8"]
@@ -107,16 +115,16 @@ def harvest_nl_awb():
         try:
             defn = h.harvest(art)
             path = save_definition(defn, "nl_gov")
-            print(f"  ✅ Art. {art} → {os.path.basename(path)}")
+            log(f"  ✅ Art. {art} → {os.path.basename(path)}")
             count += 1
         except Exception as e:
-            print(f"  ❌ Art. {art}: {e}")
+            log(f"  ❌ Art. {art}: {e}")
     return count
 
 
-def harvest_fibo():
+def harvest_fibo(log=print):
     """Harvest FIBO concepts (live JSON-LD from edmcouncil.org)."""
-    print("\n═══ FIBO Harvester (LIVE) ═══")
+    log("\n═══ FIBO Harvester (LIVE) ═══")
     from odgs.harvester.blueprints.fibo import FIBOHarvester
     h = FIBOHarvester(output_dir=OUTPUT_BASE)
     concepts = [
@@ -128,10 +136,10 @@ def harvest_fibo():
         try:
             defn = h.harvest(concept)
             path = save_definition(defn, "fibo")
-            print(f"  ✅ {concept} → {os.path.basename(path)}")
+            log(f"  ✅ {concept} → {os.path.basename(path)}")
             count += 1
         except Exception as e:
-            print(f"  ❌ {concept}: {e}")
+            log(f"  ❌ {concept}: {e}")
     return count
 
 
@@ -142,14 +150,17 @@ if __name__ == "__main__":
 
     total = 0
 
-    # Static harvesters first (guaranteed to work)
-    total += harvest_gdpr()
-    total += harvest_iso_42001()
-    total += harvest_basel()
-
-    # Live harvesters (network-dependent)
-    total += harvest_nl_awb()
-    total += harvest_fibo()
+    # Static harvesters first (guaranteed to work), then live ones (network-dependent).
+    # All run concurrently so the live round-trips overlap; each buffers its report,
+    # printed in this order.
+    harvesters = (harvest_gdpr, harvest_iso_42001, harvest_basel, harvest_nl_awb, harvest_fibo)
+    logs = [[] for _ in harvesters]
+    with ThreadPoolExecutor(max_workers=len(harvesters)) as executor:
+        futures = [executor.submit(fn, log.append) for fn, log in zip(harvesters, logs)]
+        for future, log in zip(futures, logs):
+            count = future.result()
+            print("\n".join(log))
+            total += count
 
     print("\n" + "=" * 60)
     print(f"🏁 COMPLETE: {total} sovereign definitions harvested.")
@@ -0,0 +1,66 @@
+"""
+ODGS CLI Tests
+Machine-readable output of `odgs enforce --quiet`.
+"""
+import os
+import sys
+import json
+import shutil
+import logging
+import tempfile
+import unittest
+from unittest import mock
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+src_path = os.path.join(project_root, "src")
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from typer.testing import CliRunner
+
+from odgs.executive import interceptor
+from odgs.system.adapters.git_log_adapter import GitAuditLogger
+from odgs.system.cli import app
+
+
+class TestEnforceQuiet(unittest.TestCase):
+    """enforce --quiet prints exactly one JSON line on stdout, whatever else goes wrong."""
+
+    def setUp(self) -> None:
+        # An empty project: every plane file is missing, which the interceptor reports
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        real_init = interceptor.OdgsInterceptor.__init__
+
+        def _init(obj, project_root_path=None):
+            real_init(obj, project_root_path or self.root)
+
+        git_logger = GitAuditLogger(self.root)
+        self.addCleanup(git_logger._close_log)
+        self.addCleanup(git_logger.flush)
+        for patcher in (
+            mock.patch.object(interceptor.OdgsInterceptor, "__init__", _init),
+            mock.patch.object(interceptor, "git_logger", git_logger),
+            mock.patch.object(interceptor.audit_logger, "handlers", [logging.NullHandler()]),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _stdout_status(self, *args: str) -> dict:
+        result = CliRunner().invoke(app, ["enforce", "--quiet", *args])
+        lines = result.stdout.splitlines()
+        self.assertEqual(len(lines), 1, result.stdout)
+        return json.loads(lines[0])
+
+    def test_01_single_line_with_missing_artifacts(self) -> None:
+        status = self._stdout_status("-p", "O2C_S03", "-d", '{"container_id": "BICU1234567"}')
+        self.assertIn(status["status"], ("granted", "blocked", "security_alert", "error"))
+
+    def test_02_single_line_on_invalid_json(self) -> None:
+        status = self._stdout_status("-p", "O2C_S03", "-d", "{not json")
+        self.assertEqual(status["status"], "error")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
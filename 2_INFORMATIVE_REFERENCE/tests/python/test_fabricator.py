@@ -0,0 +1,83 @@
+"""
+ODGS Fabricator Tests
+fabricate_batch yields the same shape of contexts with and without NumPy.
+"""
+import os
+import re
+import sys
+import unittest
+from unittest import mock
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+src_path = os.path.join(project_root, "src")
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from odgs.system.scripts import fabricator
+
+ISO_6346 = re.compile(r"[A-Z]{4}\d{7}")
+SHIPMENT_ID = re.compile(r"SHP_\d{4}")
+
+
+class FabricatedBatchChecks:
+    """Shared checks; subclasses pick the NumPy or pure-Python path."""
+
+    N = 200
+
+    def _records(self, scenario: str):
+        batch = fabricator.fabricate_batch(self.N, scenario)
+        self.assertIsInstance(batch, fabricator.FabricatedBatch)
+        self.assertEqual(len(batch), self.N)
+        records = list(batch.to_records())
+        self.assertEqual(len(records), self.N)
+        for record in records:
+            self.assertTrue(all(type(v) is str for v in record.values()), record)
+            self.assertRegex(record["shipment_id"], SHIPMENT_ID)
+            self.assertIn(record["origin_port"], fabricator._ORIGIN_PORTS)
+            self.assertIn(record["destination_port"], fabricator._DESTINATION_PORTS)
+        return records
+
+    def test_01_valid(self) -> None:
+        for record in self._records("valid"):
+            self.assertEqual(list(record), list(fabricator.fabricate_data_context("valid")))
+            self.assertTrue(ISO_6346.fullmatch(record["container_id"]), record)
+
+    def test_02_invalid_format(self) -> None:
+        for record in self._records("invalid_format"):
+            self.assertEqual(len(record["container_id"]), 10)
+            self.assertTrue(set(record["container_id"]) <= set(fabricator._INVALID_ALPHABET))
+
+    def test_03_missing_field(self) -> None:
+        for record in self._records("missing_field"):
+            self.assertEqual(list(record), list(fabricator.fabricate_data_context("missing_field")))
+
+    def test_04_empty(self) -> None:
+        batch = fabricator.fabricate_batch(0)
+        self.assertEqual((len(batch), list(batch.to_records())), (0, []))
+
+
+@unittest.skipIf(fabricator.np is None, "numpy not installed")
+class TestFabricateBatchNumpy(FabricatedBatchChecks, unittest.TestCase):
+    """Columns are NumPy arrays."""
+
+    def test_05_numpy_columns(self) -> None:
+        batch = fabricator.fabricate_batch(3)
+        self.assertTrue(all(isinstance(c, fabricator.np.ndarray) for c in batch.columns.values()))
+
+
+class TestFabricateBatchPython(FabricatedBatchChecks, unittest.TestCase):
+    """Columns are lists when NumPy is unavailable."""
+
+    def setUp(self) -> None:
+        patcher = mock.patch.object(fabricator, "np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_05_list_columns(self) -> None:
+        batch = fabricator.fabricate_batch(3)
+        self.assertTrue(all(isinstance(c, list) for c in batch.columns.values()))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,96 @@
+"""
+ODGS Fast CLI Tests
+Exit codes and output of the argparse `odgs-fast` entry point.
+"""
+import io
+import os
+import sys
+import json
+import shutil
+import logging
+import tempfile
+import unittest
+from unittest import mock
+from contextlib import redirect_stdout, redirect_stderr
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+src_path = os.path.join(project_root, "src")
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from odgs.system import fast_cli
+from odgs.system.scripts.hashing import generate_project_hash, SCHEMA_FILES
+
+REPO_ROOT = os.path.dirname(project_root)
+PACKAGE_ROOT = os.path.join(src_path, "odgs")
+
+
+def _run(argv):
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        code = fast_cli.main(argv)
+    return code, out.getvalue(), err.getvalue()
+
+
+class TestFastCli(unittest.TestCase):
+    """odgs-fast hash / enforce."""
+
+    def test_01_hash_prints_master_hash(self) -> None:
+        code, out, _ = _run(["hash", "--root", REPO_ROOT])
+        self.assertEqual(code, 0)
+        self.assertEqual(out.strip(), generate_project_hash(REPO_ROOT)["master_hash"])
+
+    def test_02_hash_verify(self) -> None:
+        """--verify exits 1 without a registry or on a mismatch, 0 on a match."""
+        root = tempfile.mkdtemp()
+        try:
+            for rel_path in SCHEMA_FILES:
+                dst = os.path.join(root, rel_path)
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                shutil.copyfile(os.path.join(REPO_ROOT, rel_path), dst)
+            self.assertEqual(_run(["hash", "--root", root, "--verify"])[0], 1)
+
+            registry_path = os.path.join(root, "registry.json")
+            with open(registry_path, "w") as f:
+                json.dump({"latest_verified_hash": "0" * 64}, f)
+            self.assertEqual(_run(["hash", "--root", root, "--verify"])[0], 1)
+
+            with open(registry_path, "w") as f:
+                json.dump({"latest_verified_hash": generate_project_hash(root)["master_hash"]}, f)
+            self.assertEqual(_run(["hash", "--root", root, "--verify"])[0], 0)
+        finally:
+            shutil.rmtree(root)
+
+    def test_03_enforce(self) -> None:
+        """Rule 2021 on O2C_S03: a valid container passes, a bad one is a Hard Stop."""
+        from odgs.executive import interceptor
+        from odgs.system.adapters.git_log_adapter import GitAuditLogger
+
+        # A copy of the packaged planes, so audit logs land in the copy, not the repo
+        root = tempfile.mkdtemp()
+        try:
+            for plane in ("legislative", "judiciary", "executive"):
+                shutil.copytree(os.path.join(PACKAGE_ROOT, plane), os.path.join(root, plane),
+                                ignore=shutil.ignore_patterns("*.py", "__pycache__"))
+            git_logger = GitAuditLogger(root)
+            with mock.patch.object(interceptor, "git_logger", git_logger), \
+                    mock.patch.object(interceptor.audit_logger, "handlers", [logging.NullHandler()]):
+                code, out, _ = _run(["enforce", "--root", root, "-p", "O2C_S03", "-d", '{"container_id": "BICU1234567"}'])
+                self.assertEqual((code, out.strip().splitlines()[-1]), (0, "ACCESS GRANTED"))
+
+                code, _, err = _run(["enforce", "--root", root, "-p", "O2C_S03", "-d", '{"container_id": "BAD-ID"}'])
+                self.assertEqual(code, 1)
+                self.assertIn("HARD STOP", err)
+
+                code, _, err = _run(["enforce", "--root", root, "-p", "O2C_S03", "-d", "{not json"])
+                self.assertEqual(code, 1)
+                self.assertIn("Invalid JSON", err)
+                git_logger.flush()
+                git_logger._close_log()
+            self.assertTrue(os.listdir(os.path.join(root, "audit_logs")))
+        finally:
+            shutil.rmtree(root)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,152 @@
+"""
+ODGS Git Audit Logger Tests
+Covers buffered file appends and batched commits against a temporary
+git repository.
+"""
+import os
+import gc
+import sys
+import shutil
+import weakref
+import tempfile
+import unittest
+from unittest import mock
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+src_path = os.path.join(project_root, "src")
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from odgs.system.adapters import git_log_adapter
+from odgs.system.adapters.git_log_adapter import GitAuditLogger
+
+
+@unittest.skipUnless(git_log_adapter.HAS_GIT_PYTHON, "GitPython not installed")
+class TestGitAuditLogger(unittest.TestCase):
+    """Batching tests against an isolated repository."""
+
+    def setUp(self) -> None:
+        import git
+        self.repo_path = tempfile.mkdtemp()
+        repo = git.Repo.init(self.repo_path)
+        with repo.config_writer() as cw:
+            cw.set_value("user", "name", "odgs-test")
+            cw.set_value("user", "email", "odgs-test@example.invalid")
+        self.logger = GitAuditLogger(self.repo_path)
+        self.logger.MAX_WAIT_SECONDS = 60
+
+    def tearDown(self) -> None:
+        self.logger.flush()
+        self.logger._close_log()
+        shutil.rmtree(self.repo_path)
+
+    def _log_lines(self) -> int:
+        total = 0
+        for name in os.listdir(self.logger.log_dir):
+            with open(os.path.join(self.logger.log_dir, name)) as f:
+                total += sum(1 for _ in f)
+        return total
+
+    def _commit_count(self) -> int:
+        try:
+            return sum(1 for _ in self.logger.repo.iter_commits())
+        except ValueError:
+            return 0
+
+    def test_01_entries_committed_on_flush(self) -> None:
+        """Entries are buffered; flush() writes them out and commits once."""
+        for i in range(3):
+            self.assertIsNone(self.logger.write_entry({"event_id": str(i), "outcome": "ALLOWED"}))
+        self.assertEqual(self._commit_count(), 0)
+
+        commit_hash = self.logger.flush()
+        self.assertIsNotNone(commit_hash)
+        self.assertEqual(self._log_lines(), 3)
+        self.assertEqual(self._commit_count(), 1)
+        self.assertTrue(self.logger.repo.head.commit.message.startswith("Audit batch: 3 entries"))
+        self.assertIsNone(self.logger.flush())
+
+    def test_02_batch_size_triggers_commit(self) -> None:
+        """Reaching BATCH_SIZE commits without an explicit flush."""
+        self.logger.BATCH_SIZE = 2
+        self.assertIsNone(self.logger.write_entry({"event_id": "a", "outcome": "ALLOWED"}))
+        self.assertIsNotNone(self.logger.write_entry({"event_id": "b", "outcome": "BLOCKED"}))
+        self.assertEqual(self._commit_count(), 1)
+
+    def test_03_single_entry_message(self) -> None:
+        """A batch of one keeps the per-event commit message."""
+        self.logger.write_entry({"event_id": "e1", "outcome": "BLOCKED"})
+        self.logger.flush()
+        self.assertEqual(self.logger.repo.head.commit.message.strip(), "Audit: BLOCKED [Event: e1]")
+
+    def test_04_timer_flush(self) -> None:
+        """Pending entries are committed once MAX_WAIT_SECONDS elapses."""
+        self.logger.MAX_WAIT_SECONDS = 0.05
+        self.logger.write_entry({"event_id": "t", "outcome": "ALLOWED"})
+        timer = self.logger._timer
+        self.assertIsNotNone(timer)
+        timer.join(timeout=5)
+        self.assertEqual(self._commit_count(), 1)
+
+    def test_05_index_untouched(self) -> None:
+        """Audit commits leave other staged work out and `git status` clean for the logs."""
+        repo = self.logger.repo
+        other = os.path.join(self.repo_path, "staged.txt")
+        with open(other, "w") as f:
+            f.write("work in progress\n")
+        repo.git.add(other)
+
+        self.logger.write_entry({"event_id": "e1", "outcome": "ALLOWED"})
+        self.logger.write_entry({"event_id": "e2", "outcome": "ALLOWED"})
+        self.logger.flush()
+
+        committed = [item.path for item in repo.head.commit.tree.traverse()]
+        self.assertNotIn("staged.txt", committed)
+        self.assertTrue(any(p.startswith("audit_logs/") for p in committed))
+        status = repo.git.status("--porcelain")
+        self.assertIn("A  staged.txt", status)
+        self.assertNotIn("audit_logs", status)
+
+    def test_06_exit_hook_flushes_without_pinning(self) -> None:
+        """The module's exit hook commits pending entries, and holds loggers only weakly."""
+        self.logger.write_entry({"event_id": "x", "outcome": "ALLOWED"})
+        git_log_adapter._flush_live_loggers()
+        self.assertEqual(self._commit_count(), 1)
+
+        discarded = GitAuditLogger(self.repo_path)
+        ref = weakref.ref(discarded)
+        del discarded
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+@unittest.skipUnless(git_log_adapter.HAS_GIT_PYTHON, "GitPython not installed")
+class TestGitAuditLoggerNoIdentity(unittest.TestCase):
+    """Audit commits in a repo with no user.name / user.email anywhere (containers, CI)."""
+
+    def test_01_commits_with_default_identity(self) -> None:
+        import git
+        home = tempfile.mkdtemp()
+        env = {k: v for k, v in os.environ.items()
+               if not k.startswith(("GIT_AUTHOR_", "GIT_COMMITTER_")) and k != "EMAIL"}
+        env.update({"HOME": home, "XDG_CONFIG_HOME": home, "GIT_CONFIG_NOSYSTEM": "1",
+                    "GIT_CONFIG_GLOBAL": os.devnull})
+        try:
+            with mock.patch.dict(os.environ, env, clear=True):
+                repo = git.Repo.init(os.path.join(home, "repo"))
+                with repo.config_writer() as cw:
+                    cw.set_value("user", "useConfigOnly", "true")  # no hostname guess either
+                logger = GitAuditLogger(repo.working_tree_dir)
+                logger.write_entry({"event_id": "ci", "outcome": "ALLOWED"})
+                self.assertIsNotNone(logger.flush())
+                logger._close_log()
+                author = repo.head.commit.author
+                self.assertEqual((author.name, author.email),
+                                 (GitAuditLogger.DEFAULT_AUTHOR_NAME, GitAuditLogger.DEFAULT_AUTHOR_EMAIL))
+        finally:
+            shutil.rmtree(home)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
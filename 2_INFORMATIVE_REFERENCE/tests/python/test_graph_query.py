@@ -0,0 +1,194 @@
+"""
+ODGS Governance Graph Tests
+Snapshot cache of the loaded planes, metric lineage and the compliance matrix.
+"""
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+src_path = os.path.join(project_root, "src")
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from odgs.system.config import settings
+from odgs.ui import graph_query
+from odgs.ui.graph_query import GovernanceGraph
+
+METRICS = [
+    {"metric_id": "MRR", "name": "Monthly Recurring Revenue", "domain": "Finance",
+     "criticalDqDimensionIds": [1]},
+    {"metric_id": "CHURN", "name": "Churn Rate", "domain": "Customer"},
+]
+DIMENSIONS = [{"id": 1, "name": "Accuracy"}]
+
+
+class GraphTestCase(unittest.TestCase):
+    """A throwaway PROJECT_ROOT holding the legislative plane files."""
+
+    def setUp(self) -> None:
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+        self.schemas = self.root / "1_NORMATIVE_SPECIFICATION" / "schemas"
+        self.write_plane("legislative/standard_metrics.json", METRICS)
+        self.write_plane("legislative/standard_dq_dimensions.json", DIMENSIONS)
+        for name, value in (("PROJECT_ROOT", self.root), ("DRAFTS_DIR", self.root / "data" / "drafts")):
+            patcher = mock.patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def write_plane(self, rel: str, data) -> None:
+        path = self.schemas / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2))
+
+    def write_definition(self, urn: str, authority: str) -> None:
+        path = self.schemas / "sovereign" / authority.lower() / f"{urn.rpartition(':')[2]}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"urn": urn, "metadata": {"authority_id": authority},
+                                    "content": {"verbatim_text": "..."}}))
+
+    def snapshots(self):
+        return sorted((self.root / ".odgs").glob("graph-*.json"))
+
+
+class TestGraphSnapshot(GraphTestCase):
+    """use_cache=True restores unchanged inputs from .odgs/; the default never touches it."""
+
+    def _graph(self, use_cache=True):
+        with mock.patch.object(GovernanceGraph, "_load_data", autospec=True,
+                               side_effect=GovernanceGraph._load_data) as load_data:
+            graph = GovernanceGraph(use_cache=use_cache)
+        return graph, load_data.called
+
+    def test_01_off_by_default(self) -> None:
+        graph, parsed = self._graph(use_cache=False)
+        self.assertTrue(parsed)
+        self.assertFalse((self.root / ".odgs").exists())
+        self.assertEqual(list(graph.metrics), ["MRR", "CHURN"])
+
+    def test_02_miss_then_hit(self) -> None:
+        cold, parsed = self._graph()
+        self.assertTrue(parsed)
+        self.assertEqual(len(self.snapshots()), 1)
+
+        warm, parsed = self._graph()
+        self.assertFalse(parsed)
+        self.assertEqual(warm.metrics, cold.metrics)
+        self.assertEqual(warm.dq_dimensions, cold.dq_dimensions)  # int ids survive
+        self.assertEqual(warm.edges, cold.edges)
+        self.assertEqual(warm.get_targets("urn:odgs:metric:MRR", "CRITICAL_FOR"),
+                         cold.get_targets("urn:odgs:metric:MRR", "CRITICAL_FOR"))
+
+    def test_03_changed_input_invalidates(self) -> None:
+        self._graph()
+        old = self.snapshots()
+        self.write_plane("legislative/standard_metrics.json", METRICS[:1])
+
+        graph, parsed = self._graph()
+        self.assertTrue(parsed)
+        self.assertEqual(list(graph.metrics), ["MRR"])
+        new = self.snapshots()
+        self.assertEqual(len(new), 1)
+        self.assertNotEqual(new, old)
+
+    def test_04_read_only_root_is_skipped_quietly(self) -> None:
+        with mock.patch.object(graph_query.tempfile, "mkstemp", side_effect=PermissionError):
+            graph, parsed = self._graph()
+        self.assertTrue(parsed)
+        self.assertEqual(self.snapshots(), [])
+        self.assertEqual(list(graph.metrics), ["MRR", "CHURN"])
+
+
+class TestMetricLineage(GraphTestCase):
+    """get_metric_lineage resolves rules, law, physical binding and DQ dimensions."""
+
+    LAW = "urn:odgs:def:eu:revenue:v1"
+
+    def setUp(self) -> None:
+        super().setUp()
+        mrr = "urn:odgs:metric:MRR"
+        self.write_plane("judiciary/standard_data_rules.json", [
+            {"rule_id": "R1", "name": "Non-negative"}, {"rule_id": "R2", "name": "Currency set"}])
+        self.write_plane("executive/physical_data_map.json", {"mappings": [
+            {"concept_urn": mrr, "table": "fact_revenue"}]})
+        self.write_plane("legislative/ontology_graph.json", {"graph_edges": [
+            {"source_urn": mrr, "target_urn": "urn:odgs:rule:R2", "relationship": "VALIDATED_BY"},
+            {"source_urn": mrr, "target_urn": "urn:odgs:rule:MISSING", "relationship": "VALIDATED_BY"},
+            {"source_urn": mrr, "target_urn": "urn:odgs:rule:R1", "relationship": "VALIDATED_BY"},
+            {"source_urn": mrr, "target_urn": self.LAW, "relationship": "IS_DEFINED_BY"},
+        ]})
+        self.write_definition(self.LAW, "EU")
+        self.write_definition("urn:odgs:def:ai_synthetic:churn_rate:v1", "AI_SYNTHETIC")
+        self.graph = GovernanceGraph()
+
+    def test_01_linked_metric(self) -> None:
+        lineage = self.graph.get_metric_lineage("MRR")
+        self.assertEqual(lineage["metric"]["name"], "Monthly Recurring Revenue")
+        self.assertEqual([r["rule_id"] for r in lineage["rules"]], ["R2", "R1"])
+        self.assertEqual(lineage["definition"]["urn"], self.LAW)
+        self.assertEqual(lineage["physical"]["table"], "fact_revenue")
+        self.assertEqual(lineage["dq_dimensions"], DIMENSIONS)
+
+    def test_02_draft_found_by_metric_name(self) -> None:
+        lineage = self.graph.get_metric_lineage("CHURN")
+        self.assertEqual(lineage["definition"]["urn"], "urn:odgs:def:ai_synthetic:churn_rate:v1")
+        self.assertEqual((lineage["rules"], lineage["physical"], lineage["dq_dimensions"]), ([], None, []))
+
+    def test_03_unknown_metric(self) -> None:
+        self.assertIsNone(self.graph.get_metric_lineage("NOPE"))
+
+
+class TestComplianceMatrix(GraphTestCase):
+    """Status Table: the first defining edge wins, columns are plain strings."""
+
+    LAW = "urn:odgs:def:eu:gdpr:art_4"
+    DRAFT = "urn:odgs:def:ai_synthetic:mrr:v1"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.write_definition(self.LAW, "EU")
+        self.write_definition(self.DRAFT, "AI_SYNTHETIC")
+
+    def _matrix(self, edges):
+        self.write_plane("legislative/ontology_graph.json", {"graph_edges": edges})
+        return GovernanceGraph().get_compliance_matrix().set_index("ID")
+
+    def test_01_first_edge_wins_across_relationships(self) -> None:
+        mrr = "urn:odgs:metric:MRR"
+        defines = {"source_urn": self.DRAFT, "target_urn": mrr, "relationship": "DEFINES_METRIC"}
+        defined_by = {"source_urn": mrr, "target_urn": self.LAW, "relationship": "IS_DEFINED_BY"}
+
+        matrix = self._matrix([defines, defined_by])
+        self.assertEqual(matrix.loc["MRR", "Authority"], "AI_SYNTHETIC")
+        self.assertEqual(matrix.loc["MRR", "Status"], "Draft (AI)")
+
+        matrix = self._matrix([defined_by, defines])
+        self.assertEqual(matrix.loc["MRR", "Authority"], "EU")
+        self.assertEqual(matrix.loc["MRR", "Status"], "Sovereign")
+
+    def test_02_unlinked_metric_is_naked(self) -> None:
+        dangling = {"source_urn": "urn:odgs:metric:CHURN", "target_urn": "urn:odgs:def:eu:missing:v1",
+                    "relationship": "IS_DEFINED_BY"}
+        matrix = self._matrix([dangling])
+        self.assertEqual((matrix.loc["CHURN", "Authority"], matrix.loc["CHURN", "Status"]), ("None", "Naked"))
+
+    def test_03_plain_string_columns(self) -> None:
+        matrix = self._matrix([])
+        plain = pd.Series(["Finance"]).dtype  # object, or str on pandas 3
+        for column in ("Domain", "Authority", "Status"):
+            self.assertNotIsInstance(matrix[column].dtype, pd.CategoricalDtype, column)
+            self.assertEqual(matrix[column].dtype, plain, column)
+        self.assertEqual(matrix.loc["MRR", "Domain"], "Finance")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
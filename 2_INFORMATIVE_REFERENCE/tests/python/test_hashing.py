@@ -0,0 +1,195 @@
+"""
+ODGS Governance Hash Tests
+The schema hash is an integrity contract: whichever serializer is
+installed, it must equal SHA-256 over json.dumps(sort_keys=True,
+separators=(',', ':')).
+"""
+import os
+import sys
+import enum
+import json
+import datetime
+import shutil
+import hashlib
+import tempfile
+import unittest
+from unittest import mock
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+src_path = os.path.join(project_root, "src")
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from odgs.system.scripts import hashing
+
+REPO_ROOT = os.path.dirname(project_root)
+
+
+def _reference_hash(raw: bytes) -> str:
+    canonical = json.dumps(json.loads(raw), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class TestGovernanceHash(unittest.TestCase):
+    """Fast-path hashes must match the reference canonicalization."""
+
+    SAMPLES = [
+        b'{"b": 1, "a": [true, false, null], "c": {"z": "", "y": -0.0}}',
+        b'{"ratio": 0.95, "tiny": 1e-05, "edge": 0.0001, "big": 1e16, "max": 1.7976931348623157e308}',
+        b'{"text": "Beleidsregel \\u2014 art. 4:8 Awb", "emoji": "\\ud83d\\ude00", "del": "\\u007f", "sep": "\\u2028"}',
+        b'{"\\u00e9t\\u00e9": 1, "ete": 2, "Zeta": 3}',
+        b'{"hex": "3e5a0e12", "urn": "urn:odgs:1e5", "ints": [9223372036854775807, -9223372036854775808]}',
+        b'[NaN, Infinity, 123456789012345678901234567890]',
+        b'{"over": [18446744073709551616, -9223372036854775809], "u64": 18446744073709551615}',
+        b'1e-05',
+        b'1e16',
+        b'-0.00001',
+    ]
+
+    def test_01_samples_match_reference(self) -> None:
+        """Tricky floats, escapes and key orders hash like json.dumps."""
+        for raw in self.SAMPLES:
+            with self.subTest(raw=raw):
+                self.assertEqual(hashing._hash_schema_bytes(raw), _reference_hash(raw))
+
+    def test_01b_wide_integers_not_collapsed(self) -> None:
+        """Distinct integers beyond 64 bits keep distinct hashes."""
+        a = hashing._hash_schema_bytes(b'{"limit": 18446744073709551616}')
+        b = hashing._hash_schema_bytes(b'{"limit": 18446744073709551617}')
+        self.assertNotEqual(a, b)
+        self.assertEqual(a, _reference_hash(b'{"limit": 18446744073709551616}'))
+
+    def test_01c_bom_is_invalid_json(self) -> None:
+        """A leading UTF-8 BOM is rejected, as with the text-mode json.load baseline."""
+        with self.assertRaises(json.JSONDecodeError):
+            hashing._hash_schema_bytes(b'\xef\xbb\xbf{"a": 1}')
+
+    def test_02_project_hash_independent_of_orjson(self) -> None:
+        """generate_project_hash is identical with and without orjson."""
+        fast = hashing.generate_project_hash(REPO_ROOT, use_cache=False)
+        saved, hashing.orjson = hashing.orjson, None
+        try:
+            slow = hashing.generate_project_hash(REPO_ROOT, use_cache=False)
+        finally:
+            hashing.orjson = saved
+        self.assertEqual(fast, slow)
+        self.assertNotIn("MISSING_FILE", fast["components"].values())
+
+    def test_03_canonical_files_hash_unchanged(self) -> None:
+        """canonicalize_file keeps the hash; edits are still detected."""
+        root = tempfile.mkdtemp()
+        try:
+            for rel_path in hashing.SCHEMA_FILES:
+                src = os.path.join(REPO_ROOT, rel_path)
+                dst = os.path.join(root, rel_path)
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                shutil.copyfile(src, dst)
+            before = hashing.generate_project_hash(root)
+
+            for rel_path in hashing.SCHEMA_FILES:
+                hashing.canonicalize_file(os.path.join(root, rel_path))
+            self.assertEqual(hashing.generate_project_hash(root), before)
+            self.assertEqual(hashing.generate_project_hash(root, strict_canonical=True), before)
+            with mock.patch.object(hashing, "_hash_schema_bytes", side_effect=AssertionError("parsed")):
+                self.assertEqual(hashing.generate_project_hash(root, use_cache=False), before)
+
+            # Same content, different bytes: the sidecar no longer matches, parse path applies
+            target = os.path.join(root, "1_NORMATIVE_SPECIFICATION/schemas/judiciary/root_cause_factors.json")
+            with open(target) as f:
+                data = json.load(f)
+            with open(target, "w") as f:
+                json.dump(data, f, indent=4)
+            self.assertEqual(hashing.generate_project_hash(root), before)
+
+            with open(target, "w") as f:
+                json.dump({"tampered": True}, f)
+            self.assertNotEqual(hashing.generate_project_hash(root)["master_hash"], before["master_hash"])
+        finally:
+            shutil.rmtree(root)
+
+    def test_04_stat_cache(self) -> None:
+        """With use_cache, unchanged files come from the cache; edits with a restored mtime do not."""
+        root = tempfile.mkdtemp()
+        try:
+            for rel_path in hashing.SCHEMA_FILES:
+                dst = os.path.join(root, rel_path)
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                shutil.copyfile(os.path.join(REPO_ROOT, rel_path), dst)
+            before = hashing.generate_project_hash(root, use_cache=True)
+            self.assertTrue(os.path.exists(os.path.join(root, hashing.HASH_CACHE_PATH)))
+
+            with mock.patch.object(hashing, "_hash_one", side_effect=AssertionError("cache miss")):
+                self.assertEqual(hashing.generate_project_hash(root, use_cache=True), before)
+            # The cache is opt-in: the default never reads it
+            with mock.patch.object(hashing, "_load_cache", side_effect=AssertionError("cache read")):
+                self.assertEqual(hashing.generate_project_hash(root), before)
+
+            # Same size, same mtime, different content
+            target = os.path.join(root, "1_NORMATIVE_SPECIFICATION/schemas/judiciary/root_cause_factors.json")
+            st = os.stat(target)
+            with open(target, "rb") as f:
+                raw = f.read()
+            with open(target, "wb") as f:
+                f.write(raw.replace(b"[", b" ", 1) if raw.startswith(b"[") else raw.replace(b"{", b" ", 1))
+            os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))
+            after = hashing.generate_project_hash(root, use_cache=True)
+            self.assertEqual(after["components"]["root_cause_factors.json"], "INVALID_JSON")
+        finally:
+            shutil.rmtree(root)
+
+    @unittest.skipIf(hashing.blake3 is None, "blake3 not installed")
+    def test_05_blake3_algo(self) -> None:
+        """algo="blake3" digests the same canonical bytes and never reuses SHA-256 cache entries."""
+        root = tempfile.mkdtemp()
+        try:
+            for rel_path in hashing.SCHEMA_FILES:
+                dst = os.path.join(root, rel_path)
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                shutil.copyfile(os.path.join(REPO_ROOT, rel_path), dst)
+            sha = hashing.generate_project_hash(root, use_cache=True)
+            b3 = hashing.generate_project_hash(root, use_cache=True, algo="blake3")
+            self.assertNotEqual(b3["master_hash"], sha["master_hash"])
+
+            rel_path = "1_NORMATIVE_SPECIFICATION/schemas/legislative/standard_metrics.json"
+            with open(os.path.join(root, rel_path), "rb") as f:
+                canonical = hashing._canonical_bytes(f.read())
+            self.assertEqual(b3["components"]["standard_metrics.json"], hashing.blake3.blake3(canonical).hexdigest())
+            self.assertEqual(hashing.generate_project_hash(root, use_cache=True), sha)
+
+            # Canonical files stream through both digests without being parsed
+            for rel_path in hashing.SCHEMA_FILES:
+                hashing.canonicalize_file(os.path.join(root, rel_path))
+            with mock.patch.object(hashing, "_hash_schema_bytes", side_effect=AssertionError("parsed")):
+                self.assertEqual(hashing.generate_project_hash(root, use_cache=False, algo="blake3"), b3)
+        finally:
+            shutil.rmtree(root)
+
+    def test_06_unknown_algo(self) -> None:
+        """Unsupported algorithms are rejected before any file is read."""
+        with self.assertRaises(ValueError):
+            hashing.generate_project_hash(REPO_ROOT, algo="md5")
+
+    def test_07_python_objects_match_reference(self) -> None:
+        """get_deterministic_json_hash on non-JSON-decoded data still hashes like json.dumps."""
+        class Level(enum.IntEnum):
+            HIGH = 1
+        samples = [
+            {"b": (1, 2.5), "a": None},
+            {3: "int keys", 1: True},
+            {"nan": float("nan"), "inf": float("-inf")},
+            {"level": Level.HIGH, "ratio": 1e-7, "big": 2 ** 70},
+            ["Beleidsregel \u2014 art. 4:8", "\U0001f600"],
+        ]
+        for data in samples:
+            with self.subTest(data=data):
+                canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
+                self.assertEqual(hashing.get_deterministic_json_hash(data),
+                                 hashlib.sha256(canonical.encode('utf-8')).hexdigest())
+        with mock.patch("builtins.print"):
+            self.assertEqual(hashing.get_deterministic_json_hash({"at": datetime.date(2026, 1, 1)}),
+                             "ERROR_NON_SERIALIZABLE")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,69 @@
+"""
+ODGS JSON Output Tests
+json_io writes the same bytes as json.dumps(indent=2) with and without orjson.
+"""
+import os
+import sys
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+src_path = os.path.join(project_root, "src")
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from odgs.system import json_io
+
+SAMPLES = [
+    {"metric": "MRR", "value": float("nan")},
+    {"limits": [float("inf"), -float("inf")]},
+    {"threshold": 1e16, "epsilon": 1e-7, "ratio": 0.00001, "plain": 0.25},
+    {"name": "Umsatz für Kunden — €", "ctrl": "\x7f\x01", "emoji": "\U0001F4C8"},
+    {"nested": {"empty": {}, "list": []}, "flag": True, "missing": None},
+    {1: "int key", "big": 2 ** 70},
+    [],
+    "scalar",
+]
+
+
+class TestJsonBytes(unittest.TestCase):
+    """Both paths match json.dumps(obj, indent=2, ensure_ascii=...) byte for byte."""
+
+    def _assert_matches_stdlib(self) -> None:
+        for obj in SAMPLES:
+            for ensure_ascii in (True, False):
+                with self.subTest(obj=obj, ensure_ascii=ensure_ascii):
+                    expected = json.dumps(obj, indent=2, ensure_ascii=ensure_ascii).encode("utf-8")
+                    self.assertEqual(json_io.json_bytes(obj, ensure_ascii), expected)
+
+    @unittest.skipIf(json_io.orjson is None, "orjson not installed")
+    def test_01_with_orjson(self) -> None:
+        self._assert_matches_stdlib()
+
+    def test_02_without_orjson(self) -> None:
+        with mock.patch.object(json_io, "orjson", None):
+            self._assert_matches_stdlib()
+
+    @unittest.skipIf(json_io.orjson is None, "orjson not installed")
+    def test_03_orjson_declines_drifting_output(self) -> None:
+        self.assertIsNone(json_io._orjson_bytes({"x": float("nan")}, True))
+        self.assertIsNone(json_io._orjson_bytes({"x": 1e16}, True))
+        self.assertIsNotNone(json_io._orjson_bytes({"x": 1.5}, True))
+
+    def test_04_write_json_round_trip(self) -> None:
+        obj = {"value": 1e16, "label": "Ausfälle"}
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        json_io.write_json(path, obj)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), json.dumps(obj, indent=2).encode("utf-8"))
+        with open(path) as f:
+            self.assertEqual(json.load(f), obj)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
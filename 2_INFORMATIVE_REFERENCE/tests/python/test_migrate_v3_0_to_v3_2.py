@@ -0,0 +1,52 @@
+"""
+ODGS v3.0 -> v3.2 Migration Tests
+The rewritten rule and factor files keep json.dump(indent=2) bytes.
+"""
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+import importlib.util
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+src_path = os.path.join(project_root, "src")
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+_spec = importlib.util.spec_from_file_location(
+    "migrate_v3_0_to_v3_2", os.path.join(src_path, "scripts", "migrate_v3_0_to_v3_2.py"))
+migrate_script = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(migrate_script)
+
+
+class TestMigrationJson(unittest.TestCase):
+    """load_json/dump_json round-trip what json.load/json.dump would."""
+
+    def setUp(self) -> None:
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.path = os.path.join(self.root, "standard_data_rules.json")
+
+    def test_01_round_trip_nan_and_exponent_floats(self) -> None:
+        rules = [{"rule_id": 7, "name": "Zählerstand", "threshold": float("nan"),
+                  "tolerance": 1e16, "epsilon": 1e-7, "id": 2 ** 70}]
+        with open(self.path, "w") as f:
+            json.dump(rules, f, indent=2)
+        with open(self.path, "rb") as f:
+            original = f.read()
+
+        migrate_script.dump_json(self.path, migrate_script.load_json(self.path))
+
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), original)
+        loaded = migrate_script.load_json(self.path)
+        self.assertNotEqual(loaded[0]["threshold"], loaded[0]["threshold"])  # still NaN
+        self.assertEqual(loaded[0]["tolerance"], 1e16)
+        self.assertEqual(loaded[0]["id"], 2 ** 70)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
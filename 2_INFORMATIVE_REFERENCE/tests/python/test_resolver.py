@@ -0,0 +1,117 @@
+"""
+ODGS Sovereign Resolver Tests
+Covers pinned, time-travel and standard-schema resolution against a
+temporary data root, including cache invalidation on file change.
+"""
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from datetime import date
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+src_path = os.path.join(project_root, "src")
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from odgs.core.resolver import SovereignResolver, LegalAmbiguityError, ResourceNotFoundError
+
+
+class TestSovereignResolver(unittest.TestCase):
+    """Resolution tests against an isolated data root."""
+
+    def setUp(self) -> None:
+        self.data_root = tempfile.mkdtemp()
+        self._write("sovereign/def/nl_gov_awb_v2020.json", {"urn": "urn:odgs:def:nl_gov:awb:v2020"})
+        self._write("sovereign/def/nl_gov_awb_v2024.06.json", {"urn": "urn:odgs:def:nl_gov:awb:v2024.06"})
+        self._write("legislative/standard_metrics.json", [
+            {"metric_id": "101", "name": "Revenue"},
+            {"urn": "urn:odgs:metric:churn", "metric_id": "102", "name": "Churn"},
+        ])
+        self.resolver = SovereignResolver(self.data_root)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.data_root)
+
+    def _write(self, rel_path: str, payload) -> str:
+        path = os.path.join(self.data_root, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(payload, f)
+        return path
+
+    def test_01_pinned_version(self) -> None:
+        """A versioned URN resolves to its exact file."""
+        result = self.resolver.resolve("urn:odgs:def:nl_gov:awb:v2020")
+        self.assertEqual(result["urn"], "urn:odgs:def:nl_gov:awb:v2020")
+
+    def test_02_naked_urn_requires_date(self) -> None:
+        """A versionless URN without a date is legally ambiguous."""
+        with self.assertRaises(LegalAmbiguityError):
+            self.resolver.resolve("urn:odgs:def:nl_gov:awb")
+
+    def test_03_time_travel(self) -> None:
+        """The latest version effective on the requested date is chosen."""
+        old = self.resolver.resolve("urn:odgs:def:nl_gov:awb", as_of_date=date(2023, 1, 1))
+        new = self.resolver.resolve("urn:odgs:def:nl_gov:awb", as_of_date=date(2025, 1, 1))
+        self.assertEqual(old["urn"], "urn:odgs:def:nl_gov:awb:v2020")
+        self.assertEqual(new["urn"], "urn:odgs:def:nl_gov:awb:v2024.06")
+
+    def test_04_time_travel_before_first_version(self) -> None:
+        """No version effective on the date raises ResourceNotFoundError."""
+        with self.assertRaises(ResourceNotFoundError):
+            self.resolver.resolve("urn:odgs:def:nl_gov:awb", as_of_date=date(2019, 1, 1))
+
+    def test_05_standard_schema_fallback(self) -> None:
+        """Metrics resolve by explicit URN or by legacy metric_id."""
+        by_id = self.resolver.resolve("urn:odgs:metric:101", force_latest=True)
+        by_urn = self.resolver.resolve("urn:odgs:metric:churn", force_latest=True)
+        self.assertEqual(by_id["name"], "Revenue")
+        self.assertEqual(by_urn["name"], "Churn")
+        with self.assertRaises(ResourceNotFoundError):
+            self.resolver.resolve("urn:odgs:metric:999", force_latest=True)
+
+    def test_06_cache_invalidated_on_change(self) -> None:
+        """Rewriting a file is picked up despite the parse cache."""
+        self.resolver.resolve("urn:odgs:def:nl_gov:awb:v2020")
+        path = self._write("sovereign/def/nl_gov_awb_v2020.json", {"urn": "changed"})
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        result = self.resolver.resolve("urn:odgs:def:nl_gov:awb:v2020")
+        self.assertEqual(result["urn"], "changed")
+
+    def test_07_warm_start(self) -> None:
+        """Cache warming runs in the background and leaves resolution unchanged."""
+        resolver = SovereignResolver(self.data_root, warm=True)
+        resolver._warm_thread.join(timeout=5)
+        self.assertFalse(resolver._warm_thread.is_alive())
+        result = resolver.resolve("urn:odgs:def:nl_gov:awb", as_of_date=date(2025, 1, 1))
+        self.assertEqual(result["urn"], "urn:odgs:def:nl_gov:awb:v2024.06")
+
+    def test_08_context_binding_windows(self) -> None:
+        """Context bindings honour effective_from / effective_until."""
+        self._write("executive/context_bindings.json", {"contexts": [
+            {"context_id": "ctx", "rules": ["old"], "effective_from": "2020-01-01", "effective_until": "2023-12-31"},
+            {"context_id": "ctx", "rules": ["new"], "effective_from": "2024-01-01", "effective_until": None},
+        ]})
+        self.assertEqual(self.resolver.resolve_context("ctx", date(2022, 6, 1))["rules"], ["old"])
+        self.assertEqual(self.resolver.resolve_context("ctx", date(2025, 6, 1))["rules"], ["new"])
+        self.assertIsNone(self.resolver.resolve_context("ctx", date(2019, 6, 1)))
+        self.assertIsNone(self.resolver.resolve_context("missing"))
+
+    def test_09_malformed_window_stays_local(self) -> None:
+        """A bad date only fails lookups of its own context."""
+        self._write("executive/context_bindings.json", {"contexts": [
+            {"context_id": "broken", "rules": ["x"], "effective_from": "2024-13-45"},
+            {"context_id": "ctx", "rules": ["ok"], "effective_from": "2020-01-01"},
+        ]})
+        self.assertEqual(self.resolver.resolve_context("ctx", date(2022, 6, 1))["rules"], ["ok"])
+        with self.assertRaises(ValueError):
+            self.resolver.resolve_context("broken", date(2025, 6, 1))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
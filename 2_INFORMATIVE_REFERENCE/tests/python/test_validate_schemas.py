@@ -0,0 +1,87 @@
+"""
+ODGS Schema Validator Tests
+validate_array_against_schema on a conforming and a non-conforming file.
+"""
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+import importlib.util
+from unittest import mock
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+src_path = os.path.join(project_root, "src")
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+HAS_JSONSCHEMA = importlib.util.find_spec("jsonschema") is not None
+if HAS_JSONSCHEMA:  # the module exits on import without it
+    from odgs.system.scripts import validate_schemas
+
+METRIC_SCHEMA = {
+    "type": "object",
+    "required": ["metric_id", "name"],
+    "properties": {"metric_id": {"type": "string"}, "name": {"type": "string"}},
+}
+
+
+@unittest.skipUnless(HAS_JSONSCHEMA, "jsonschema not installed")
+class TestValidateArray(unittest.TestCase):
+    """Same results with and without the fastjsonschema accelerator."""
+
+    def setUp(self) -> None:
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.schema_path = self._write("metric.schema.json", METRIC_SCHEMA)
+
+    def _write(self, name: str, data) -> str:
+        path = os.path.join(self.root, name)
+        with open(path, "w") as f:
+            json.dump(data, f)
+        return path
+
+    def _validate(self, data_path: str, **kwargs):
+        results = []
+        for fast in (validate_schemas.fastjsonschema, None):
+            with mock.patch.object(validate_schemas, "fastjsonschema", fast):
+                # Fresh compiled validators for each setting
+                validate_schemas._load_fast_validator_cached.cache_clear()
+                validate_schemas._load_array_validators_cached.cache_clear()
+                results.append(validate_schemas.validate_array_against_schema(
+                    data_path, self.schema_path, "Metric", **kwargs))
+        self.assertEqual(results[0], results[1])
+        return results[0]
+
+    def test_01_good_file(self) -> None:
+        path = self._write("standard_metrics.json", [
+            {"metric_id": "MRR", "name": "Monthly Recurring Revenue"},
+            {"metric_id": "CHURN", "name": "Churn Rate"},
+        ])
+        self.assertEqual(self._validate(path), (2, 0, []))
+
+    def test_02_bad_file(self) -> None:
+        path = self._write("standard_metrics.json", [
+            {"metric_id": "MRR", "name": "Monthly Recurring Revenue"},
+            {"metric_id": "BROKEN"},
+            {"metric_id": "ODD", "name": 7},
+        ])
+        passed, failed, errors = self._validate(path)
+        self.assertEqual((passed, failed), (1, 2))
+        self.assertEqual(len(errors), 2)
+        self.assertIn("Metric BROKEN: 'name' is a required property", errors[0])
+        self.assertIn("Metric ODD:", errors[1])
+
+        self.assertEqual(self._validate(path, max_errors=1)[:2], (1, 1))
+
+    def test_03_not_an_array(self) -> None:
+        path = self._write("standard_metrics.json", {"metric_id": "MRR"})
+        passed, failed, errors = self._validate(path)
+        self.assertEqual((passed, failed), (0, 1))
+        self.assertIn("Expected array, got dict", errors[0])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)